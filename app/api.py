@@ -8,6 +8,12 @@ from app.router.recommend_router import router as recommend_router
 from app.router.common_router import router as common_router
 from app.router.users_router import router as users_router
 from app.router.favorite_router import router as favorite_router
+from app.router.content_router import router as content_router
+from app.router.map_router import router as map_router
+from app.router.geo_router import router as geo_router
+from app.router.trip_router import router as trip_router
+from app.router.spot_router import router as spot_router
+from app.router.catalog_router import router as catalog_router
 
 api_router = APIRouter()
 
@@ -17,5 +23,11 @@ api_router.include_router(festival_router)
 api_router.include_router(common_router)
 api_router.include_router(users_router)
 api_router.include_router(favorite_router) 
+api_router.include_router(content_router)
+api_router.include_router(map_router)
+api_router.include_router(geo_router)
+api_router.include_router(trip_router)
+api_router.include_router(spot_router)
+api_router.include_router(catalog_router)
 
 api_router.include_router(recommend_router, prefix="/recommend", tags=["Recommend"])
\ No newline at end of file
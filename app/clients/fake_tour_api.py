@@ -0,0 +1,202 @@
+# app/clients/fake_tour_api.py
+
+from __future__ import annotations
+import asyncio
+import datetime
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+# 합성 데이터에 쓰는 값들 (TourAPI 실제 코드 체계를 따름)
+AREA_CODES = ["1", "2", "3", "4", "5", "6", "7", "8", "31", "32", "33", "34", "35", "36", "37", "38", "39"]
+CONTENT_TYPES = ["12", "14", "15", "25", "28", "32", "38", "39"]
+CATEGORIES = [
+    ("A01", "A0101", "A01010100"), ("A01", "A0101", "A01011200"), ("A02", "A0201", "A02010100"),
+    ("A02", "A0202", "A02020600"), ("A02", "A0203", "A02030400"), ("A03", "A0302", "A03021200"),
+    ("A04", "A0401", "A04010200"), ("A05", "A0502", "A05020100"),
+]
+# modifiedtime 기준 시각. i번째 항목은 이보다 i * MODIFIED_STEP_SECONDS초 전에 수정된 것으로 만듭니다.
+BASE_MODIFIED = datetime.datetime(2025, 9, 30, 18, 0, 0)
+MODIFIED_STEP_SECONDS = 97
+SPOT_ID_BASE = 1_000_000
+FESTIVAL_ID_BASE = 3_000_000
+
+QUOTA_EXCEEDED_XML = (
+    "<OpenAPI_ServiceResponse><cmmMsgHeader><errMsg>SERVICE ERROR</errMsg>"
+    "<returnAuthMsg>LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR</returnAuthMsg>"
+    "<returnReasonCode>22</returnReasonCode></cmmMsgHeader></OpenAPI_ServiceResponse>"
+)
+
+
+@dataclass
+class FakeTourAPIConfig:
+    """가짜 TourAPI 설정. 같은 seed와 크기면 항상 같은 카탈로그가 만들어집니다."""
+    spots: int = 50_000
+    festivals: int = 3_000
+    seed: int = 42
+    latency_ms: float = 0.0     # 응답 지연 평균 (ms)
+    jitter_ms: float = 0.0      # 지연 편차 (0 ~ jitter_ms 무작위로 더함)
+    error_rate: float = 0.0     # 이 비율만큼 HTTP 503으로 실패
+    quota: int = 0              # 이 횟수를 넘으면 resultCode 22(호출 한도 초과) 응답. 0이면 무제한
+
+
+def _modified_time(i: int) -> str:
+    return (BASE_MODIFIED - datetime.timedelta(seconds=i * MODIFIED_STEP_SECONDS)).strftime("%Y%m%d%H%M%S")
+
+
+def _coords(rng: random.Random) -> Tuple[str, str]:
+    # 대한민국 본토 대략 범위
+    return f"{rng.uniform(126.1, 129.5):.10f}", f"{rng.uniform(34.3, 38.5):.10f}"
+
+
+def make_spot(seed: int, i: int) -> Dict[str, Any]:
+    """i번째 합성 여행지. 수정일/생성일 모두 i가 작을수록 최신이므로 arrange=C/D 순서와 같습니다."""
+    rng = random.Random(seed * 1_000_003 + i)
+    cat1, cat2, cat3 = rng.choice(CATEGORIES)
+    mapx, mapy = _coords(rng)
+    area = rng.choice(AREA_CODES)
+    return {
+        "contentid": str(SPOT_ID_BASE + i),
+        "contenttypeid": rng.choice(CONTENT_TYPES),
+        "title": f"합성 여행지 {i}",
+        "addr1": f"합성시 {area}구 테스트로 {i % 1000}",
+        "addr2": "",
+        "zipcode": f"{rng.randint(10000, 63999)}",
+        "areacode": area,
+        "sigungucode": str(rng.randint(1, 25)),
+        "cat1": cat1, "cat2": cat2, "cat3": cat3,
+        "tel": "",
+        "firstimage": f"http://tong.visitkorea.or.kr/fake/{SPOT_ID_BASE + i}.jpg" if rng.random() < 0.7 else "",
+        "firstimage2": "",
+        "mapx": mapx, "mapy": mapy,
+        "mlevel": "6",
+        "createdtime": _modified_time(i),
+        "modifiedtime": _modified_time(i),
+    }
+
+
+def make_festival(seed: int, i: int) -> Dict[str, Any]:
+    rng = random.Random(seed * 2_000_003 + i)
+    start = datetime.date(2025, 1, 1) + datetime.timedelta(days=rng.randint(0, 364))
+    end = start + datetime.timedelta(days=rng.randint(0, 20))
+    mapx, mapy = _coords(rng)
+    return {
+        "contentid": str(FESTIVAL_ID_BASE + i),
+        "contenttypeid": "15",
+        "title": f"합성 축제 {i}",
+        "addr1": f"합성시 축제로 {i % 500}",
+        "eventstartdate": start.strftime("%Y%m%d"),
+        "eventenddate": end.strftime("%Y%m%d"),
+        "firstimage": f"http://tong.visitkorea.or.kr/fake/{FESTIVAL_ID_BASE + i}.jpg",
+        "mapx": mapx, "mapy": mapy,
+        "modifiedtime": _modified_time(i),
+    }
+
+
+def make_overview(seed: int, contentid: str) -> Dict[str, Any]:
+    rng = random.Random(seed * 3_000_017 + int(contentid))
+    sentences = [f"합성 콘텐츠 {contentid}의 소개 문장 {n}입니다." for n in range(rng.randint(2, 6))]
+    return {
+        "contentid": contentid,
+        "title": f"합성 콘텐츠 {contentid}",
+        "overview": " ".join(sentences),
+        "homepage": "",
+        "modifiedtime": _modified_time(int(contentid) % 1_000_000),
+    }
+
+
+def _ok(items: List[Dict[str, Any]], page_no: int, num_of_rows: int, total_count: int) -> Dict[str, Any]:
+    return {
+        "response": {
+            "header": {"resultCode": "0000", "resultMsg": "OK"},
+            "body": {
+                # 실제 API처럼 결과가 없으면 items는 빈 문자열
+                "items": {"item": items} if items else "",
+                "numOfRows": num_of_rows,
+                "pageNo": page_no,
+                "totalCount": total_count,
+            },
+        }
+    }
+
+
+def create_fake_tour_api(config: FakeTourAPIConfig) -> FastAPI:
+    """
+    searchFestival2 / areaBasedList2 / detailCommon2를 흉내 내는 ASGI 앱.
+    httpx.ASGITransport로 TourAPIClient에 직접 주입하거나, scripts/run_fake_tour_api.py로 띄워 TOUR_API_SERVICE_URL로 가리킬 수 있습니다.
+    """
+    app = FastAPI(title="Fake TourAPI")
+    rng = random.Random(config.seed)
+    state = {"requests": 0}
+
+    @lru_cache(maxsize=64)
+    def festival_ids(start: str, end: str) -> Tuple[int, ...]:
+        # 기간 조건: 행사 종료일 >= eventStartDate, 행사 시작일 <= eventEndDate
+        ids = []
+        for i in range(config.festivals):
+            item = make_festival(config.seed, i)
+            if item["eventenddate"] >= start and (not end or item["eventstartdate"] <= end):
+                ids.append(i)
+        return tuple(ids)
+
+    @lru_cache(maxsize=1)
+    def spot_attrs() -> Tuple[Tuple[str, str], ...]:
+        # 필터에 쓰는 (지역 코드, 콘텐츠 타입)만 한 번 만들어 둠 (조건마다 전체 항목을 다시 생성하지 않도록)
+        return tuple((spot["areacode"], spot["contenttypeid"]) for spot in (make_spot(config.seed, i) for i in range(config.spots)))
+
+    @lru_cache(maxsize=256)
+    def spot_ids(area: str, content_type: str) -> Tuple[int, ...]:
+        return tuple(
+            i for i, (spot_area, spot_type) in enumerate(spot_attrs())
+            if (not area or spot_area == area) and (not content_type or spot_type == content_type)
+        )
+
+    @app.middleware("http")
+    async def inject_faults(request: Request, call_next):
+        if request.url.path.startswith("/_"):
+            return await call_next(request)
+        state["requests"] += 1
+        if config.latency_ms or config.jitter_ms:
+            await asyncio.sleep((config.latency_ms + rng.uniform(0, config.jitter_ms)) / 1000)
+        if config.quota and state["requests"] > config.quota:
+            return Response(QUOTA_EXCEEDED_XML, media_type="text/xml")
+        if config.error_rate and rng.random() < config.error_rate:
+            return Response("Service Unavailable", status_code=503)
+        return await call_next(request)
+
+    def paging(request: Request) -> Tuple[int, int]:
+        params = request.query_params
+        return max(1, int(params.get("pageNo", 1))), max(1, int(params.get("numOfRows", 10)))
+
+    @app.get("/areaBasedList2")
+    async def area_based_list(request: Request):
+        page_no, num_of_rows = paging(request)
+        area = request.query_params.get("areaCode")
+        content_type = request.query_params.get("contentTypeId")
+        ids = spot_ids(area or "", content_type or "") if (area or content_type) else range(config.spots)
+        window = ids[(page_no - 1) * num_of_rows: page_no * num_of_rows]
+        return JSONResponse(_ok([make_spot(config.seed, i) for i in window], page_no, num_of_rows, len(ids)))
+
+    @app.get("/searchFestival2")
+    async def search_festival(request: Request):
+        page_no, num_of_rows = paging(request)
+        ids = festival_ids(request.query_params.get("eventStartDate", ""), request.query_params.get("eventEndDate", ""))
+        window = ids[(page_no - 1) * num_of_rows: page_no * num_of_rows]
+        return JSONResponse(_ok([make_festival(config.seed, i) for i in window], page_no, num_of_rows, len(ids)))
+
+    @app.get("/detailCommon2")
+    async def detail_common(request: Request):
+        contentid = request.query_params.get("contentId", "")
+        if not contentid.isdigit():
+            return JSONResponse({"response": {"header": {"resultCode": "10", "resultMsg": "INVALID_REQUEST_PARAMETER_ERROR"}}})
+        return JSONResponse(_ok([make_overview(config.seed, contentid)], 1, 1, 1))
+
+    @app.get("/_stats")
+    async def stats():
+        return state
+
+    return app
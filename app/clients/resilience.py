@@ -0,0 +1,186 @@
+# app/clients/resilience.py
+
+from __future__ import annotations
+import asyncio
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+# ====================================================================
+# TourAPI 오류 타입
+# ====================================================================
+
+class TourAPIError(Exception):
+    """TourAPI 호출 실패의 공통 부모 클래스"""
+    def __init__(self, message: str, code: Optional[str] = None):
+        super().__init__(message)
+        self.code = code
+
+
+class TourAPITransientError(TourAPIError):
+    """잠시 후 다시 시도하면 성공할 수 있는 오류 (타임아웃, 연결 끊김, 5xx, 429, 게이트웨이 일시 오류)"""
+    def __init__(self, message: str, code: Optional[str] = None, retry_after: Optional[float] = None):
+        super().__init__(message, code)
+        self.retry_after = retry_after
+
+
+class TourAPIQuotaExceededError(TourAPIError):
+    """data.go.kr 일일 호출 한도 초과 (resultCode 22). 오늘은 다시 시도해도 소용없습니다."""
+
+
+class TourAPIResponseError(TourAPIError):
+    """재시도해도 같은 결과가 나올 오류 (인증키 오류, 잘못된 파라미터, 해석할 수 없는 응답)"""
+
+
+class CircuitOpenError(TourAPIError):
+    """연속 실패로 회로가 열려 요청을 보내지 않고 바로 실패시킨 경우. retry_after초 뒤에는 다시 요청할 수 있습니다."""
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# data.go.kr 공통 에러 코드 중 일시적인 것 (01 어플리케이션 에러, 02 DB 에러, 04 HTTP 에러, 05 서비스 연결 실패)
+TRANSIENT_RESULT_CODES = {"01", "02", "04", "05"}
+QUOTA_RESULT_CODES = {"22"}
+
+
+def error_for_result_code(code: str, message: Optional[str]) -> TourAPIError:
+    text = f"TourAPI 오류 (resultCode={code}): {message or ''}".strip()
+    if code in QUOTA_RESULT_CODES:
+        return TourAPIQuotaExceededError(text, code)
+    if code in TRANSIENT_RESULT_CODES:
+        return TourAPITransientError(text, code)
+    return TourAPIResponseError(text, code)
+
+
+# ====================================================================
+# 토큰 버킷 / 백오프 / 서킷 브레이커
+# ====================================================================
+
+class TokenBucket:
+    """
+    초당 rate개, 최대 capacity개까지 쌓이는 토큰 버킷.
+    토큰이 모자라면 음수로 '예약'한 뒤 그만큼 기다리므로, 이벤트 루프 안에서는 락 없이도 순서대로 배분됩니다.
+    rate <= 0이면 제한하지 않습니다.
+    """
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> float:
+        """토큰 하나를 받을 때까지 기다리고, 기다린 시간(초)을 반환합니다."""
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        wait = -self._tokens / self.rate
+        await asyncio.sleep(wait)
+        return wait
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """지수 백오프 + full jitter: 0 ~ min(cap, base * 2^attempt) 사이의 무작위 대기 시간"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    연속 failure_threshold번 실패하면 회로를 열어 reset_timeout초 동안 요청을 바로 거절합니다.
+    시간이 지나면 한 번만 시험 요청(half-open)을 보내고, 성공하면 닫고 실패하면 다시 엽니다.
+    거절할 때 던지는 CircuitOpenError의 retry_after는 회로가 열린 동안은 남은 시간,
+    시험 요청이 진행 중이면 TRIAL_POLL_INTERVAL입니다.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    TRIAL_POLL_INTERVAL = 0.5 # 시험 요청 결과를 다시 확인할 간격 (초)
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def before_call(self) -> None:
+        if self.state == self.OPEN:
+            remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+            if remaining > 0:
+                raise CircuitOpenError(f"TourAPI 회로가 열려 있습니다 ({remaining:.0f}초 후 재시도)", retry_after=remaining)
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                raise CircuitOpenError("TourAPI 회로 시험 요청 진행 중", retry_after=self.TRIAL_POLL_INTERVAL)
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self._failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """실패를 기록하고, 이번 실패로 회로가 열렸으면 True를 반환합니다."""
+        self._failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            return self.trip()
+        return False
+
+    def trip(self) -> bool:
+        """회로를 즉시 엽니다 (호출 한도 초과처럼 기다려도 소용없는 경우)."""
+        was_open = self.state == self.OPEN
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        return not was_open
+
+
+# ====================================================================
+# 지표 / 동시성 자동 조정
+# ====================================================================
+
+@dataclass
+class ResilienceMetrics:
+    requests: int = 0            # 실제로 보낸 HTTP 요청 수 (재시도 포함)
+    successes: int = 0
+    retries: int = 0
+    failures: int = 0            # 재시도 후에도 실패한 호출 수
+    throttled: int = 0           # 토큰 버킷 때문에 기다린 요청 수
+    throttle_wait: float = 0.0   # 기다린 시간 합 (초)
+    circuit_opens: int = 0
+    circuit_rejections: int = 0
+    latency_total: float = 0.0   # 성공한 요청의 응답 시간 합 (초)
+    cache_hits: int = 0          # 디스크 캐시(record/replay)로 대신한 호출 수
+    cache_misses: int = 0
+
+    @property
+    def avg_latency(self) -> float:
+        return self.latency_total / self.successes if self.successes else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"요청 {self.requests}회 (성공 {self.successes}, 재시도 {self.retries}, 실패 {self.failures}) | "
+            f"속도 제한 대기 {self.throttled}회/{self.throttle_wait:.1f}초 | "
+            f"회로 열림 {self.circuit_opens}회, 거절 {self.circuit_rejections}회 | "
+            f"평균 응답 {self.avg_latency * 1000:.0f}ms | "
+            f"캐시 적중 {self.cache_hits}회, 미적중 {self.cache_misses}회"
+        )
+
+
+def recommended_concurrency(rate_per_sec: float, avg_latency: float, max_concurrency: int) -> int:
+    """
+    호출 한도(초당 rate_per_sec)를 꽉 채우는 데 필요한 동시 요청 수 (리틀의 법칙: 동시 요청 = 처리율 × 응답 시간).
+    이보다 많이 띄우면 토큰 버킷에서 기다리기만 하므로 연결만 낭비됩니다.
+    """
+    if rate_per_sec <= 0 or avg_latency <= 0:
+        return max_concurrency
+    return max(1, min(max_concurrency, math.ceil(rate_per_sec * avg_latency) + 1))
@@ -0,0 +1,105 @@
+# app/clients/response_cache.py
+
+from __future__ import annotations
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+from app.clients.resilience import TourAPIResponseError
+
+# 캐시 모드
+CACHE_OFF = "off"
+CACHE_RECORD = "record"   # 유효 기간 안의 캐시가 있으면 사용, 없으면 실제로 호출하고 저장
+CACHE_REPLAY = "replay"   # 캐시만 사용 (네트워크 호출 없음, 유효 기간 무시). 없으면 오류
+CACHE_MODES = (CACHE_OFF, CACHE_RECORD, CACHE_REPLAY)
+
+# 캐시 키에서 제외할 파라미터 (인증키는 응답 내용과 무관하고 파일에 남기면 안 됨)
+EXCLUDED_PARAMS = {"serviceKey"}
+
+
+class TourAPICacheMissError(TourAPIResponseError):
+    """replay 모드에서 녹화된 응답이 없는 요청"""
+
+
+def cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """엔드포인트 + 정규화한 파라미터(이름순, 문자열 값)의 SHA-256"""
+    normalized = {
+        str(k): str(v) for k, v in params.items()
+        if k not in EXCLUDED_PARAMS and v is not None
+    }
+    raw = json.dumps([endpoint, normalized], sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    TourAPI 응답 본문을 내용 주소(요청 해시) 기반으로 디스크에 gzip 저장합니다.
+    파일 위치: {directory}/{key[:2]}/{key}.json.gz
+    파일에는 엔드포인트, 파라미터(serviceKey 제외), 저장 시각, 응답 본문이 들어갑니다.
+
+    - record: 동기화를 다시 돌려도 ttl 안에는 같은 페이지를 다시 받지 않고, 새로 받은 응답은 저장합니다.
+    - replay: 녹화된 응답만으로 동기화를 재현합니다 (API 키/네트워크 없이 벤치마크 가능).
+    """
+    def __init__(self, directory: str, mode: str = CACHE_OFF, ttl: float = 86400.0):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"알 수 없는 캐시 모드: {mode} (가능: {', '.join(CACHE_MODES)})")
+        self.directory = directory
+        self.mode = mode
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != CACHE_OFF
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json.gz")
+
+    def get(self, endpoint: str, params: Dict[str, Any]) -> Optional[bytes]:
+        """
+        캐시된 응답 본문을 반환합니다. record 모드에서는 유효 기간이 지난 항목을 없는 것으로 봅니다.
+        replay 모드에서 없으면 TourAPICacheMissError를 발생시킵니다.
+        """
+        if not self.enabled:
+            return None
+        path = self._path(cache_key(endpoint, params))
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, OSError, ValueError):
+            entry = None
+
+        if entry is not None and (self.mode == CACHE_REPLAY or time.time() - entry["fetched_at"] <= self.ttl):
+            return entry["body"].encode("utf-8")
+        if self.mode == CACHE_REPLAY:
+            raise TourAPICacheMissError(f"녹화된 응답이 없습니다: {endpoint} {self._describe(params)}")
+        return None
+
+    def put(self, endpoint: str, params: Dict[str, Any], body: bytes) -> None:
+        """record 모드에서 성공한 응답 본문을 저장합니다 (임시 파일에 쓴 뒤 교체)."""
+        if self.mode != CACHE_RECORD:
+            return
+        path = self._path(cache_key(endpoint, params))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {
+            "endpoint": endpoint,
+            "params": {k: v for k, v in params.items() if k not in EXCLUDED_PARAMS},
+            "fetched_at": time.time(),
+            "body": body.decode("utf-8"),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _describe(params: Dict[str, Any]) -> str:
+        return ", ".join(f"{k}={v}" for k, v in sorted(params.items()) if k not in EXCLUDED_PARAMS)
@@ -1,7 +1,15 @@
-import requests
+import re
+import time
+import asyncio
 import httpx
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from app.core.config import get_settings
+from app.clients.resilience import (
+    TokenBucket, CircuitBreaker, ResilienceMetrics, backoff_delay, recommended_concurrency,
+    error_for_result_code, TourAPIError, TourAPITransientError, TourAPIQuotaExceededError,
+    TourAPIResponseError, CircuitOpenError,
+)
+from app.clients.response_cache import ResponseCache, CACHE_RECORD
 
 # 설정 파일에서 TourAPI 관련 설정을 가져옵니다.
 settings = get_settings()
@@ -9,20 +17,82 @@ settings = get_settings()
 class TourAPIClient:
     """
     한국관광공사 TourAPI와의 통신을 담당하는 클라이언트 클래스
-    """
-    BASE_URL = "http://apis.data.go.kr/B551011/KorService2"
 
-    def __init__(self):
+    요청마다 새 연결을 여는 대신 httpx.AsyncClient 하나(커넥션 풀)를 만들어 keep-alive로 재사용합니다.
+    - 스크립트: `async with TourAPIClient() as client:` 블록이 끝나면 풀을 닫습니다.
+    - API 서버: 전역 tour_api_client를 쓰고, 앱 종료(shutdown) 시 aclose()로 닫습니다.
+    풀은 첫 요청 때 만들어지므로, asyncio.run()을 여러 번 호출하는 경우에도 aclose() 후 다시 사용할 수 있습니다.
+
+    모든 요청은 토큰 버킷(초당 호출 한도) → 서킷 브레이커 → 재시도(지수 백오프 + jitter)를 거치며,
+    실패는 빈 결과 대신 TourAPIError 하위 타입으로 올라갑니다. 지표는 self.metrics에 쌓입니다.
+    cache(ResponseCache)가 켜져 있으면 그보다 먼저 디스크에 녹화된 응답을 확인합니다 (record/replay).
+    """
+    def __init__(
+        self,
+        limits: Optional[httpx.Limits] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        cache: Optional[ResponseCache] = None,
+        base_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         self.service_key = settings.TOUR_API_KEY # .env 파일에 저장된 키를 가져옵니다.
         if not self.service_key:
             raise ValueError("TourAPI 서비스 키가 설정되지 않았습니다.")
+        self.limits = limits or httpx.Limits(
+            max_connections=settings.TOUR_API_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.TOUR_API_MAX_KEEPALIVE,
+            keepalive_expiry=settings.TOUR_API_KEEPALIVE_EXPIRY,
+        )
+        self.timeout = timeout or httpx.Timeout(
+            settings.TOUR_API_TIMEOUT, connect=settings.TOUR_API_CONNECT_TIMEOUT
+        )
+        # 가짜 서버(app/clients/fake_tour_api.py)로 바꿔 끼울 수 있도록 주소/전송 계층을 주입받음
+        self.base_url = (base_url or settings.TOUR_API_SERVICE_URL).rstrip("/")
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+        self.rate_limiter = TokenBucket(settings.TOUR_API_RATE_PER_SEC, settings.TOUR_API_BURST)
+        self.breaker = CircuitBreaker(settings.TOUR_API_CIRCUIT_FAILURES, settings.TOUR_API_CIRCUIT_RESET)
+        self.max_retries = settings.TOUR_API_MAX_RETRIES
+        self.metrics = ResilienceMetrics()
+        self.cache = cache or ResponseCache(
+            settings.TOUR_API_CACHE_DIR, settings.TOUR_API_CACHE_MODE, settings.TOUR_API_CACHE_TTL
+        )
+
+    def recommended_concurrency(self) -> int:
+        """지금까지의 평균 응답 시간과 호출 한도로 계산한 적정 동시 요청 수"""
+        return recommended_concurrency(
+            self.rate_limiter.rate, self.metrics.avg_latency, self.limits.max_connections or settings.TOUR_API_MAX_CONNECTIONS
+        )
+
+    # ====================================================================
+    # 커넥션 풀 수명 관리
+    # ====================================================================
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(limits=self.limits, timeout=self.timeout, transport=self.transport)
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    async def __aenter__(self) -> "TourAPIClient":
+        self.client # 풀을 미리 만들어 둠
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
 
     async def _send_request(self, endpoint: str, params: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int]:
         """
-        API 요청을 보내고 결과를 파싱하는 내부 메소드
+        API 요청을 보내고 (items, totalCount)를 반환하는 내부 메소드
+        일시적인 오류는 재시도하고, 끝내 실패하면 TourAPIError 하위 타입을 발생시킵니다.
         """
-        url = f"{self.BASE_URL}/{endpoint}"
-        
+        url = f"{self.base_url}/{endpoint}"
+
         # 모든 요청에 공통으로 필요한 파라미터를 추가합니다.
         common_params = {
             'serviceKey': self.service_key,
@@ -32,31 +102,117 @@ class TourAPIClient:
         }
         params.update(common_params)
 
+        metrics = self.metrics
+        # 디스크 캐시에 녹화된 응답이 있으면 호출 한도/회로와 무관하게 바로 사용
+        # (파일 읽기·gzip 해제·JSON 해석은 이벤트 루프를 막지 않도록 스레드에서 실행)
+        try:
+            cached = await asyncio.to_thread(self.cache.get, endpoint, params) if self.cache.enabled else None
+        except TourAPIError:
+            metrics.cache_misses += 1
+            metrics.failures += 1
+            raise
+        if cached is not None:
+            metrics.cache_hits += 1
+            return self._parse_response(httpx.Response(200, content=cached))
+        if self.cache.enabled:
+            metrics.cache_misses += 1
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.breaker.before_call()
+            except CircuitOpenError:
+                metrics.circuit_rejections += 1
+                metrics.failures += 1
+                raise
+
+            waited = await self.rate_limiter.acquire()
+            if waited > 0:
+                metrics.throttled += 1
+                metrics.throttle_wait += waited
+
+            metrics.requests += 1
+            started = time.perf_counter()
+            try:
+                response = await self.client.get(url, params=params)
+                result = self._parse_response(response)
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                error: TourAPIError = TourAPITransientError(f"API 요청 중 오류 발생: {e!r}")
+            except TourAPITransientError as e:
+                error = e
+            except TourAPIQuotaExceededError:
+                # 한도 초과는 기다려도 풀리지 않으므로 회로를 바로 열어 나머지 요청도 보내지 않음
+                if self.breaker.trip():
+                    metrics.circuit_opens += 1
+                metrics.failures += 1
+                raise
+            except TourAPIError:
+                self.breaker.record_success() # 상대 서버는 정상 응답 (요청 자체의 문제)
+                metrics.failures += 1
+                raise
+            else:
+                self.breaker.record_success()
+                metrics.successes += 1
+                metrics.latency_total += time.perf_counter() - started
+                if self.cache.mode == CACHE_RECORD:
+                    await asyncio.to_thread(self.cache.put, endpoint, params, response.content)
+                return result
+
+            if self.breaker.record_failure():
+                metrics.circuit_opens += 1
+            if attempt >= self.max_retries:
+                metrics.failures += 1
+                raise error
+
+            delay = backoff_delay(attempt, settings.TOUR_API_BACKOFF_BASE, settings.TOUR_API_BACKOFF_MAX)
+            if error.retry_after:
+                delay = max(delay, error.retry_after)
+            metrics.retries += 1
+            print(f"⚠️ TourAPI {endpoint} 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후): {error}")
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> Tuple[List[Dict[str, Any]], int]:
+        """HTTP 응답을 (items, totalCount)로 해석합니다. 오류 응답은 종류에 맞는 TourAPIError로 바꿉니다."""
+        if response.status_code == 429 or response.status_code >= 500:
+            retry_after = response.headers.get("Retry-After")
+            raise TourAPITransientError(
+                f"HTTP {response.status_code}",
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+            )
+        if response.status_code >= 400:
+            raise TourAPIResponseError(f"HTTP {response.status_code}")
+
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(url, params=params)
-            
             data = response.json()
-            response_body = data.get('response', {}).get('body', {})
-            items = response_body.get('items', {}).get('item', [])
-            total_count = response_body.get('totalCount', 0) # totalCount를 가져옵니다.
-            
-            # items가 딕셔너리(단일 항목)인 경우 리스트로 변환합니다.
-            processed_items = items if isinstance(items, list) else [items]
-            
-            # 성공적으로 두 개의 값을 튜플로 반환합니다.
-            return processed_items, total_count
-        
-        except requests.exceptions.RequestException as e:
-            print(f"API 요청 중 오류 발생: {e}")
-            return []
-        except Exception as e:
-            print(f"데이터 처리 중 오류 발생: {e}")
-            return []
-
-    async def get_festivals(self, start_date: str, end_date: str, num_of_rows: int = 100, page_no: int = 1) -> List[Dict[str, Any]]:
+        except ValueError:
+            # data.go.kr 게이트웨이 오류(인증키, 호출 한도 등)는 _type=json이어도 XML로 내려옵니다.
+            match = re.search(r"<returnReasonCode>(\d+)</returnReasonCode>", response.text)
+            if match:
+                message = re.search(r"<returnAuthMsg>([^<]*)</returnAuthMsg>", response.text)
+                raise error_for_result_code(match.group(1), message.group(1) if message else None)
+            raise TourAPIResponseError(f"해석할 수 없는 응답: {response.text[:200]}")
+
+        header = data.get('response', {}).get('header', {})
+        result_code = str(header.get('resultCode', '0000'))
+        if result_code not in ('0000', '00', '0'):
+            raise error_for_result_code(result_code, header.get('resultMsg'))
+
+        response_body = data.get('response', {}).get('body', {})
+        # 결과가 없으면 items가 빈 문자열("")로 내려옵니다.
+        items = response_body.get('items') or {}
+        items = items.get('item', []) if isinstance(items, dict) else []
+        total_count = response_body.get('totalCount', 0) # totalCount를 가져옵니다.
+
+        # items가 딕셔너리(단일 항목)인 경우 리스트로 변환합니다.
+        processed_items = items if isinstance(items, list) else [items]
+
+        # 성공적으로 두 개의 값을 튜플로 반환합니다.
+        return processed_items, int(total_count or 0)
+
+    async def get_festivals(self, start_date: str, end_date: str, num_of_rows: int = 100, page_no: int = 1, arrange: str = 'C') -> Tuple[List[Dict[str, Any]], int]:
         """
         지정된 시작일 이후의 축제 정보를 가져옵니다.
+        arrange: C=수정일순(최신 수정 먼저), Q=수정일순(대표 이미지가 있는 항목만)
         """
         endpoint = "searchFestival2"
         params = {
@@ -64,97 +220,76 @@ class TourAPIClient:
             'eventEndDate': end_date,
             'numOfRows': num_of_rows,
             'pageNo': page_no,
-            'arrange': 'C', #수정일순 저장
+            'arrange': arrange, #수정일순 저장
         }
+        if not params.get('eventEndDate'):
+            del params['eventEndDate']
         return await self._send_request(endpoint, params)
-    
-    # app/clients/tour_api_client.py 파일 내
-
-    # tour_api_client.py 파일 내 get_recommends 함수 수정
 
-    async def get_recommends(self, area_code: str = None, content_type_id: str = None, page_no: int = 1, num_of_rows: int = 100) -> Tuple[List[Dict[str, Any]], int]:
+    async def get_recommends(self, area_code: str = None, content_type_id: str = None, page_no: int = 1, num_of_rows: int = 100, arrange: str = 'D') -> Tuple[List[Dict[str, Any]], int]:
         """
         TourAPI에서 지역 기반 관광 정보(areaBasedList2)를 비동기로 가져옵니다.
+        arrange: D=생성일순, C=수정일순(증분 동기화용)
         """
-        
+
         # 지역 기반 관광정보 조회 API 엔드포인트
-        endpoint = "areaBasedList2" 
-        
+        endpoint = "areaBasedList2"
+
         # API 요청에 필요한 파라미터 정의
         params = {
             'pageNo': page_no,
             'numOfRows': num_of_rows,
-            'arrange': 'D',       # D=생성일순으로 정렬
+            'arrange': arrange,   # 기본값 D=생성일순으로 정렬
             'contentTypeId': content_type_id, # 👈 이 매개변수를 사용하도록 추가/수정
-            'areaCode': area_code, 
+            'areaCode': area_code,
         }
-        
+
         # 🌟 핵심: None인 파라미터는 요청에서 제거하여 검색 조건을 완화합니다.
         # 이렇게 해야 areaCode와 contentTypeId에 None을 넘겨도 API가 전국/전체 타입을 검색합니다.
         if params.get('areaCode') is None:
             del params['areaCode']
-        
+
         if params.get('contentTypeId') is None:
             del params['contentTypeId']
-            
+
         # _send_request 함수가 (raw_items, api_total_count) 튜플을 반환하도록 처리
         return await self._send_request(endpoint, params)
-        
-    # TourAPIClient 클래스의 정의 부분이라고 가정
-
 
-    def get_area_based_list(self, area_code: str, content_type_id: str, num_of_rows: int = 100, page_no: int = 1) -> List[Dict[str, Any]]:
+    async def get_detail_common(self, content_id: str) -> Tuple[List[Dict[str, Any]], int]:
         """
-        특정 지역 코드(area_code)와 콘텐츠 타입 ID를 기준으로 데이터를 가져옵니다.
+        공통 상세 정보(detailCommon2)를 가져옵니다. 목록 API에 없는 개요(overview), 홈페이지 등이 들어 있습니다.
+        KorService2에서는 contentId만 넘기면 모든 공통 항목이 내려옵니다.
         """
-        # API 엔드포인트 변경: /KorService1 대신 /KorService를 사용했을 수 있으므로 확인 필요
-        # 일반적으로 목록 조회는 /areaBasedList1
-        endpoint = "areaBasedList2" 
+        endpoint = "detailCommon2"
         params = {
-            'areaCode': area_code,
-            'contentTypeId': content_type_id,
-            'numOfRows': num_of_rows,
-            'pageNo': page_no,
+            'contentId': content_id,
         }
-        
-        # _send_request는 TourAPIClient 내부에 정의된 API 호출 및 파싱 함수라고 가정합니다.
-        # 기존 코드 스니펫에서 _send_request가 List[Dict[str, Any]]를 반환한다고 가정
-        return self._send_request(endpoint, params)
-    
-
-    
-    def get_total_count(self, area_code: str, content_type_id: str) -> int:
+        return await self._send_request(endpoint, params)
+
+    async def get_area_based_list(self, area_code: str, content_type_id: str, num_of_rows: int = 100, page_no: int = 1) -> List[Dict[str, Any]]:
+        """
+        특정 지역 코드(area_code)와 콘텐츠 타입 ID를 기준으로 데이터를 가져옵니다.
+        빈 문자열/None인 조건은 전국/전체 타입으로 검색합니다.
+        """
+        items, _ = await self.get_recommends(
+            area_code=area_code or None,
+            content_type_id=content_type_id or None,
+            page_no=page_no,
+            num_of_rows=num_of_rows,
+        )
+        return items
+
+    async def get_total_count(self, area_code: str, content_type_id: str) -> int:
         """
         전체 개수를 파악하기 위해 1개의 데이터만 요청합니다.
         """
-        endpoint = "areaBasedList2" 
-        params = {
-            'areaCode': area_code,
-            'contentTypeId': content_type_id,
-            'numOfRows': 1,  # 1개만 요청하여 totalCount 확인
-            'pageNo': 1,
-        }
-        
-        # _send_request 대신, totalCount를 직접 파싱하는 새로운 요청 로직이 필요합니다.
-        # 여기서는 편의상 전체 응답을 받아 totalCount를 파싱하는 임시 코드를 사용합니다.
-        url = f"{self.BASE_URL}/{endpoint}"
-        common_params = {
-            # ... (self._send_request 내부의 common_params와 동일하게 설정)
-        }
-        params.update(common_params)
-        
-        try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status() 
-            data = response.json()
-            
-            # totalCount 추출 로직 (응답 구조에 따라 수정 필요)
-            total_count = data.get('response', {}).get('body', {}).get('totalCount', 0)
-            return int(total_count)
-            
-        except Exception as e:
-            print(f"TotalCount 요청 중 오류 발생: {e}")
-            return 0
+        _, total_count = await self.get_recommends(
+            area_code=area_code or None,
+            content_type_id=content_type_id or None,
+            page_no=1,
+            num_of_rows=1,  # 1개만 요청하여 totalCount 확인
+        )
+        return total_count
 
 # 다른 파일에서 쉽게 가져다 쓸 수 있도록 인스턴스를 만들어 둡니다.
 tour_api_client = TourAPIClient()
@@ -0,0 +1,157 @@
+# app/core/cache.py
+
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+_MISSING = object()
+
+
+class _Flight:
+    """같은 키에 대해 진행 중인 로딩 1건 (single-flight)"""
+    __slots__ = ("event", "value", "error", "version", "epoch")
+
+    def __init__(self, version: Any, epoch: int):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.version = version
+        self.epoch = epoch
+
+
+class ReadThroughCache:
+    """
+    크기 제한 LRU + 버전 기반 무효화 + single-flight를 지원하는 read-through 캐시.
+
+    - get_or_load(key, loader): 캐시에 없으면 loader()를 호출해 값을 채웁니다.
+    - 같은 키의 동시 미스는 하나의 loader 호출로 합쳐지고, 나머지 요청은 결과를 기다립니다.
+    - version_fn이 반환하는 값이 바뀌면 전체 항목을 비웁니다 (동기화 스크립트 실행 후).
+    - invalidate / invalidate_selected로 변경된 항목만 골라 비울 수도 있습니다 (변경 로그 구독).
+    - ttl(초)을 주면 그보다 오래된 항목은 다시 읽습니다 (무효화를 놓친 경우의 안전장치).
+    """
+    def __init__(
+        self,
+        name: str,
+        max_size: int = 1024,
+        version_fn: Optional[Callable[[], Any]] = None,
+        ttl: Optional[float] = None,
+    ):
+        self.name = name
+        self.max_size = max_size
+        self.version_fn = version_fn
+        self.ttl = ttl
+
+        # key → (값, 만료 시각 또는 None)
+        self._data: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._inflight: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self._version: Any = None
+        # 무효화가 일어날 때마다 증가. 그 전에 시작된 로딩 결과는 저장하지 않습니다.
+        self._epoch = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def _sync_version(self) -> Any:
+        if self.version_fn is None:
+            return self._version
+        version = self.version_fn()
+        with self._lock:
+            if version != self._version:
+                self._data.clear()
+                self._version = version
+        return version
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        version = self._sync_version()
+
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                value, expires_at = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+
+            self.misses += 1
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight(version, self._epoch)
+                self._inflight[key] = flight
+
+        # 다른 요청이 이미 같은 키를 로딩 중이면 그 결과를 기다립니다.
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = loader()
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.event.set()
+            raise
+
+        with self._lock:
+            # 로딩 중 버전이 바뀌었거나 무효화가 있었다면 오래된 값일 수 있으므로 저장하지 않습니다.
+            if flight.version == self._version and flight.epoch == self._epoch:
+                expires_at = time.monotonic() + self.ttl if self.ttl else None
+                self._data[key] = (value, expires_at)
+                self._data.move_to_end(key)
+                while len(self._data) > self.max_size:
+                    self._data.popitem(last=False)
+            self._inflight.pop(key, None)
+
+        flight.value = value
+        flight.event.set()
+        return value
+
+    def invalidate(self, key: Hashable) -> bool:
+        """key 항목을 비웁니다. 캐시에 있었으면 True."""
+        with self._lock:
+            self._epoch += 1
+            return self._data.pop(key, _MISSING) is not _MISSING
+
+    def invalidate_selected(self, select: Callable[[List[Tuple[Hashable, Any]]], Iterable[Hashable]]) -> int:
+        """
+        select([(key, value), ...])가 고른 키의 항목을 비우고, 비운 개수를 반환합니다.
+        항목 목록만 잠금 안에서 복사하고, 고르는 계산(거리 계산 등)은 잠금 밖에서 하므로 그동안 조회가 막히지 않습니다.
+        복사 시점에 epoch를 올리므로, 그 전에 시작된 로딩 결과는 저장되지 않습니다.
+        """
+        with self._lock:
+            items = [(key, value) for key, (value, _) in self._data.items()]
+            self._epoch += 1
+
+        keys = list(select(items)) if items else []
+
+        removed = 0
+        with self._lock:
+            for key in keys:
+                if self._data.pop(key, _MISSING) is not _MISSING:
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._epoch += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "version": self._version,
+            }
@@ -37,6 +37,58 @@ class Settings(BaseSettings):
     SERVER_ROOT_URL: str = "http://127.0.0.1:8000"
     # ▲▲▲ (이전 수정사항) 서버 루트 URL - 그대로 유지 ▲▲▲
 
+    # TourAPI HTTP 클라이언트 (커넥션 풀) 설정
+    TOUR_API_SERVICE_URL: str = "http://apis.data.go.kr/B551011/KorService2" # 벤치마크 시 가짜 서버 주소로 교체
+    TOUR_API_TIMEOUT: float = 10.0 # 읽기/쓰기/풀 대기 타임아웃 (초)
+    TOUR_API_CONNECT_TIMEOUT: float = 5.0
+    TOUR_API_MAX_CONNECTIONS: int = 20
+    TOUR_API_MAX_KEEPALIVE: int = 10
+    TOUR_API_KEEPALIVE_EXPIRY: float = 30.0 # 유휴 연결을 유지할 시간 (초)
+    TOUR_API_RATE_PER_SEC: float = 10.0 # 초당 호출 한도 (토큰 버킷, 0이면 제한 없음)
+    TOUR_API_BURST: int = 10 # 한꺼번에 보낼 수 있는 최대 요청 수
+    TOUR_API_MAX_RETRIES: int = 3 # 일시적 오류(타임아웃, 5xx, 429) 재시도 횟수
+    TOUR_API_BACKOFF_BASE: float = 0.5 # 재시도 대기 시간 = 0 ~ min(MAX, BASE * 2^n) 무작위
+    TOUR_API_BACKOFF_MAX: float = 10.0
+    TOUR_API_CIRCUIT_FAILURES: int = 5 # 연속 실패가 이만큼 쌓이면 회로를 열어 요청 중단
+    TOUR_API_CIRCUIT_RESET: float = 30.0 # 회로가 열린 뒤 시험 요청을 보내기까지 기다릴 시간 (초)
+    TOUR_API_CACHE_MODE: str = "off" # 응답 디스크 캐시: off / record(호출 후 저장, TTL 안에는 재사용) / replay(저장된 응답만 사용)
+    TOUR_API_CACHE_DIR: str = "data/tourapi_cache"
+    TOUR_API_CACHE_TTL: float = 86400.0 # record 모드에서 저장된 응답을 재사용할 기간 (초)
+
+    # 비동기 챗봇 작업 설정
+    CHATBOT_JOB_WORKERS: int = 4
+    CHATBOT_JOB_MAX_QUEUE: int = 1000
+    CHATBOT_JOB_BACKEND: str = "memory" # "memory" 또는 "db" (chatbot_jobs 테이블)
+    CHATBOT_JOB_WEBHOOK_TIMEOUT: float = 5.0
+    CHATBOT_JOB_WEBHOOK_ALLOWED_HOSTS: str = "" # callback_url로 허용할 호스트 (쉼표 구분, 비어 있으면 웹훅 사용 안 함)
+
+    # 여행지 조회 캐시 설정
+    SPOT_CACHE_MAX_SIZE: int = 2048
+    SPOT_CACHE_TTL: float = 600.0 # 변경 로그 무효화를 놓쳤을 때를 대비한 최대 보관 시간 (초)
+    CATALOG_VERSION_CHECK_INTERVAL: float = 30.0 # 카탈로그 버전 확인 주기 (초). 버전이 이 시간 동안 그대로일 때 스냅샷을 다시 만듦
+    CATALOG_REBUILD_MAX_DELAY: float = 600.0 # 동기화가 계속 버전을 올려도 이 시간이 지나면 스냅샷을 한 번 다시 만듦 (초)
+    POPULARITY_REFRESH_INTERVAL: float = 300.0 # 찜 개수(인기도) 재집계 주기 (초)
+    CATALOG_CHANGE_POLL_INTERVAL: float = 5.0 # 카탈로그 변경 로그 확인 주기 (초)
+    CATALOG_CHANGE_FLUSH_THRESHOLD: int = 2000 # 한 번에 이보다 많이 바뀌면 항목별 무효화 대신 캐시 전체를 비움
+    CATALOG_CHANGE_SETTLE_SECONDS: float = 120.0 # 기록 후 이 시간이 지난 변경만 확정된 버전으로 취급 (가장 긴 동기화 트랜잭션보다 길게)
+    CATALOG_CHANGE_RETENTION_DAYS: int = 14 # 변경 로그 보관 기간. 더 오래된 버전의 앱은 스냅샷을 다시 받음 (410)
+    SPOT_FESTIVAL_RADIUS_KM: float = 10.0 # 여행지 ↔ 축제 근접 조인 반경 (km)
+    FESTIVAL_ARCHIVE_RETENTION_DAYS: int = 30 # 종료 후 이 기간이 지난 축제는 festivals_archive로 이동
+    SYNC_WATERMARK_OVERLAP_MINUTES: int = 60 # 증분 동기화 시 기준점보다 이만큼 앞에서부터 다시 확인
+    SYNC_FETCH_CONCURRENCY: int = 0 # 동기화 시 동시에 요청할 TourAPI 페이지 수 (0이면 호출 한도와 응답 시간에 맞춰 자동)
+    SYNC_QUEUE_SIZE: int = 8 # 수집 → 저장 사이 대기열 크기(페이지). 가득 차면 수집이 기다림
+    SYNC_WRITE_BATCH_PAGES: int = 5 # 저장 단계가 한 트랜잭션으로 묶는 최대 페이지 수
+    ENRICH_OVERVIEW_MAX_AGE_DAYS: int = 30 # 이 기간이 지난 여행지 개요는 다시 받음 (0이면 여행지가 수정됐을 때만)
+    CHATBOT_OVERVIEW_MAX_CHARS: int = 400 # 챗봇 추천 컨텍스트에 넣을 여행지 개요 최대 길이 (토큰 절약)
+
+    # 오프라인 배치 결과물 경로
+    SIMILAR_SPOTS_PATH: str = "data/similar_spots.npz" # scripts/build_similar_spots.py 결과
+    CATALOG_SNAPSHOT_DIR: str = "data/catalog" # scripts/export_catalog_snapshot.py 결과 (gzip NDJSON)
+
+    # 개인화 추천 (scripts/build_user_recommendations.py)
+    PERSONAL_RECOMMEND_TOP_N: int = 50 # 사용자별로 미리 계산해 둘 추천 여행지 수
+    PERSONAL_ACTIVE_DAYS: int = 30 # 최근 N일 안에 찜을 변경한 사용자만 다시 계산
+
     model_config = SettingsConfigDict(env_file=".env", extra='ignore')
 
 @lru_cache
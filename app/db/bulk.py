@@ -0,0 +1,102 @@
+# BE/app/db/bulk.py
+
+from __future__ import annotations
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+# executemany 한 번에 넘길 최대 행 수 (드라이버가 만드는 multi-row INSERT 크기 제한)
+DEFAULT_CHUNK_SIZE = 500
+
+
+def _dedupe(rows: Sequence[Dict[str, Any]], key: str) -> List[Dict[str, Any]]:
+    """같은 키가 한 문장에 두 번 들어가지 않도록 마지막 행만 남깁니다."""
+    by_key: Dict[Any, Dict[str, Any]] = {}
+    for row in rows:
+        by_key[row[key]] = row
+    return list(by_key.values())
+
+
+def _build_statement(dialect: str, table, key: str, update_columns: List[str]):
+    """
+    VALUES 없이 upsert 문장만 만들고, 행은 executemany 파라미터로 넘깁니다.
+    문장 컴파일이 한 번으로 캐시되고, 드라이버(pymysql 등)가 여러 행을 하나의 multi-row INSERT로 묶어 보냅니다.
+    """
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+        stmt = insert(table)
+        return stmt.on_duplicate_key_update({c: stmt.inserted[c] for c in update_columns})
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(table)
+        return stmt.on_conflict_do_update(index_elements=[key], set_={c: stmt.excluded[c] for c in update_columns})
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+        stmt = insert(table)
+        return stmt.on_conflict_do_update(index_elements=[key], set_={c: stmt.excluded[c] for c in update_columns})
+    return None
+
+
+def bulk_upsert(
+    db: Session,
+    model,
+    rows: Sequence[Dict[str, Any]],
+    key: str = "contentid",
+    update_columns: Optional[Sequence[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    rows를 INSERT ... ON DUPLICATE KEY UPDATE (MySQL) / ON CONFLICT DO UPDATE (SQLite, PostgreSQL)로 저장합니다.
+    chunk_size 행마다 문장 하나(executemany)로 보내므로 페이지 단위 왕복이 1회로 줄어듭니다.
+    - key 컬럼에는 UNIQUE(또는 PK) 제약이 있어야 합니다.
+    - update_columns를 생략하면 key를 제외한 모든 전달 컬럼을 갱신합니다.
+    - commit은 호출한 쪽에서 합니다. 저장한 행 수를 반환합니다.
+    """
+    rows = _dedupe(rows, key)
+    if not rows:
+        return 0
+
+    table = model.__table__
+    dialect = db.get_bind().dialect.name
+    if update_columns is None:
+        update_columns = [c for c in rows[0].keys() if c != key]
+    update_columns = list(update_columns)
+
+    stmt = _build_statement(dialect, table, key, update_columns)
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        if stmt is not None:
+            db.execute(stmt, chunk)
+        else:
+            # 지원하지 않는 DB는 행 단위 merge로 대체 (느리지만 결과는 같음)
+            for row in chunk:
+                existing = db.query(model).filter(getattr(model, key) == row[key]).first()
+                if existing:
+                    for column in update_columns:
+                        setattr(existing, column, row.get(column))
+                else:
+                    db.add(model(**row))
+            db.flush()
+    return len(rows)
+
+
+class Throughput:
+    """배치 작업의 처리 건수/속도를 누적해서 출력하기 위한 작은 도우미"""
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.rows = 0
+
+    def add(self, count: int) -> None:
+        self.rows += count
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self) -> float:
+        return self.rows / max(self.elapsed, 1e-9)
+
+    def summary(self) -> str:
+        return f"{self.rows}건, {self.elapsed:.1f}초, {self.rate:.0f}건/초"
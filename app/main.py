@@ -69,6 +69,37 @@ def startup_event():
     """
     test_db_connection()
 
+@app.on_event("startup")
+async def start_background_workers():
+    """
+    비동기 챗봇 작업(/recommend/chatbot?async=true)을 처리할 워커 풀을 시작합니다.
+    """
+    from app.services.job_service import chatbot_job_queue
+    chatbot_job_queue.start()
+
+@app.on_event("startup")
+async def start_catalog_change_subscriber():
+    """
+    동기화 스크립트가 남긴 변경 로그를 구독하여, 바뀐 항목의 캐시만 무효화합니다.
+    """
+    from app.services.catalog_change_service import catalog_change_subscriber
+    catalog_change_subscriber.start()
+
+@app.on_event("shutdown")
+async def stop_background_workers():
+    from app.services.job_service import chatbot_job_queue
+    from app.services.catalog_change_service import catalog_change_subscriber
+    await chatbot_job_queue.stop()
+    await catalog_change_subscriber.stop()
+
+@app.on_event("shutdown")
+async def close_tour_api_client():
+    """
+    TourAPI 커넥션 풀(keep-alive 연결)을 정리합니다.
+    """
+    from app.clients.tour_api_client import tour_api_client
+    await tour_api_client.aclose()
+
 @app.get("/")
 def root():
     return {"message": "Sosohaeng Backend API Root"}
\ No newline at end of file
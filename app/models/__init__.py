@@ -6,3 +6,9 @@ from .market_models import *        # Market, Product, Category, Region ...
 from .festival_models import *      # Festival, Event ...
 from .recommend_models import *     # User, Keyword, RecommendLog ...
 from .users_models import MarketUser
+from .base_user_models import User   # users (찜/개인화 테이블의 FK 대상)
+from .favorite_models import UserFavorite
+from .job_models import *           # ChatbotJobRecord (비동기 챗봇 작업)
+from .catalog_models import *       # CatalogVersion, CatalogChange (캐시 무효화 / 변경 로그)
+from .personalize_models import *   # UserTasteVector, UserRecommendation (개인화 추천)
+from .sync_models import *          # SyncWatermark, HarvestCheckpoint, SyncRun (증분 기준점 / 샤드 수집 진행 / 동기화 실행 원장)
@@ -0,0 +1,34 @@
+# app/models/catalog_models.py
+
+from sqlalchemy import Column, Integer, String, DateTime, func
+from app.db.database import Base
+
+
+class CatalogVersion(Base):
+    """
+    엔티티(SPOT, FESTIVAL)별 카탈로그 버전.
+    동기화 스크립트가 데이터를 커밋할 때마다 version을 1씩 올리고,
+    API 프로세스는 이 값이 바뀌면 메모리 캐시/인덱스를 다시 만듭니다.
+    """
+    __tablename__ = "catalog_versions"
+
+    entity = Column(String(20), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+
+class CatalogChange(Base):
+    """
+    카탈로그 변경 로그. 동기화 스크립트가 페이지를 커밋할 때 같은 트랜잭션으로 기록합니다.
+    자동 증가 id가 곧 변경 버전이며, 앱은 마지막으로 받은 id 이후의 변경만 받아 로컬 카탈로그를 갱신합니다.
+    동시에 커밋되는 트랜잭션은 id 순서와 다르게 보일 수 있으므로, created_at(기록 시각)이
+    CATALOG_CHANGE_SETTLE_SECONDS보다 오래된 변경까지만 버전으로 내려줍니다.
+    op: 'U' (추가/수정), 'D' (삭제)
+    """
+    __tablename__ = "catalog_changes"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    entity = Column(String(20), nullable=False)
+    contentid = Column(String(30), nullable=False)
+    op = Column(String(1), nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False, index=True)
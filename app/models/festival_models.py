@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, Field, HttpUrl, ConfigDict
-from sqlalchemy import Column, Integer, String, Float, Text, Index, text
+from sqlalchemy import Column, Integer, String, Float, Text, Index, DateTime, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 from app.db.database import Base # RDS 연결을 위한 Base 임포트
@@ -36,6 +36,7 @@ class Festival(Base):
     image_url = Column(Text) # URL을 저장
     
     modified_time = Column(String(14))
+    content_hash = Column(String(16)) # 동기화 시 변경 여부 판단용 해시 (app/services/sync_diff.py)
     
     @classmethod
     def distance_col(cls, user_lat: float, user_lon: float):
@@ -55,6 +56,37 @@ class Festival(Base):
         ).label('distance')
 # 위치 기반 검색을 위한 인덱스 유지
 Index("idx_festivals_title_date", Festival.title, Festival.event_start_date)
+# 종료일 필터(진행 중 축제 조회, 아카이브 대상 선별)용 인덱스
+Index("idx_festivals_end_date", Festival.event_end_date)
+
+
+class FestivalArchive(Base):
+    """
+    종료 후 보관 기간이 지난 축제를 옮겨 두는 콜드 테이블 (scripts/archive_festivals.py).
+    festivals 테이블에는 진행 중이거나 최근 종료된 축제만 남겨 조회 범위를 작게 유지합니다.
+    id는 festivals에서의 값을 그대로 유지하므로 복원 시에도 같은 id로 돌아갑니다.
+    """
+    __tablename__ = "festivals_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    contentid = Column(String(30), unique=True, nullable=False)
+    title = Column(String(255), nullable=False)
+    location = Column(String(255))
+    event_start_date = Column(String(8))
+    event_end_date = Column(String(8), index=True)
+    mapx = Column(Float)
+    mapy = Column(Float)
+    image_url = Column(Text)
+    modified_time = Column(String(14))
+    content_hash = Column(String(16))
+    archived_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+
+# festivals ↔ festivals_archive 사이에서 그대로 옮기는 컬럼
+FESTIVAL_ARCHIVE_COLUMNS = (
+    "id", "contentid", "title", "location", "event_start_date", "event_end_date",
+    "mapx", "mapy", "image_url", "modified_time", "content_hash",
+)
 
 
 # -------------------------
@@ -0,0 +1,19 @@
+# app/models/job_models.py
+
+from sqlalchemy import Column, String, Text, DateTime, func
+from app.db.database import Base
+
+
+class ChatbotJobRecord(Base):
+    """
+    비동기 챗봇 작업의 상태를 영속화하는 테이블 (CHATBOT_JOB_BACKEND=db 일 때 사용)
+    payload에는 ChatbotJob 전체가 JSON 문자열로 저장됩니다.
+    """
+    __tablename__ = "chatbot_jobs"
+
+    id = Column(String(32), primary_key=True)
+    status = Column(String(20), nullable=False, index=True)
+    payload = Column(Text, nullable=False)
+
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
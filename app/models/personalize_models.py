@@ -0,0 +1,29 @@
+# app/models/personalize_models.py
+
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, func
+from app.db.database import Base
+
+
+class UserTasteVector(Base):
+    """
+    사용자별 취향 벡터. 찜을 추가/해제할 때마다 해당 항목의 특징(분류 코드, 지역)만큼 가중치를 증감합니다.
+    weights에는 {"cat1:A01": 2.0, "area:32": 1.0, ...} 형태의 JSON 문자열이 저장됩니다.
+    """
+    __tablename__ = "user_taste_vectors"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    weights = Column(Text, nullable=False)
+    favorite_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), index=True)
+
+
+class UserRecommendation(Base):
+    """
+    배치(scripts/build_user_recommendations.py)가 미리 계산한 사용자별 추천 여행지 상위 N개.
+    items에는 [{"contentid": "...", "score": 0.93}, ...] 형태의 JSON 문자열이 점수 순으로 저장됩니다.
+    """
+    __tablename__ = "user_recommendations"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    items = Column(Text, nullable=False)
+    computed_at = Column(DateTime, default=func.now(), onupdate=func.now())
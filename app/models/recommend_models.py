@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional, List
 
 from pydantic import BaseModel, Field, HttpUrl, ConfigDict
-from sqlalchemy import Column, Integer, String, Float, Index, Text
+from sqlalchemy import Column, Integer, String, Float, Index, Text, DateTime
 from sqlalchemy.ext.declarative import declarative_base # (사용하는 경우)
 
 from app.db.database import Base # RDS 연결을 위한 Base 임포트
@@ -52,6 +52,22 @@ class RecommendTourInfo(Base):
     # 시간 정보는 API 응답에서 YYYYMMDDHHMMSS 문자열로 오므로 String(14)로 처리
     createdtime = Column(String(14)) # VARCHAR(14)
     modifiedtime = Column(String(14)) # VARCHAR(14)
+    content_hash = Column(String(16)) # 동기화 시 변경 여부 판단용 해시 (app/services/sync_diff.py)
+
+
+class RecommendTourOverview(Base):
+    """
+    여행지 개요(detailCommon2 overview)를 담는 보조 테이블.
+    목록 API(areaBasedList2)에는 개요가 없어서 scripts/enrich_overviews.py가 따로 받아 채웁니다.
+    source_modified는 개요를 받을 때의 여행지 modifiedtime으로, 여행지가 그 뒤에 수정되면 다시 받습니다.
+    """
+    __tablename__ = "recommend_tour_overview"
+
+    contentid = Column(String(20), primary_key=True)
+    overview = Column(Text) # HTML 태그를 걷어 낸 개요 본문
+    source_modified = Column(String(14))
+    content_hash = Column(String(16)) # 개요가 바뀌지 않았으면 본문은 다시 쓰지 않음
+    fetched_at = Column(DateTime, nullable=False)
 
 # -------------------------
 # Pydantic Schemas (API 입출력용)
@@ -105,4 +121,5 @@ class TourInfoUpdate(BaseModel):
 
 
 class TourInfoOut(TourInfoBase):
-    ai_summary: Optional[str] = Field(None, description="AI가 생성한 추천 요약")
\ No newline at end of file
+    ai_summary: Optional[str] = Field(None, description="AI가 생성한 추천 요약")
+    overview: Optional[str] = Field(None, description="여행지 개요 (TourAPI detailCommon2)")
\ No newline at end of file
@@ -0,0 +1,70 @@
+# app/models/sync_models.py
+
+from sqlalchemy import Column, String, Integer, Float, Boolean, Text, DateTime, func
+from app.db.database import Base
+
+
+class SyncWatermark(Base):
+    """
+    엔티티(SPOT, FESTIVAL)별 증분 동기화 기준점.
+    마지막으로 끝까지 성공한 동기화에서 본 가장 최근 TourAPI modifiedtime(YYYYMMDDHHMMSS)을 저장하고,
+    --incremental 실행은 수정일순으로 페이지를 받다가 이 값보다 오래된 항목을 만나면 멈춥니다.
+    scope는 기준점을 만든 조회 조건(축제는 "시작일-종료일" 기간)이며, 조건이 다르면 기준점을 쓰지 않습니다.
+    """
+    __tablename__ = "sync_watermarks"
+
+    entity = Column(String(20), primary_key=True)
+    modified_time = Column(String(14), nullable=False)
+    scope = Column(String(40), nullable=True) # 예: "20260101-20261231" (조건이 없는 엔티티는 NULL)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+
+class HarvestCheckpoint(Base):
+    """
+    harvest_tour_data.py의 샤드(지역 코드 × 콘텐츠 타입)별 진행 상황.
+    next_page 앞의 페이지는 모두 저장이 끝난 것이므로, 중단된 수집은 이 페이지부터 다시 시작합니다.
+    체크포인트는 해당 페이지 데이터와 같은 트랜잭션에서 갱신됩니다.
+    """
+    __tablename__ = "harvest_checkpoints"
+
+    shard = Column(String(20), primary_key=True)     # "{areaCode}:{contentTypeId}"
+    area_code = Column(String(10), nullable=False)
+    content_type_id = Column(String(10), nullable=False)
+    next_page = Column(Integer, nullable=False, default=1)
+    total_count = Column(Integer, nullable=True)      # 마지막으로 받은 totalCount
+    done = Column(Boolean, nullable=False, default=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+
+class SyncRun(Base):
+    """
+    sync_recommends.py / sync_festivals.py 실행 기록 (실행 원장).
+    last_page는 start_page부터 빈틈없이 커밋된 마지막 페이지로, 데이터와 같은 트랜잭션에서 갱신됩니다.
+    --resume은 끝나지 못한 마지막 실행의 params(정렬, 기간, 기준점)를 그대로 써서 last_page 다음부터 이어 받습니다.
+    """
+    __tablename__ = "sync_runs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    entity = Column(String(20), nullable=False, index=True)
+    mode = Column(String(20), nullable=False)            # full / incremental
+    status = Column(String(20), nullable=False)          # running / completed / failed
+    params = Column(Text, nullable=True)                 # 목록 조회 조건 (JSON)
+    resumed_from = Column(Integer, nullable=True)        # 이어받은 이전 실행 id
+
+    start_page = Column(Integer, nullable=False, default=1)
+    last_page = Column(Integer, nullable=False, default=0)
+    planned_pages = Column(Integer, nullable=True)
+    total_count = Column(Integer, nullable=True)
+    newest_modified = Column(String(14), nullable=True)  # 지금까지 본 가장 최근 modifiedtime (완료 시 기준점)
+
+    fetched_items = Column(Integer, nullable=False, default=0)
+    inserted = Column(Integer, nullable=False, default=0)
+    updated = Column(Integer, nullable=False, default=0)
+    unchanged = Column(Integer, nullable=False, default=0)
+    saved_rows = Column(Integer, nullable=False, default=0)
+    failed_pages = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+
+    started_at = Column(DateTime, default=func.now(), nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+    elapsed = Column(Float, nullable=True)               # 초
@@ -0,0 +1,50 @@
+# app/router/catalog_router.py
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.db.database import get_db
+from app.core.config import get_settings
+from app.services.catalog_change_service import (
+    get_changes_since, latest_snapshot_file, ChangesExpiredError
+)
+
+settings = get_settings()
+
+router = APIRouter(prefix="/catalog", tags=["Catalog Sync"])
+
+
+@router.get("/changes", summary="카탈로그 변경분 조회 (NDJSON)")
+def get_catalog_changes(
+    since: int = Query(0, ge=0, description="마지막으로 받은 카탈로그 버전 (스냅샷 헤더 또는 이전 응답의 version)"),
+    limit: int = Query(5000, ge=1, le=20000, description="한 번에 받을 최대 변경 수"),
+    db: Session = Depends(get_db),
+):
+    """
+    since 이후에 추가/수정/삭제된 여행지·축제를 한 줄에 하나씩(NDJSON) 반환합니다.
+    첫 줄의 has_more가 true이면 version을 since로 다시 요청합니다.
+    since=0이거나 변경 로그가 정리되어 이어받을 수 없으면 410을 반환하므로, /catalog/snapshot을 (다시) 받아야 합니다.
+    """
+    try:
+        lines = get_changes_since(db, since, limit)
+    except ChangesExpiredError as e:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(e))
+    return StreamingResponse(iter(lines), media_type="application/x-ndjson")
+
+
+@router.get("/snapshot", summary="카탈로그 전체 스냅샷 다운로드 (gzip NDJSON)")
+def download_catalog_snapshot():
+    """
+    가장 최근에 내보낸 전체 카탈로그 파일을 반환합니다. 응답 헤더 X-Catalog-Version의 값부터 /catalog/changes로 이어받습니다.
+    """
+    latest = latest_snapshot_file(settings.CATALOG_SNAPSHOT_DIR)
+    if latest is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="내보낸 카탈로그 스냅샷이 없습니다.")
+    version, path = latest
+    return FileResponse(
+        path,
+        media_type="application/gzip",
+        filename=f"catalog-{version}.ndjson.gz",
+        headers={"X-Catalog-Version": str(version)},
+    )
@@ -5,6 +5,10 @@ from app.db.database import get_db # DB 세션 임포트
 from app.schemas import FestivalListResponse, FestivalRead
 from app.models.festival_models import FestivalBase
 from app.services.festival_services import list_festivals
+from app.services.proximity_service import get_spots_near_festival
+from app.core.config import get_settings
+
+settings = get_settings()
 
 router = APIRouter(prefix="/festivals", tags=["festival"])
 
@@ -84,4 +88,23 @@ async def list_festivals_api(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
             detail="서버 내부 오류가 발생했습니다. 로그를 확인해주세요."
-        )
\ No newline at end of file
+        )
+
+
+@router.get(
+    "/{contentid}/spots",
+    summary="축제 주변 관광지 조회"
+)
+def list_festival_spots_api(
+    contentid: str,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+) -> Any:
+    """
+    축제 위치에서 SPOT_FESTIVAL_RADIUS_KM 이내의 관광지를 거리순으로 반환합니다.
+    동기화 후 미리 만들어 둔 근접 조인에서 조회하므로 요청 시 거리 계산이 없습니다.
+    """
+    spots = get_spots_near_festival(db, contentid, limit=limit)
+    if spots is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="축제 정보를 찾을 수 없습니다.")
+    return {"contentid": contentid, "radius_km": settings.SPOT_FESTIVAL_RADIUS_KM, "spots": spots}
@@ -0,0 +1,65 @@
+# app/router/geo_router.py
+
+from typing import Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Header, Response
+from sqlalchemy.orm import Session
+
+from app.db.database import get_db
+from app.services.geo_index_service import query_bbox, MAX_BBOX_ITEMS
+
+# MessagePack은 선택 의존성입니다. 설치되어 있지 않으면 JSON으로만 응답합니다.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+router = APIRouter(prefix="/geo", tags=["Map"])
+
+
+@router.get("/bbox", summary="화면 영역(bbox) 안의 여행지/축제 조회 (열 배열 응답)")
+def get_bbox_api(
+    sw_lat: float = Query(..., ge=-90, le=90, description="남서쪽 위도"),
+    sw_lng: float = Query(..., ge=-180, le=180, description="남서쪽 경도"),
+    ne_lat: float = Query(..., ge=-90, le=90, description="북동쪽 위도"),
+    ne_lng: float = Query(..., ge=-180, le=180, description="북동쪽 경도"),
+    type: str = Query("ALL", pattern="^(ALL|SPOT|FESTIVAL)$", description="조회할 항목 종류"),
+    limit: int = Query(MAX_BBOX_ITEMS, ge=1, le=MAX_BBOX_ITEMS, description="최대 항목 수"),
+    format: Optional[str] = Query(None, pattern="^(json|msgpack)$", description="응답 형식 (미지정 시 Accept 헤더 기준)"),
+    accept: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+) -> Any:
+    """
+    항목별 JSON 객체 대신 ids / lat / lon / type 열 배열로 응답합니다.
+    - JSON: 좌표는 소수점 6자리로 반올림한 숫자 배열
+    - MessagePack: lat/lon은 float32, type은 uint8 리틀엔디언 바이너리 (클라이언트에서 TypedArray로 바로 사용)
+    """
+    if sw_lat > ne_lat or sw_lng > ne_lng:
+        raise HTTPException(status_code=422, detail="남서쪽 좌표는 북동쪽 좌표보다 작아야 합니다.")
+
+    use_msgpack = format == "msgpack" or (format is None and accept and MSGPACK_MEDIA_TYPE in accept)
+    if use_msgpack and msgpack is None:
+        raise HTTPException(status_code=406, detail="서버에 MessagePack 인코더가 설치되어 있지 않습니다.")
+
+    try:
+        result = query_bbox(db, sw_lat, sw_lng, ne_lat, ne_lng, item_type=type, limit=limit)
+    except Exception as e:
+        print(f"bbox 조회 오류: {e}")
+        raise HTTPException(status_code=500, detail="영역 조회 중 오류가 발생했습니다.")
+
+    if use_msgpack:
+        payload = {
+            **result,
+            "lat": result["lat"].astype("<f4").tobytes(),
+            "lon": result["lon"].astype("<f4").tobytes(),
+            "type": result["type"].tobytes(),
+        }
+        return Response(content=msgpack.packb(payload, use_bin_type=True), media_type=MSGPACK_MEDIA_TYPE)
+
+    return {
+        **result,
+        "lat": [round(float(v), 6) for v in result["lat"]],
+        "lon": [round(float(v), 6) for v in result["lon"]],
+        "type": result["type"].tolist(),
+    }
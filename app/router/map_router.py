@@ -0,0 +1,36 @@
+# app/router/map_router.py
+
+from typing import Any
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.db.database import get_db
+from app.services.map_cluster_service import (
+    get_map_clusters, MIN_LEVEL, MAX_LEVEL
+)
+
+router = APIRouter(prefix="/map", tags=["Map"])
+
+
+@router.get("/clusters", summary="지도 화면 영역의 여행지/축제 클러스터 조회")
+def get_clusters_api(
+    sw_lat: float = Query(..., ge=-90, le=90, description="화면 남서쪽 위도"),
+    sw_lng: float = Query(..., ge=-180, le=180, description="화면 남서쪽 경도"),
+    ne_lat: float = Query(..., ge=-90, le=90, description="화면 북동쪽 위도"),
+    ne_lng: float = Query(..., ge=-180, le=180, description="화면 북동쪽 경도"),
+    level: int = Query(..., ge=MIN_LEVEL, le=MAX_LEVEL, description="지도 레벨 (TourAPI mlevel 기준, 1=가장 확대)"),
+    type: str = Query("ALL", pattern="^(ALL|SPOT|FESTIVAL)$", description="표시할 항목 종류"),
+    db: Session = Depends(get_db),
+) -> Any:
+    """
+    전국 단위 화면에서도 수만 개의 마커 대신 격자 단위로 집계된 클러스터(개수 + 대표 항목)를 내려줍니다.
+    클러스터는 동기화 후 레벨별로 미리 계산되어 있으므로 요청 시에는 화면 영역만 잘라냅니다.
+    """
+    if sw_lat > ne_lat or sw_lng > ne_lng:
+        raise HTTPException(status_code=422, detail="남서쪽 좌표는 북동쪽 좌표보다 작아야 합니다.")
+
+    try:
+        return get_map_clusters(db, sw_lat, sw_lng, ne_lat, ne_lng, level, cluster_type=type)
+    except Exception as e:
+        print(f"지도 클러스터 조회 오류: {e}")
+        raise HTTPException(status_code=500, detail="지도 클러스터 조회 중 오류가 발생했습니다.")
@@ -1,7 +1,10 @@
 # app/router/recommend_router.py
 
 # 1. 필요한 라이브러리 및 스키마 임포트
-from fastapi import APIRouter, HTTPException, Depends  # [수정] Depends 추가
+import asyncio
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Query, status  # [수정] Depends 추가
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session  # [수정] Session 타입 힌트 추가
 
 from app.schemas import (
@@ -9,15 +12,28 @@ from app.schemas import (
     RandomRecommendRequest,
     RandomRecommendResponse,
     ChatRecommendResponse,
+    ChatbotJobAccepted,
+    ChatbotJobStatus,
+    UserRead,
 )
 
 from app.services.recommend_service import (
     get_chatbot_search_keywords_and_recommendations,
     get_nearby_spots,
-    get_spot_detail
+    get_spot_detail,
+    get_random_recommendations_from_db,
 )
 
+from app.services.job_service import chatbot_job_queue, job_store, validate_callback_url
+from app.services.similar_service import get_similar_spots
+from app.services.personalize_service import get_recommendations_for_user
+from app.services.proximity_service import get_festivals_near_spot
+
 from app.db.database import get_db 
+from app.security import get_current_user
+from app.core.config import get_settings
+
+settings = get_settings()
 
 # 2. APIRouter 인스턴스 정의
 router = APIRouter(tags=["추천"])
@@ -27,8 +43,31 @@ router = APIRouter(tags=["추천"])
 @router.post("/chatbot", summary="RAG 기반 AI 챗봇 추천", response_model=ChatRecommendResponse)
 async def chatbot_endpoint(
     request: ChatbotRequest, 
-    db: Session = Depends(get_db) # [수정] FastAPI 의존성 주입으로 db 세션 획득
+    db: Session = Depends(get_db), # [수정] FastAPI 의존성 주입으로 db 세션 획득
+    async_mode: bool = Query(False, alias="async", description="true이면 작업 ID를 즉시 반환하고 백그라운드에서 처리"),
+    callback_url: Optional[str] = Query(None, description="비동기 모드에서 작업 완료 시 결과를 POST 받을 URL (서버에 허용된 https 호스트만 가능)"),
 ):
+    # 비동기 모드: 작업을 큐에 등록하고 202와 함께 작업 ID를 즉시 반환
+    if async_mode:
+        if callback_url:
+            try:
+                validate_callback_url(callback_url)
+            except ValueError as e:
+                raise HTTPException(status_code=422, detail=str(e))
+        try:
+            job = await chatbot_job_queue.submit(request.message, callback_url=callback_url)
+        except asyncio.QueueFull:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 잠시 후 다시 시도해 주세요."
+            )
+        accepted = ChatbotJobAccepted(
+            job_id=job.id,
+            status=job.status,
+            poll_url=f"{settings.API_V1_STR}/recommend/jobs/{job.id}",
+        )
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=accepted.model_dump())
+
     try:
         # [수정] 서비스 함수 호출 시 db 인자 전달
         result = await get_chatbot_search_keywords_and_recommendations(request.message, db)
@@ -51,17 +90,30 @@ async def chatbot_endpoint(
             detail=f"챗봇 서비스 처리 중 알 수 없는 서버 오류가 발생했습니다."
         )
 
-# 랜덤 추천 엔드포인트 (기존 코드 유지)
+# 비동기 챗봇 작업 결과 조회 (polling)
+@router.get("/jobs/{job_id}", summary="비동기 챗봇 작업 결과 조회", response_model=ChatbotJobStatus)
+async def get_chatbot_job(job_id: str):
+    job = await job_store.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="해당 작업을 찾을 수 없습니다.")
+
+    return ChatbotJobStatus(
+        job_id=job.id,
+        status=job.status,
+        result=ChatRecommendResponse(**job.result) if job.result else None,
+        error=job.error,
+    )
+
+# 랜덤 추천 엔드포인트
 @router.post("/random_recommendations", summary="랜덤 여행지 추천", response_model=RandomRecommendResponse)
-def get_random_recommendations(request: RandomRecommendRequest):
-    # 만약 get_random_recommendations_from_db 함수도 DB를 쓰도록 바꿨다면 
-    # 여기도 위와 똑같이 db: Session = Depends(get_db)를 추가해야 합니다.
-    # 현재 코드 기준으로는 그대로 둡니다.
+def get_random_recommendations(request: RandomRecommendRequest, db: Session = Depends(get_db)):
     try:
-        # 주의: 이 함수가 어디서 임포트되었는지 코드상에는 안 보이지만, 
-        # 만약 db가 필요하다면 위 chatbot_endpoint처럼 수정해야 합니다.
-        from app.services.recommend_service import get_random_recommendations_from_db # 가상의 임포트
-        recommendations = get_random_recommendations_from_db(themes=request.themes)
+        recommendations = get_random_recommendations_from_db(
+            db,
+            themes=request.themes,
+            count=request.count,
+            seed=request.seed,
+        )
         
         return RandomRecommendResponse(
             message="랜덤 여행지 추천이 완료되었습니다.",
@@ -69,12 +121,11 @@ def get_random_recommendations(request: RandomRecommendRequest):
         )
     except HTTPException as e:
         raise e
-    except ImportError:
-         # 임시 처리 (랜덤 추천 함수가 없어서 에러날 경우를 대비)
-         return RandomRecommendResponse(
-            message="랜덤 추천 기능 준비 중",
-            recommendations=[]
-        )
+    except Exception as e:
+        print(f"랜덤 추천 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail="랜덤 추천 처리 중 오류가 발생했습니다.")
          
 
 # 1. [페이지 1용] 주변 관광지 리스트 조회
@@ -105,4 +156,37 @@ def get_place_detail(contentid: str, db: Session = Depends(get_db)):
     spot = get_spot_detail(contentid, db)
     if not spot:
         raise HTTPException(status_code=404, detail="여행지 정보를 찾을 수 없습니다.")
-    return spot
\ No newline at end of file
+    return spot
+
+# 2-1. [페이지 2용] 관광지 주변에서 열리는 축제
+@router.get("/detail/{contentid}/festivals", summary="관광지 주변 진행 중/예정 축제 조회")
+def get_place_festivals(
+    contentid: str,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    festivals = get_festivals_near_spot(db, contentid, limit=limit)
+    if festivals is None:
+        raise HTTPException(status_code=404, detail="여행지 정보를 찾을 수 없습니다.")
+    return {"contentid": contentid, "radius_km": settings.SPOT_FESTIVAL_RADIUS_KM, "festivals": festivals}
+
+# 3. [상세 페이지용] 비슷한 여행지 ("이런 곳은 어때요?")
+@router.get("/similar/{contentid}", summary="비슷한 여행지 조회 (미리 계산된 kNN)")
+def get_similar_places(
+    contentid: str,
+    limit: int = Query(10, ge=1, le=50, description="반환할 여행지 수"),
+    db: Session = Depends(get_db),
+):
+    spots = get_similar_spots(contentid, db, limit=limit)
+    if spots is None:
+        raise HTTPException(status_code=404, detail="비슷한 여행지 정보가 없습니다.")
+    return {"contentid": contentid, "similar_spots": spots}
+
+# 4. 개인화 추천 (찜 기반, 배치로 미리 계산된 결과)
+@router.get("/for-me", summary="찜 기반 개인화 여행지 추천")
+def get_personal_recommendations(
+    limit: int = Query(20, ge=1, le=50, description="반환할 여행지 수"),
+    db: Session = Depends(get_db),
+    current_user: UserRead = Depends(get_current_user),
+):
+    return get_recommendations_for_user(db, current_user.id, limit=limit)
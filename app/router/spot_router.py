@@ -0,0 +1,26 @@
+# app/router/spot_router.py
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.db.database import get_db
+from app.security import get_current_user_optional
+from app.services.spot_page_service import build_spot_page
+
+router = APIRouter(prefix="/spots", tags=["Spot Page"])
+
+
+@router.get("/{contentid}/page", summary="여행지 상세 화면 통합 조회 (상세 + 주변 + 축제 + 비슷한 곳 + 찜 여부)")
+async def get_spot_page(
+    contentid: str,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user_optional),
+):
+    """
+    /recommend/detail, /recommend/nearby, /recommend/detail/{id}/festivals, /recommend/similar, /favorites를
+    한 번의 요청으로 대체합니다. 로그인하지 않은 경우 is_favorite는 null입니다.
+    """
+    page = await build_spot_page(db, contentid, user_id=current_user.id if current_user else None)
+    if page["detail"] is None and "detail" not in page["errors"]:
+        raise HTTPException(status_code=404, detail="여행지 정보를 찾을 수 없습니다.")
+    return page
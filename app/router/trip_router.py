@@ -0,0 +1,33 @@
+# app/router/trip_router.py
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.db.database import get_db
+from app.schemas import TripPlanRequest, TripPlanResponse
+from app.services.trip_service import plan_trip
+
+router = APIRouter(prefix="/trips", tags=["Trips"])
+
+
+@router.post(
+    "/plan",
+    response_model=TripPlanResponse,
+    summary="찜한 여행지/축제로 여행 동선 만들기",
+)
+def plan_trip_endpoint(request: TripPlanRequest, db: Session = Depends(get_db)):
+    """
+    찜한 SPOT/FESTIVAL 항목을 이동 거리가 짧은 순서로 정렬합니다.
+    - 최근접 이웃으로 초기 경로를 만든 뒤 2-opt로 개선합니다.
+    - start_date를 주면 하루 stops_per_day곳 기준으로 방문일을 배정하고, 축제 기간 안에 방문하도록 맞춥니다.
+    """
+    try:
+        return plan_trip(db, request)
+    except Exception as e:
+        print(f"여행 동선 계산 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="여행 동선 계산 중 오류가 발생했습니다."
+        )
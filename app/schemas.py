@@ -34,6 +34,8 @@ class RecommendationOut(BaseModel):
 
 class RandomRecommendRequest(BaseModel):
     themes: List[str] = Field(..., description="사용자가 선택한 테마 목록.")
+    count: int = Field(5, ge=1, le=50, description="추천받을 여행지 개수.")
+    seed: Optional[int] = Field(None, description="재현 가능한 결과를 위한 난수 시드 (테스트용).")
 
 class RandomRecommendResponse(BaseModel):
     message: str = Field("랜덤 여행지 추천이 완료되었습니다.", description="응답 상태 메시지.")
@@ -44,6 +46,18 @@ class ChatRecommendResponse(BaseModel):
     response: str = Field(..., description="챗봇의 텍스트 응답.")
     recommendations: List[TourInfoOut] = Field([], description="추천된 DB 기반여행지 목록.")
     # recommendations: List[RecommendationOut] = Field([], description="추천된 여행지 목록.")
+
+## 4. 비동기 챗봇 작업 스키마
+class ChatbotJobAccepted(BaseModel):
+    job_id: str = Field(..., description="비동기 챗봇 작업 ID.")
+    status: str = Field(..., description="작업 상태 (PENDING, RUNNING, DONE, FAILED).")
+    poll_url: str = Field(..., description="결과 조회(polling) 경로.")
+
+class ChatbotJobStatus(BaseModel):
+    job_id: str = Field(..., description="비동기 챗봇 작업 ID.")
+    status: str = Field(..., description="작업 상태 (PENDING, RUNNING, DONE, FAILED).")
+    result: Optional[ChatRecommendResponse] = Field(None, description="작업 완료 시 챗봇 응답.")
+    error: Optional[str] = Field(None, description="작업 실패 시 오류 메시지.")
     
 # ======================================================
 # ▼▼▼ 2. Festival 스키마  ▼▼▼
@@ -288,4 +302,44 @@ class FavoriteItemOut(BaseModel):
 class FavoriteListResponse(BaseModel):
     festivals: List[FavoriteItemOut] = Field([], description="찜한 축제 목록")
     products: List[FavoriteItemOut] = Field([], description="찜한 마켓 상품 목록")
-    spots: List[FavoriteItemOut] = Field([], description="찜한 추천 여행지 목록")
\ No newline at end of file
+    spots: List[FavoriteItemOut] = Field([], description="찜한 추천 여행지 목록")
+
+# ======================================================
+# ▼▼▼ 6. Trip Planner Schemas ▼▼▼
+# ======================================================
+from datetime import date as date_type
+
+class TripStopIn(BaseModel):
+    item_type: Literal["FESTIVAL", "SPOT"] = Field(..., description="찜 항목의 종류 (FESTIVAL, SPOT)")
+    item_id: int = Field(..., description="찜 항목의 고유 ID (contentid)")
+
+class TripPlanRequest(BaseModel):
+    items: List[TripStopIn] = Field(..., min_length=1, max_length=100, description="일정에 넣을 찜 항목 목록")
+    start_date: Optional[date_type] = Field(None, description="여행 시작일 (축제 기간 확인에 사용)")
+    stops_per_day: int = Field(4, ge=1, le=20, description="하루에 방문할 장소 수")
+    start_lat: Optional[float] = Field(None, ge=-90, le=90, description="출발지 위도 (선택)")
+    start_lng: Optional[float] = Field(None, ge=-180, le=180, description="출발지 경도 (선택)")
+
+class TripRouteStop(BaseModel):
+    order: int = Field(..., description="방문 순서 (1부터 시작)")
+    item_type: str
+    item_id: str
+    title: str
+    lat: float
+    lng: float
+    day: int = Field(..., description="여행 일차 (1부터 시작)")
+    date: Optional[date_type] = Field(None, description="방문 예정일 (start_date 지정 시)")
+    leg_km: float = Field(..., description="이전 장소(또는 출발지)로부터의 거리 (km)")
+    date_conflict: bool = Field(False, description="축제 기간과 방문일이 맞지 않는 경우 True")
+
+class TripSkippedItem(BaseModel):
+    item_type: str
+    item_id: str
+    reason: str
+
+class TripPlanResponse(BaseModel):
+    total_km: float = Field(..., description="전체 이동 거리 (km)")
+    days: int = Field(..., description="전체 일수")
+    route: List[TripRouteStop] = Field([], description="방문 순서대로 정렬된 일정")
+    skipped: List[TripSkippedItem] = Field([], description="일정에서 제외된 항목과 사유")
+
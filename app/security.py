@@ -12,6 +12,8 @@ settings = get_settings()
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = settings.ALGORITHM
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login") 
+# 비로그인 사용자도 볼 수 있는 화면용 (토큰이 없어도 401을 내지 않음)
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login", auto_error=False)
 
 # ======================================================
 # 1. 비밀번호 해싱 및 검증
@@ -90,4 +92,14 @@ def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_
     if user is None:
         raise credentials_exception
         
-    return user # DB 모델 객체 반환 (User 모델)
\ No newline at end of file
+    return user # DB 모델 객체 반환 (User 모델)
+
+
+def get_current_user_optional(db: Session = Depends(get_db), token: Optional[str] = Depends(optional_oauth2_scheme)):
+    """토큰이 있으면 현재 사용자를, 없거나 유효하지 않으면 None을 반환합니다."""
+    if not token:
+        return None
+    try:
+        return get_current_user(db=db, token=token)
+    except HTTPException:
+        return None
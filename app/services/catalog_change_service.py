@@ -0,0 +1,367 @@
+# app/services/catalog_change_service.py
+
+from __future__ import annotations
+import asyncio
+import datetime
+import glob
+import gzip
+import json
+import os
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import select, func, insert, delete
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.database import SessionLocal
+from app.models.catalog_models import CatalogChange
+from app.models.recommend_models import RecommendTourInfo
+from app.models.festival_models import Festival
+from app.services.catalog_version_service import ENTITY_SPOT, ENTITY_FESTIVAL
+
+settings = get_settings()
+
+OP_UPSERT = "U"
+OP_DELETE = "D"
+
+# 앱 로컬 카탈로그에 내려주는 컬럼 (목록/지도 화면에 필요한 것만)
+SPOT_FIELDS = (
+    "contentid", "contenttypeid", "title", "addr1", "areacode", "sigungucode",
+    "cat1", "cat2", "cat3", "firstimage", "mapx", "mapy", "modifiedtime",
+)
+FESTIVAL_FIELDS = (
+    "contentid", "title", "location", "event_start_date", "event_end_date",
+    "image_url", "mapx", "mapy", "modified_time",
+)
+ENTITY_MODELS = {
+    ENTITY_SPOT: (RecommendTourInfo, SPOT_FIELDS),
+    ENTITY_FESTIVAL: (Festival, FESTIVAL_FIELDS),
+}
+
+SNAPSHOT_FILE_PATTERN = re.compile(r"catalog-(\d+)\.ndjson\.gz$")
+
+
+class ChangesExpiredError(Exception):
+    """요청한 버전 이후의 변경 로그가 이미 정리되어 전체 스냅샷을 다시 받아야 하는 경우"""
+
+
+# ====================================================================
+# 1. 기록 (동기화 / 아카이브 스크립트)
+# ====================================================================
+
+def record_catalog_changes(db: Session, entity: str, contentids: Iterable[str], op: str = OP_UPSERT) -> int:
+    """
+    변경된 contentid들을 변경 로그에 추가합니다. commit은 호출한 쪽이 데이터 변경과 같은 트랜잭션으로 처리합니다.
+    created_at은 확정 버전 계산(get_safe_change_version)과 같은 시계를 쓰도록 앱에서 기록합니다.
+    """
+    now = datetime.datetime.now()
+    rows = [{"entity": entity, "contentid": str(cid), "op": op, "created_at": now} for cid in contentids]
+    if rows:
+        db.execute(insert(CatalogChange), rows)
+    return len(rows)
+
+
+def get_latest_change_version(db: Session) -> int:
+    return db.execute(select(func.max(CatalogChange.id))).scalar() or 0
+
+
+def settle_cutoff(settle_seconds: float = None) -> datetime.datetime:
+    if settle_seconds is None:
+        settle_seconds = settings.CATALOG_CHANGE_SETTLE_SECONDS
+    return datetime.datetime.now() - datetime.timedelta(seconds=settle_seconds)
+
+
+def get_safe_change_version(db: Session) -> int:
+    """
+    클라이언트에게 내려줘도 되는 가장 큰 변경 버전.
+    여러 스크립트가 동시에 쓰면 작은 id가 큰 id보다 늦게 커밋될 수 있어, 최신 id를 그대로 버전으로 주면
+    늦게 커밋된 변경을 클라이언트가 영영 받지 못합니다. 기록된 지 CATALOG_CHANGE_SETTLE_SECONDS가 지난 변경의
+    id까지만 인정합니다 (그보다 앞서 id를 받은 트랜잭션은 이미 커밋 또는 롤백됐다고 봄).
+    """
+    return db.execute(
+        select(func.max(CatalogChange.id)).where(CatalogChange.created_at <= settle_cutoff())
+    ).scalar() or 0
+
+
+def prune_catalog_changes(db: Session, retention_days: int, keep_after_version: int) -> int:
+    """
+    retention_days보다 오래된 변경 로그를 지우고 커밋합니다. 지운 건수를 반환합니다.
+    - keep_after_version(최신 스냅샷 파일의 버전) 이후의 변경은 남겨, 그 스냅샷에서 이어받을 수 있게 합니다.
+    - 확정 버전 행은 남겨 두어, 지운 뒤에도 get_safe_change_version이 0으로 돌아가지 않게 합니다.
+    지워진 구간의 버전으로 요청한 앱은 410(ChangesExpiredError)을 받고 스냅샷을 다시 받습니다.
+    """
+    cutoff = datetime.datetime.now() - datetime.timedelta(days=retention_days)
+    upper = min(keep_after_version, get_safe_change_version(db) - 1)
+    if upper <= 0:
+        return 0
+    try:
+        result = db.execute(
+            delete(CatalogChange).where(CatalogChange.id <= upper, CatalogChange.created_at < cutoff)
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return result.rowcount or 0
+
+
+# ====================================================================
+# 2. 직렬화
+# ====================================================================
+
+def _row_payload(row: Any, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """None 값은 생략하여 줄 길이를 줄입니다."""
+    payload = {}
+    for name in fields:
+        value = getattr(row, name)
+        if value is not None:
+            payload[name] = value
+    return payload
+
+
+def _line(obj: Dict[str, Any]) -> bytes:
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _load_rows(db: Session, entity: str, contentids: List[str]) -> Dict[str, Any]:
+    model, _ = ENTITY_MODELS[entity]
+    rows = {}
+    for start in range(0, len(contentids), 1000):
+        chunk = contentids[start:start + 1000]
+        for row in db.execute(select(model).where(model.contentid.in_(chunk))).scalars():
+            rows[str(row.contentid)] = row
+    return rows
+
+
+# ====================================================================
+# 3. 변경분 조회 (GET /catalog/changes)
+# ====================================================================
+
+def get_changes_since(db: Session, since: int, limit: int) -> List[bytes]:
+    """
+    since 이후의 변경을 NDJSON 줄 목록으로 반환합니다.
+    - 첫 줄: {"since", "version", "has_more", "count"} (다음 요청에는 version을 since로 사용)
+    - 확정 버전(get_safe_change_version)까지만 내려주므로, 방금 기록된 변경은 다음 요청에서 받습니다.
+    - 이후 줄: {"v", "type", "op", "id", "row"} — 같은 항목이 여러 번 바뀌었으면 마지막 변경만 내려줍니다.
+    - 수정 로그가 남아 있는데 행이 사라졌으면 삭제('D')로 내려줍니다.
+    - since=0(처음 받는 앱)은 항상 ChangesExpiredError입니다. 변경 로그는 정리되거나 로그 도입 전에 들어간 행을 담고 있지 않으므로,
+      처음에는 반드시 전체 스냅샷을 받고 그 버전부터 이어받아야 합니다.
+    """
+    if since <= 0:
+        raise ChangesExpiredError("처음 동기화하는 경우 전체 스냅샷(/catalog/snapshot)을 먼저 받아주세요.")
+    oldest = db.execute(select(func.min(CatalogChange.id))).scalar()
+    if oldest is not None and since < oldest - 1:
+        raise ChangesExpiredError(f"version {since} 이후의 변경 로그가 없습니다. 전체 스냅샷을 다시 받아주세요.")
+
+    horizon = get_safe_change_version(db)
+    changes = db.execute(
+        select(CatalogChange.id, CatalogChange.entity, CatalogChange.contentid, CatalogChange.op)
+        .where(CatalogChange.id > since, CatalogChange.id <= horizon)
+        .order_by(CatalogChange.id)
+        .limit(limit + 1)
+    ).all()
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    # 중간에 비어 있는 id(롤백)가 있어도 horizon까지는 모두 확정이므로 다 받았으면 horizon으로 옮김
+    version = changes[-1].id if has_more else max(since, horizon)
+
+    # (엔티티, contentid)별 마지막 변경만 남김
+    latest: Dict[Tuple[str, str], Any] = {}
+    for change in changes:
+        latest[(change.entity, change.contentid)] = change
+
+    rows_by_entity: Dict[str, Dict[str, Any]] = {}
+    for entity in ENTITY_MODELS:
+        ids = [cid for (e, cid), c in latest.items() if e == entity and c.op == OP_UPSERT]
+        rows_by_entity[entity] = _load_rows(db, entity, ids) if ids else {}
+
+    body = []
+    for (entity, contentid), change in sorted(latest.items(), key=lambda kv: kv[1].id):
+        row = rows_by_entity.get(entity, {}).get(contentid) if change.op == OP_UPSERT else None
+        line = {"v": change.id, "type": entity, "op": OP_UPSERT if row is not None else OP_DELETE, "id": contentid}
+        if row is not None:
+            line["row"] = _row_payload(row, ENTITY_MODELS[entity][1])
+        body.append(_line(line))
+
+    header = _line({"since": since, "version": version, "has_more": has_more, "count": len(body)})
+    return [header] + body
+
+
+# ====================================================================
+# 4. 전체 스냅샷 파일 (scripts/export_catalog_snapshot.py, GET /catalog/snapshot)
+# ====================================================================
+
+def iter_snapshot_lines(db: Session, version: int) -> Iterator[bytes]:
+    counts = {
+        entity: db.execute(select(func.count()).select_from(model)).scalar() or 0
+        for entity, (model, _) in ENTITY_MODELS.items()
+    }
+    yield _line({
+        "version": version,
+        "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "counts": counts,
+    })
+    for entity, (model, fields) in ENTITY_MODELS.items():
+        columns = [getattr(model, name) for name in fields]
+        for row in db.execute(select(*columns).execution_options(yield_per=2000)):
+            yield _line({"type": entity, "op": OP_UPSERT, "id": str(row.contentid), "row": _row_payload(row, fields)})
+
+
+def write_snapshot_file(db: Session, directory: str) -> Tuple[str, int]:
+    """
+    현재 카탈로그 전체를 gzip NDJSON 파일로 저장합니다.
+    버전은 내보내기 시작 전에 확정 버전으로 읽으므로, 그 뒤에 커밋된 변경은 앱이 /catalog/changes로 다시 받게 됩니다.
+    확정된 변경이 없으면(버전 0) since=0(스냅샷 없음)과 구분할 수 없으므로 ValueError를 발생시킵니다.
+    """
+    version = get_safe_change_version(db)
+    if version <= 0:
+        raise ValueError("확정된 변경 로그가 없어 스냅샷 버전을 정할 수 없습니다. 동기화를 한 번 실행한 뒤 다시 시도하세요.")
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"catalog-{version:012d}.ndjson.gz")
+    tmp_path = path + ".tmp"
+    with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+        for line in iter_snapshot_lines(db, version):
+            f.write(line)
+    os.replace(tmp_path, path)
+    return path, version
+
+
+def list_snapshot_files(directory: str) -> List[Tuple[int, str]]:
+    """(버전, 경로) 목록을 버전 오름차순으로 반환합니다."""
+    files = []
+    for path in glob.glob(os.path.join(directory, "catalog-*.ndjson.gz")):
+        match = SNAPSHOT_FILE_PATTERN.search(os.path.basename(path))
+        if match:
+            files.append((int(match.group(1)), path))
+    return sorted(files)
+
+
+def latest_snapshot_file(directory: str) -> Optional[Tuple[int, str]]:
+    files = list_snapshot_files(directory)
+    return files[-1] if files else None
+
+
+# ====================================================================
+# 5. 변경 로그 구독 (API 프로세스의 캐시/인덱스 무효화)
+# ====================================================================
+
+ChangeListener = Callable[[Session, List[Any]], None]
+
+
+class CatalogChangeSubscriber:
+    """
+    API 프로세스에서 catalog_changes를 주기적으로 읽어, 등록된 리스너에게 새 변경분을 전달합니다.
+    리스너는 (db, [변경 행(id, entity, contentid, op)]) 를 받아 해당 항목의 캐시만 골라 비웁니다.
+    시작 시점의 확정 버전 이전 변경은 이미 캐시에 반영된 것으로 보고 건너뜁니다.
+
+    동시에 커밋되는 트랜잭션 때문에 작은 id가 큰 id보다 늦게 보일 수 있으므로, 읽은 id 사이의 빈 번호는
+    CATALOG_CHANGE_SETTLE_SECONDS 동안 기억해 두었다가 매번 다시 조회합니다. 그 안에 나타나지 않으면
+    롤백된 번호로 보고 잊습니다.
+    """
+    # 한 번에 추적할 빈 번호의 최대 개수 (큰 트랜잭션이 통째로 롤백된 경우 등은 캐시 TTL에 맡김)
+    MAX_GAPS = 50000
+
+    def __init__(self, interval: float, batch_size: int = 5000, settle_seconds: float = None):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.settle_seconds = settings.CATALOG_CHANGE_SETTLE_SECONDS if settle_seconds is None else settle_seconds
+        self.last_id: Optional[int] = None
+        self._gaps: Dict[int, float] = {}  # 아직 보이지 않은 id → 포기할 시각 (monotonic)
+        self._listeners: List[ChangeListener] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def add_listener(self, listener: ChangeListener) -> None:
+        self._listeners.append(listener)
+
+    def _select_changes(self):
+        return select(CatalogChange.id, CatalogChange.entity, CatalogChange.contentid, CatalogChange.op)
+
+    def _track_gaps(self, ids: List[int], now: float) -> None:
+        deadline = now + self.settle_seconds
+        previous = self.last_id
+        for change_id in ids:
+            missing = change_id - previous - 1
+            if 0 < missing and len(self._gaps) + missing <= self.MAX_GAPS:
+                for gap in range(previous + 1, change_id):
+                    self._gaps[gap] = deadline
+            elif missing > 0:
+                print(f"⚠️ 변경 로그 빈 번호가 너무 많아 {previous + 1}~{change_id - 1}은 추적하지 않습니다 (캐시 TTL로 갱신).")
+            previous = change_id
+
+    def poll_once(self) -> int:
+        """
+        새 변경과 늦게 커밋된 빈 번호의 변경을 리스너에 전달합니다.
+        반환값은 last_id 뒤에서 새로 읽은 변경 수입니다 (batch_size만큼 찼으면 바로 다시 읽음).
+        """
+        db = SessionLocal()
+        try:
+            if self.last_id is None:
+                self.last_id = get_safe_change_version(db)
+                return 0
+
+            now = time.monotonic()
+            late = []
+            gap_ids = sorted(self._gaps)
+            for start in range(0, len(gap_ids), 1000):
+                late.extend(db.execute(
+                    self._select_changes().where(CatalogChange.id.in_(gap_ids[start:start + 1000]))
+                ).all())
+            changes = db.execute(
+                self._select_changes()
+                .where(CatalogChange.id > self.last_id)
+                .order_by(CatalogChange.id)
+                .limit(self.batch_size)
+            ).all()
+
+            for change in late:
+                self._gaps.pop(change.id, None)
+            self._gaps = {gap: deadline for gap, deadline in self._gaps.items() if deadline > now}
+            if changes:
+                self._track_gaps([c.id for c in changes], now)
+
+            delivered = late + changes
+            if not delivered:
+                return 0
+
+            # 스냅샷 기반 인덱스(지도, 점수 계산 등)는 여기서 만료시키지 않습니다.
+            # 동기화 중에는 폴링마다 변경이 오므로, 다시 만드는 시점은 catalog_version_watcher가 잠잠해진 뒤로 정합니다.
+            for listener in self._listeners:
+                try:
+                    listener(db, delivered)
+                except Exception as e:
+                    print(f"⚠️ 카탈로그 변경 리스너 오류 ({getattr(listener, '__name__', listener)}): {e}")
+
+            if changes:
+                self.last_id = changes[-1].id
+            return len(changes)
+        finally:
+            db.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                processed = await asyncio.to_thread(self.poll_once)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ 카탈로그 변경 로그 조회 실패: {e}")
+                processed = 0
+            # 한 배치를 꽉 채웠다면 밀린 변경이 더 있으므로 바로 이어서 읽습니다.
+            if processed < self.batch_size:
+                await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            print(f"카탈로그 변경 로그 구독 시작 (주기: {self.interval}초)")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+catalog_change_subscriber = CatalogChangeSubscriber(settings.CATALOG_CHANGE_POLL_INTERVAL)
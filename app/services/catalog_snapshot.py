@@ -0,0 +1,227 @@
+# app/services/catalog_snapshot.py
+
+from __future__ import annotations
+import time
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.recommend_models import RecommendTourInfo
+from app.models.festival_models import Festival
+from app.models.favorite_models import UserFavorite
+from app.services.catalog_version_service import (
+    catalog_version_watcher, ENTITY_SPOT, ENTITY_FESTIVAL
+)
+
+settings = get_settings()
+
+# kind 배열 값
+KIND_SPOT = 0
+KIND_FESTIVAL = 1
+KIND_NAMES = {KIND_SPOT: "SPOT", KIND_FESTIVAL: "FESTIVAL"}
+
+# 축제 테이블에는 분류 코드가 없으므로 TourAPI의 '축제' 분류(A02 > A0207)로 간주합니다.
+FESTIVAL_CAT1 = "A02"
+FESTIVAL_CAT2 = "A0207"
+
+# 날짜가 없는 여행지는 항상 열려 있는 것으로 취급
+ALWAYS_OPEN_START = 0
+ALWAYS_OPEN_END = 99991231
+
+
+@dataclass
+class CatalogSnapshot:
+    """
+    여행지(SPOT)와 축제(FESTIVAL)를 하나로 합친 열(column) 단위 배열 모음.
+    추천 점수 계산, 지도 클러스터링 등 요청마다 전체 후보를 훑어야 하는 기능이
+    DB 대신 이 배열을 벡터 연산으로 사용합니다.
+    """
+    version: Tuple[int, int]
+    kind: np.ndarray          # int8, KIND_SPOT / KIND_FESTIVAL
+    contentid: np.ndarray     # object(str)
+    lat: np.ndarray           # float64 (mapy)
+    lon: np.ndarray           # float64 (mapx)
+    cat1: np.ndarray          # int32, cat_vocab 인덱스 (-1: 없음)
+    cat2: np.ndarray
+    cat3: np.ndarray
+    start_date: np.ndarray    # int32 YYYYMMDD
+    end_date: np.ndarray      # int32 YYYYMMDD
+    mlevel: np.ndarray        # int16 (TourAPI 지도 레벨, 없으면 0)
+    popularity: np.ndarray    # float32, 찜 개수
+    title: List[str]
+    image_url: List[Optional[str]]
+    address: List[Optional[str]]
+    cat_vocab: Dict[str, int] = field(default_factory=dict)
+    row_by_key: Dict[Tuple[int, str], int] = field(default_factory=dict)
+    popularity_loaded_at: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.contentid)
+
+    def row_of(self, kind: int, contentid: str) -> Optional[int]:
+        return self.row_by_key.get((kind, str(contentid)))
+
+    def category_mask(self, codes: List[str]) -> np.ndarray:
+        """분류 코드 목록 중 하나라도 해당하는 행을 True로 표시한 마스크"""
+        mask = np.zeros(len(self), dtype=bool)
+        for code in codes:
+            code_id = self.cat_vocab.get(code)
+            if code_id is None:
+                continue
+            column = {3: self.cat1, 5: self.cat2, 9: self.cat3}.get(len(code))
+            if column is not None:
+                mask |= column == code_id
+        return mask
+
+
+def _date_to_int(value: Optional[str], default: int) -> int:
+    if value and len(value) >= 8 and value[:8].isdigit():
+        return int(value[:8])
+    return default
+
+
+def _load_popularity(db: Session) -> Dict[Tuple[str, str], int]:
+    rows = db.execute(
+        select(UserFavorite.item_type, UserFavorite.item_id, func.count(UserFavorite.id))
+        .where(UserFavorite.item_type.in_(["SPOT", "FESTIVAL"]))
+        .group_by(UserFavorite.item_type, UserFavorite.item_id)
+    ).all()
+    return {(item_type, str(item_id)): count for item_type, item_id, count in rows}
+
+
+def _fill_popularity(snapshot: CatalogSnapshot, db: Session) -> None:
+    counts = _load_popularity(db)
+    popularity = np.zeros(len(snapshot), dtype=np.float32)
+    for (item_type, item_id), count in counts.items():
+        kind = KIND_SPOT if item_type == "SPOT" else KIND_FESTIVAL
+        row = snapshot.row_of(kind, item_id)
+        if row is not None:
+            popularity[row] = count
+    snapshot.popularity = popularity
+    snapshot.popularity_loaded_at = time.monotonic()
+
+
+def build_catalog_snapshot(db: Session, version: Tuple[int, int]) -> CatalogSnapshot:
+    spots = db.execute(
+        select(
+            RecommendTourInfo.contentid, RecommendTourInfo.title, RecommendTourInfo.addr1,
+            RecommendTourInfo.firstimage, RecommendTourInfo.mapx, RecommendTourInfo.mapy,
+            RecommendTourInfo.cat1, RecommendTourInfo.cat2, RecommendTourInfo.cat3,
+            RecommendTourInfo.mlevel,
+        ).where(RecommendTourInfo.mapx.isnot(None), RecommendTourInfo.mapy.isnot(None))
+    ).all()
+    festivals = db.execute(
+        select(
+            Festival.contentid, Festival.title, Festival.location, Festival.image_url,
+            Festival.mapx, Festival.mapy, Festival.event_start_date, Festival.event_end_date,
+        ).where(Festival.mapx.isnot(None), Festival.mapy.isnot(None))
+    ).all()
+
+    n = len(spots) + len(festivals)
+    cat_vocab: Dict[str, int] = {}
+
+    def cat_id(code: Optional[str]) -> int:
+        if not code:
+            return -1
+        return cat_vocab.setdefault(code, len(cat_vocab))
+
+    kind = np.empty(n, dtype=np.int8)
+    contentid = np.empty(n, dtype=object)
+    lat = np.empty(n, dtype=np.float64)
+    lon = np.empty(n, dtype=np.float64)
+    cat1 = np.empty(n, dtype=np.int32)
+    cat2 = np.empty(n, dtype=np.int32)
+    cat3 = np.empty(n, dtype=np.int32)
+    start_date = np.empty(n, dtype=np.int32)
+    end_date = np.empty(n, dtype=np.int32)
+    mlevel = np.zeros(n, dtype=np.int16)
+    title: List[str] = []
+    image_url: List[Optional[str]] = []
+    address: List[Optional[str]] = []
+    row_by_key: Dict[Tuple[int, str], int] = {}
+
+    i = 0
+    for cid, t, addr, img, mapx, mapy, c1, c2, c3, level in spots:
+        kind[i] = KIND_SPOT
+        contentid[i] = str(cid)
+        lat[i], lon[i] = mapy, mapx
+        cat1[i], cat2[i], cat3[i] = cat_id(c1), cat_id(c2), cat_id(c3)
+        start_date[i], end_date[i] = ALWAYS_OPEN_START, ALWAYS_OPEN_END
+        mlevel[i] = level or 0
+        title.append(t); image_url.append(img); address.append(addr)
+        row_by_key[(KIND_SPOT, str(cid))] = i
+        i += 1
+
+    for cid, t, location, img, mapx, mapy, start, end in festivals:
+        kind[i] = KIND_FESTIVAL
+        contentid[i] = str(cid)
+        lat[i], lon[i] = mapy, mapx
+        cat1[i], cat2[i], cat3[i] = cat_id(FESTIVAL_CAT1), cat_id(FESTIVAL_CAT2), -1
+        start_date[i] = _date_to_int(start, ALWAYS_OPEN_START)
+        end_date[i] = _date_to_int(end, ALWAYS_OPEN_END)
+        title.append(t); image_url.append(img); address.append(location)
+        row_by_key[(KIND_FESTIVAL, str(cid))] = i
+        i += 1
+
+    snapshot = CatalogSnapshot(
+        version=version, kind=kind, contentid=contentid, lat=lat, lon=lon,
+        cat1=cat1, cat2=cat2, cat3=cat3, start_date=start_date, end_date=end_date,
+        mlevel=mlevel, popularity=np.zeros(n, dtype=np.float32),
+        title=title, image_url=image_url, address=address,
+        cat_vocab=cat_vocab, row_by_key=row_by_key,
+    )
+    _fill_popularity(snapshot, db)
+    print(f"카탈로그 스냅샷 갱신 완료 (version={version}, 여행지 {len(spots)}건, 축제 {len(festivals)}건)")
+    return snapshot
+
+
+def is_older_key(key: Tuple[Tuple[int, int], Any], than: Tuple[Tuple[int, int], Any]) -> bool:
+    """
+    파생 인덱스의 (스냅샷 버전, 날짜) 키가 than보다 오래됐는지.
+    버전은 (여행지, 축제) 각각 증가만 하므로 항목별로 비교합니다.
+    """
+    (version, day), (other_version, other_day) = key, than
+    return key != than and day <= other_day and all(a <= b for a, b in zip(version, other_version))
+
+
+class CatalogSnapshotHolder:
+    """
+    프로세스 전역 스냅샷을 보관하고, 카탈로그 버전이 바뀌면 다시 만듭니다.
+    찜 개수(인기도)는 동기화와 무관하게 바뀌므로 POPULARITY_REFRESH_INTERVAL마다 따로 갱신합니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[CatalogSnapshot] = None
+
+    def get(self, db: Session) -> CatalogSnapshot:
+        version = (
+            catalog_version_watcher.current(ENTITY_SPOT),
+            catalog_version_watcher.current(ENTITY_FESTIVAL),
+        )
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            if time.monotonic() - snapshot.popularity_loaded_at > settings.POPULARITY_REFRESH_INTERVAL:
+                # 다른 요청이 이미 갱신 중이면 기다리지 않고 현재 인기도로 응답합니다.
+                if self._lock.acquire(blocking=False):
+                    try:
+                        # 락을 얻기 전에 다른 요청이 방금 갱신했을 수 있으므로 다시 확인
+                        if time.monotonic() - snapshot.popularity_loaded_at > settings.POPULARITY_REFRESH_INTERVAL:
+                            _fill_popularity(snapshot, db)
+                    finally:
+                        self._lock.release()
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = build_catalog_snapshot(db, version)
+                self._snapshot = snapshot
+        return snapshot
+
+
+catalog_snapshot = CatalogSnapshotHolder()
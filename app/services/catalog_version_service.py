@@ -0,0 +1,105 @@
+# app/services/catalog_version_service.py
+
+from __future__ import annotations
+import time
+import threading
+from typing import Dict, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.database import SessionLocal
+from app.models.catalog_models import CatalogVersion
+
+settings = get_settings()
+
+# 카탈로그 엔티티 이름 (찜 기능의 item_type과 동일한 문자열 사용)
+ENTITY_SPOT = "SPOT"
+ENTITY_FESTIVAL = "FESTIVAL"
+
+
+def bump_catalog_version(db: Session, entity: str) -> int:
+    """
+    엔티티의 카탈로그 버전을 1 올립니다.
+    동기화 스크립트가 페이지를 커밋하기 직전에 호출하여 같은 트랜잭션에 포함시킵니다.
+    """
+    row = (
+        db.query(CatalogVersion)
+        .filter(CatalogVersion.entity == entity)
+        .with_for_update()
+        .first()
+    )
+    if row:
+        row.version += 1
+    else:
+        row = CatalogVersion(entity=entity, version=1)
+        db.add(row)
+    db.flush()
+    return row.version
+
+
+def get_catalog_version(db: Session, entity: str) -> int:
+    row = db.get(CatalogVersion, entity)
+    return row.version if row else 0
+
+
+class CatalogVersionWatcher:
+    """
+    API 프로세스에서 카탈로그 버전을 주기적으로 확인합니다.
+    매 요청마다 DB를 조회하지 않도록 interval(초) 동안은 마지막 값을 재사용합니다.
+
+    동기화는 페이지를 커밋할 때마다 버전을 올리므로, 바뀐 버전을 바로 내보내면 동기화 내내
+    스냅샷과 파생 인덱스(지도, 근접 조인, 점수 계산 등)를 요청 스레드에서 계속 다시 만들게 됩니다.
+    그래서 새 버전은 interval 이상 더 바뀌지 않았을 때(동기화가 잠잠해졌을 때) 내보내고,
+    동기화가 길어져도 max_delay가 지나면 한 번은 내보냅니다. 항목별 캐시 무효화는 변경 로그 구독이 따로 처리합니다.
+    """
+    def __init__(self, interval: float, max_delay: float):
+        self.interval = interval
+        self.max_delay = max_delay
+        self._versions: Dict[str, int] = {}
+        self._checked_at: Dict[str, float] = {}
+        # 아직 내보내지 않은 새 버전: entity → (버전, 그 버전을 처음 본 시각, 처음 바뀐 것을 본 시각)
+        self._pending: Dict[str, Tuple[int, float, float]] = {}
+        self._lock = threading.Lock()
+
+    def current(self, entity: str) -> int:
+        now = time.monotonic()
+        with self._lock:
+            if entity in self._versions and now - self._checked_at[entity] < self.interval:
+                return self._versions[entity]
+
+        db = SessionLocal()
+        try:
+            version = get_catalog_version(db, entity)
+        except Exception as e:
+            # 버전 테이블을 읽지 못하면 캐시를 유지하고 다음 주기에 다시 시도합니다.
+            print(f"⚠️ 카탈로그 버전 조회 실패 ({entity}): {e}")
+            version = self._versions.get(entity, 0)
+        finally:
+            db.close()
+
+        with self._lock:
+            self._checked_at[entity] = now
+            published = self._versions.get(entity)
+            if published is None or version == published:
+                self._versions[entity] = version
+                self._pending.pop(entity, None)
+                return version
+
+            seen, seen_at, changed_at = self._pending.get(entity, (None, now, now))
+            if seen != version:
+                # 버전이 또 바뀜 (동기화 진행 중): 잠잠해질 때까지 기다림
+                self._pending[entity] = (version, now, changed_at)
+                seen_at = now
+            if now - seen_at >= self.interval or now - changed_at >= self.max_delay:
+                self._versions[entity] = version
+                self._pending.pop(entity, None)
+            return self._versions[entity]
+
+    def expire(self) -> None:
+        """다음 current() 호출 시 DB에서 버전을 다시 읽도록 합니다."""
+        with self._lock:
+            self._checked_at.clear()
+
+
+catalog_version_watcher = CatalogVersionWatcher(settings.CATALOG_VERSION_CHECK_INTERVAL, settings.CATALOG_REBUILD_MAX_DELAY)
@@ -0,0 +1,75 @@
+# app/services/category_codes.py
+
+from __future__ import annotations
+import re
+from typing import Dict, Iterable, List
+
+# TourAPI 서비스 분류 코드 (cat1: 3자리, cat2: 5자리, cat3: 9자리)
+# - A01 자연 / A02 인문(문화·예술·역사) / A03 레포츠 / A04 쇼핑 / A05 음식 / B02 숙박 / C01 추천코스
+# FE에서 넘어오는 테마 이름(한글/영문)을 분류 코드 목록으로 변환하기 위한 매핑입니다.
+THEME_CATEGORY_MAP: Dict[str, List[str]] = {
+    "nature": ["A01"],
+    "자연": ["A01"],
+    "history": ["A0201"],
+    "역사": ["A0201"],
+    "culture": ["A0205", "A0206"],
+    "문화": ["A0205", "A0206"],
+    "healing": ["A0202", "C0114"],
+    "힐링": ["A0202", "C0114"],
+    "activity": ["A03"],
+    "액티비티": ["A03"],
+    "레포츠": ["A03"],
+    "experience": ["A0203"],
+    "체험": ["A0203"],
+    "family": ["A0202", "A0203", "C0112"],
+    "가족": ["A0202", "A0203", "C0112"],
+    "food": ["A05", "C0117"],
+    "맛집": ["A05", "C0117"],
+    "음식": ["A05", "C0117"],
+    "shopping": ["A04"],
+    "쇼핑": ["A04"],
+    "camping": ["C0116"],
+    "캠핑": ["C0116"],
+    "walking": ["C0115"],
+    "도보": ["C0115"],
+    "산책": ["C0115"],
+    "festival": ["A0207", "A0208"],
+    "축제": ["A0207", "A0208"],
+}
+
+# 이미 분류 코드 형태로 들어온 값 (예: "A01", "A0101", "A01010100")
+_CATEGORY_CODE_RE = re.compile(r"^[A-C]\d{2}(\d{2}(\d{4})?)?$")
+
+
+def resolve_theme_codes(themes: Iterable[str]) -> List[str]:
+    """
+    테마 이름 목록을 TourAPI 분류 코드 목록으로 변환합니다.
+    알 수 없는 테마는 무시하고, 다른 코드의 하위 코드(예: A01이 있을 때 A0101)는 제거하여
+    결과 코드끼리 서로 겹치지 않도록 합니다.
+    """
+    codes = set()
+    for theme in themes:
+        key = (theme or "").strip()
+        if not key:
+            continue
+        if _CATEGORY_CODE_RE.match(key.upper()):
+            codes.add(key.upper())
+        else:
+            codes.update(THEME_CATEGORY_MAP.get(key.lower(), []))
+
+    return sorted(
+        code for code in codes
+        if not any(code != other and code.startswith(other) for other in codes)
+    )
+
+
+def match_themes(themes: Iterable[str], cat1: str, cat2: str, cat3: str) -> List[str]:
+    """여행지의 분류 코드(cat1~3)에 해당하는 테마 이름만 골라 반환합니다."""
+    spot_codes = [c for c in (cat1, cat2, cat3) if c]
+    matched = []
+    for theme in themes:
+        for code in resolve_theme_codes([theme]):
+            if any(sc.startswith(code) for sc in spot_codes):
+                matched.append(theme)
+                break
+    return matched
@@ -3,9 +3,10 @@ from sqlalchemy import and_
 from typing import Dict
 from app.schemas import FavoriteRequest, FavoriteListResponse, FavoriteItemOut
 from app.models.favorite_models import UserFavorite 
-from app.models.festival_models import Festival 
+from app.models.festival_models import Festival, FestivalArchive
 from app.models.market_models import MarketProduct 
 from app.models.recommend_models import RecommendTourInfo
+from app.services.personalize_service import apply_favorite_to_taste
 
 class FavoriteService:
     """찜 기능 관련 비즈니스 로직을 처리하는 서비스 클래스"""
@@ -40,8 +41,9 @@ class FavoriteService:
         ).first()
 
         if favorite:
-            # 찜 해제
+            # 찜 해제 (취향 벡터도 같은 트랜잭션으로 차감)
             self.db.delete(favorite)
+            apply_favorite_to_taste(self.db, user_id, request.item_type, item, delta=-1)
             self.db.commit()
             return {"message": "Favorite removed successfully.", "is_added": False}
         else:
@@ -54,6 +56,7 @@ class FavoriteService:
             self.db.add(new_favorite)
             try:	
                 self.db.add(new_favorite)	
+                apply_favorite_to_taste(self.db, user_id, request.item_type, item, delta=1)
                 self.db.commit()	
                 return {"message": "Favorite added successfully.", "is_added": True}	
             except Exception:	
@@ -81,6 +84,11 @@ class FavoriteService:
         # 축제 
         festival_ids_str = [i for i in favs_by_type["FESTIVAL"]]
         festivals_data = self.db.query(Festival).filter(Festival.contentid.in_(festival_ids_str)).all()
+        # 종료 후 아카이브된 축제도 찜 목록에는 계속 보여줍니다.
+        found_ids = {str(f.contentid) for f in festivals_data}
+        archived_ids = [i for i in festival_ids_str if str(i) not in found_ids]
+        if archived_ids:
+            festivals_data += self.db.query(FestivalArchive).filter(FestivalArchive.contentid.in_(archived_ids)).all()
         
         # 마켓 상품
         product_ids_int = [int(i) for i in favs_by_type["PRODUCT"] if str(i).isdigit()]
@@ -111,7 +119,11 @@ class FavoriteService:
             return None # 숫자가 아닌 경우 유효하지 않은 ID로 처리
         """DB에서 해당 항목이 실제로 존재하는지 확인합니다."""
         if item_type == "FESTIVAL":
-            return self.db.query(Festival).filter(Festival.contentid == item_id).first()
+            # 아카이브된 축제도 찜 해제가 가능해야 하므로 함께 확인합니다.
+            return (
+                self.db.query(Festival).filter(Festival.contentid == item_id).first()
+                or self.db.query(FestivalArchive).filter(FestivalArchive.contentid == item_id).first()
+            )
         elif item_type == "PRODUCT":
             return self.db.query(MarketProduct).filter(MarketProduct.id == int(item_id)).first()
         elif item_type == "SPOT":
@@ -0,0 +1,110 @@
+# app/services/festival_archive_service.py
+
+from __future__ import annotations
+import datetime
+from typing import Iterable, List, Optional, Set
+
+from sqlalchemy import select, insert, delete, func
+from sqlalchemy.orm import Session
+
+from app.models.festival_models import Festival, FestivalArchive, FESTIVAL_ARCHIVE_COLUMNS
+from app.services.catalog_change_service import record_catalog_changes, OP_UPSERT, OP_DELETE
+from app.services.catalog_version_service import bump_catalog_version, ENTITY_FESTIVAL
+
+
+def archive_cutoff(retention_days: int, today: datetime.date = None) -> str:
+    """종료일이 이 값(YYYYMMDD)보다 이전인 축제가 아카이브 대상입니다."""
+    today = today or datetime.date.today()
+    return (today - datetime.timedelta(days=retention_days)).strftime("%Y%m%d")
+
+
+def ended_before(end_date: Optional[str], cutoff: str) -> bool:
+    """종료일(YYYYMMDD)이 cutoff보다 이전인지. _ended_before와 같은 기준 (비어 있거나 형식이 다르면 False)"""
+    return bool(end_date) and len(end_date) == 8 and end_date < cutoff
+
+
+def _ended_before(cutoff: str):
+    # 종료일이 비어 있거나 형식이 다른 행은 대상에서 제외 ('' < cutoff 가 참이 되는 것을 방지)
+    return (
+        Festival.event_end_date.isnot(None),
+        func.length(Festival.event_end_date) == 8,
+        Festival.event_end_date < cutoff,
+    )
+
+
+def count_archivable(db: Session, cutoff: str) -> int:
+    return db.execute(select(func.count(Festival.id)).where(*_ended_before(cutoff))).scalar() or 0
+
+
+def archive_batch(db: Session, cutoff: str, batch_size: int) -> int:
+    """
+    종료된 축제 batch_size건을 festivals_archive로 옮기고 커밋합니다. 옮긴 건수를 반환합니다.
+    복사 → 삭제 → 변경 로그(삭제) → 카탈로그 버전 증가를 하나의 트랜잭션으로 처리하므로,
+    중간에 실패해도 두 테이블 중 한쪽에만 남는 일이 없습니다.
+    """
+    rows = db.execute(
+        select(Festival.id, Festival.contentid)
+        .where(*_ended_before(cutoff))
+        .order_by(Festival.id)
+        .limit(batch_size)
+    ).all()
+    if not rows:
+        return 0
+
+    ids = [r.id for r in rows]
+    columns = [getattr(Festival, name) for name in FESTIVAL_ARCHIVE_COLUMNS]
+    try:
+        db.execute(
+            insert(FestivalArchive).from_select(list(FESTIVAL_ARCHIVE_COLUMNS), select(*columns).where(Festival.id.in_(ids)))
+        )
+        db.execute(delete(Festival).where(Festival.id.in_(ids)))
+        record_catalog_changes(db, ENTITY_FESTIVAL, [r.contentid for r in rows], op=OP_DELETE)
+        bump_catalog_version(db, ENTITY_FESTIVAL)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(ids)
+
+
+def unarchive_festivals(db: Session, contentids: Iterable[str]) -> List[str]:
+    """
+    아카이브된 축제를 같은 id로 festivals에 되돌립니다. 커밋하지 않으며, 되돌린 contentid 목록을 반환합니다.
+    동기화가 같은 contentid의 새 회차(다음 해 축제)를 저장하기 전에 같은 트랜잭션에서 호출합니다.
+    """
+    rows = db.execute(
+        select(FestivalArchive.id, FestivalArchive.contentid).where(FestivalArchive.contentid.in_(list(contentids)))
+    ).all()
+    if not rows:
+        return []
+
+    ids = [r.id for r in rows]
+    columns = [getattr(FestivalArchive, name) for name in FESTIVAL_ARCHIVE_COLUMNS]
+    db.execute(
+        insert(Festival).from_select(list(FESTIVAL_ARCHIVE_COLUMNS), select(*columns).where(FestivalArchive.id.in_(ids)))
+    )
+    db.execute(delete(FestivalArchive).where(FestivalArchive.id.in_(ids)))
+    return [str(r.contentid) for r in rows]
+
+
+def restore_festivals(db: Session, contentids: List[str]) -> int:
+    """아카이브된 축제를 festivals로 되돌리고 커밋합니다. 되돌린 건수를 반환합니다."""
+    try:
+        restored = unarchive_festivals(db, contentids)
+        if not restored:
+            return 0
+        record_catalog_changes(db, ENTITY_FESTIVAL, restored, op=OP_UPSERT)
+        bump_catalog_version(db, ENTITY_FESTIVAL)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(restored)
+
+
+def archived_content_ids(db: Session) -> Set[str]:
+    """
+    아카이브된 축제의 contentid 집합. 동기화 스크립트는 여기에 있는 항목 중
+    종료일이 아직 아카이브 기준보다 이전인 것만 건너뛰고, 새 회차는 되돌린 뒤 저장합니다.
+    """
+    return {str(cid) for cid in db.execute(select(FestivalArchive.contentid)).scalars().all()}
@@ -0,0 +1,114 @@
+# app/services/geo_index_service.py
+
+from __future__ import annotations
+import datetime
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.services.catalog_snapshot import (
+    catalog_snapshot, CatalogSnapshot, KIND_SPOT, KIND_FESTIVAL, KIND_NAMES, is_older_key
+)
+
+# 한 번에 내려줄 수 있는 최대 항목 수 (전국 단위 화면은 /map/clusters 사용)
+MAX_BBOX_ITEMS = 20000
+
+
+@dataclass
+class BBoxIndex:
+    """
+    위도 기준으로 정렬한 좌표 배열.
+    bbox 조회 시 위도 범위는 이진 탐색(searchsorted)으로 자르고, 그 구간 안에서만 경도를 비교합니다.
+    """
+    key: Tuple[Any, datetime.date]
+    rows: np.ndarray   # int32, 스냅샷 행 번호 (위도 오름차순)
+    lat: np.ndarray    # float64, 정렬된 위도
+    lon: np.ndarray    # float64
+    kind: np.ndarray   # uint8
+
+
+def build_bbox_index(snapshot: CatalogSnapshot, today: datetime.date) -> BBoxIndex:
+    today_int = today.year * 10000 + today.month * 100 + today.day
+    visible = np.flatnonzero((snapshot.kind == KIND_SPOT) | (snapshot.end_date >= today_int))
+    order = visible[np.argsort(snapshot.lat[visible], kind="stable")]
+    return BBoxIndex(
+        key=(snapshot.version, today),
+        rows=order.astype(np.int32),
+        lat=snapshot.lat[order],
+        lon=snapshot.lon[order],
+        kind=snapshot.kind[order].astype(np.uint8),
+    )
+
+
+class GeoIndexHolder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index: Optional[BBoxIndex] = None
+
+    def get(self, db: Session) -> Tuple[CatalogSnapshot, BBoxIndex]:
+        snapshot = catalog_snapshot.get(db)
+        key = (snapshot.version, datetime.date.today())
+        index = self._index
+        if index is None or index.key != key:
+            with self._lock:
+                current = self._index
+                if current is not None and current.key == key:
+                    index = current
+                else:
+                    index = build_bbox_index(snapshot, key[1])
+                    # 늦게 도착한 요청이 더 새 인덱스를 옛 버전으로 되돌리지 않도록 함
+                    if current is None or not is_older_key(key, current.key):
+                        self._index = index
+        return snapshot, index
+
+
+geo_index = GeoIndexHolder()
+
+
+def query_bbox(
+    db: Session,
+    sw_lat: float,
+    sw_lng: float,
+    ne_lat: float,
+    ne_lng: float,
+    item_type: str = "ALL",
+    limit: int = MAX_BBOX_ITEMS,
+) -> Dict[str, Any]:
+    """
+    bbox 안의 여행지/축제를 열(column) 배열로 반환합니다.
+    - ids: contentid 목록, lat/lon: float32 배열, type: uint8 배열 (0=SPOT, 1=FESTIVAL)
+    항목이 limit보다 많으면 위도순 인덱스에서 일정 간격으로 골라(truncated=True, total=전체 개수)
+    화면의 남쪽 일부만 잘려 보이지 않고 영역 전체에 고르게 퍼지도록 합니다.
+    응답 직렬화(JSON/MessagePack)는 라우터에서 담당합니다.
+    """
+    snapshot, index = geo_index.get(db)
+
+    lo = np.searchsorted(index.lat, sw_lat, side="left")
+    hi = np.searchsorted(index.lat, ne_lat, side="right")
+    lon = index.lon[lo:hi]
+    mask = (lon >= sw_lng) & (lon <= ne_lng)
+    if item_type == "SPOT":
+        mask &= index.kind[lo:hi] == KIND_SPOT
+    elif item_type == "FESTIVAL":
+        mask &= index.kind[lo:hi] == KIND_FESTIVAL
+
+    hit = np.flatnonzero(mask) + lo
+    total = int(hit.size)
+    truncated = total > limit
+    if truncated:
+        hit = hit[np.linspace(0, total - 1, limit).astype(np.int64)]
+    rows = index.rows[hit]
+
+    return {
+        "count": int(hit.size),
+        "total": total,
+        "truncated": bool(truncated),
+        "types": {str(k): v for k, v in KIND_NAMES.items()},
+        "ids": snapshot.contentid[rows].tolist(),
+        "lat": index.lat[hit].astype(np.float32),
+        "lon": index.lon[hit].astype(np.float32),
+        "type": index.kind[hit],
+    }
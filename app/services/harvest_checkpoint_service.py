@@ -0,0 +1,48 @@
+# app/services/harvest_checkpoint_service.py
+
+from __future__ import annotations
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.sync_models import HarvestCheckpoint
+
+
+def shard_key(area_code: str, content_type_id: str) -> str:
+    return f"{area_code}:{content_type_id}"
+
+
+def load_harvest_checkpoints(db: Session) -> Dict[str, HarvestCheckpoint]:
+    return {row.shard: row for row in db.query(HarvestCheckpoint).all()}
+
+
+def reset_harvest_checkpoints(db: Session, keys: Iterable[str]) -> int:
+    """주어진 샤드들의 진행 상황을 지워 1페이지부터 다시 수집하게 합니다."""
+    keys = list(keys)
+    if not keys:
+        return 0
+    deleted = db.query(HarvestCheckpoint).filter(HarvestCheckpoint.shard.in_(keys)).delete(synchronize_session=False)
+    db.commit()
+    return deleted
+
+
+def save_harvest_checkpoint(
+    db: Session,
+    key: str,
+    area_code: str,
+    content_type_id: str,
+    next_page: int,
+    total_count: Optional[int],
+    done: bool,
+) -> None:
+    """
+    샤드 진행 상황을 기록합니다. 커밋하지 않으므로, 해당 페이지 데이터를 저장한 트랜잭션과 함께 커밋해야
+    '저장됐는데 체크포인트는 그대로'이거나 그 반대인 상태가 생기지 않습니다.
+    """
+    row = db.get(HarvestCheckpoint, key)
+    if row is None:
+        row = HarvestCheckpoint(shard=key, area_code=area_code, content_type_id=content_type_id)
+        db.add(row)
+    row.next_page = next_page
+    row.total_count = total_count
+    row.done = done
@@ -0,0 +1,340 @@
+# app/services/job_service.py
+
+from __future__ import annotations
+import abc
+import asyncio
+import ipaddress
+import json
+import socket
+import time
+import uuid
+import traceback
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import get_settings
+from app.db.database import SessionLocal
+
+settings = get_settings()
+
+# 작업 상태 값 (FE와 공유하는 문자열)
+JOB_PENDING = "PENDING"
+JOB_RUNNING = "RUNNING"
+JOB_DONE = "DONE"
+JOB_FAILED = "FAILED"
+
+
+@dataclass
+class ChatbotJob:
+    """
+    비동기 챗봇 처리 요청 1건의 상태를 담는 객체
+    """
+    id: str
+    message: str
+    status: str = JOB_PENDING
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    callback_url: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChatbotJob":
+        return cls(**data)
+
+
+# =========================================================
+# 1. 작업 저장소 (In-memory + 교체 가능한 영속 백엔드)
+# =========================================================
+class JobStoreBackend(abc.ABC):
+    """
+    작업 상태를 영속화하는 백엔드 인터페이스.
+    여러 워커 프로세스가 결과를 공유하거나 재시작 후에도 조회가 필요할 때 구현체를 연결합니다.
+    구현체는 동기 I/O를 해도 되며, JobStore가 스레드에서 호출합니다.
+    """
+    @abc.abstractmethod
+    def save(self, job: ChatbotJob) -> None:
+        ...
+
+    @abc.abstractmethod
+    def load(self, job_id: str) -> Optional[ChatbotJob]:
+        ...
+
+
+class DatabaseJobBackend(JobStoreBackend):
+    """
+    chatbot_jobs 테이블에 작업 상태를 JSON으로 저장하는 백엔드
+    """
+    def save(self, job: ChatbotJob) -> None:
+        from app.models.job_models import ChatbotJobRecord
+
+        db = SessionLocal()
+        try:
+            record = db.get(ChatbotJobRecord, job.id)
+            payload = json.dumps(job.to_dict(), ensure_ascii=False)
+            if record:
+                record.status = job.status
+                record.payload = payload
+            else:
+                db.add(ChatbotJobRecord(id=job.id, status=job.status, payload=payload))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def load(self, job_id: str) -> Optional[ChatbotJob]:
+        from app.models.job_models import ChatbotJobRecord
+
+        db = SessionLocal()
+        try:
+            record = db.get(ChatbotJobRecord, job_id)
+            if not record:
+                return None
+            return ChatbotJob.from_dict(json.loads(record.payload))
+        finally:
+            db.close()
+
+
+class JobStore:
+    """
+    최근 작업을 메모리에 보관하고, 백엔드가 설정된 경우 write-through로 함께 저장합니다.
+    메모리는 최대 개수(max_jobs)를 넘으면 오래된 작업부터 제거합니다.
+    백엔드 호출(DB 세션 등 동기 I/O)은 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    """
+    def __init__(self, backend: Optional[JobStoreBackend] = None, max_jobs: int = 10000):
+        self.backend = backend
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, ChatbotJob]" = OrderedDict()
+
+    async def save(self, job: ChatbotJob) -> None:
+        self._jobs[job.id] = job
+        self._jobs.move_to_end(job.id)
+        while len(self._jobs) > self.max_jobs:
+            self._jobs.popitem(last=False)
+
+        if self.backend:
+            try:
+                await asyncio.to_thread(self.backend.save, job)
+            except Exception as e:
+                print(f"⚠️ 작업 상태 영속화 실패 (job={job.id}): {e}")
+
+    async def get(self, job_id: str) -> Optional[ChatbotJob]:
+        job = self._jobs.get(job_id)
+        if job is None and self.backend:
+            job = await asyncio.to_thread(self.backend.load, job_id)
+        return job
+
+
+def _build_backend() -> Optional[JobStoreBackend]:
+    if settings.CHATBOT_JOB_BACKEND == "db":
+        return DatabaseJobBackend()
+    return None
+
+
+job_store = JobStore(backend=_build_backend())
+
+
+# =========================================================
+# 2. 백그라운드 워커 풀
+# =========================================================
+def _serialize_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """서비스 결과(TourInfoOut 리스트 포함)를 JSON 직렬화 가능한 dict로 변환"""
+    recommendations = []
+    for item in result.get("db_recommendations", []):
+        recommendations.append(item.model_dump() if hasattr(item, "model_dump") else item)
+    return {
+        "response": result.get("ai_response_text", ""),
+        "recommendations": recommendations,
+    }
+
+
+class ChatbotJobQueue:
+    """
+    챗봇 턴을 큐에 쌓아두고 고정 개수의 워커가 순서대로 처리합니다.
+    큐 크기가 제한되어 있어 순간적인 트래픽 폭주 시에도 열린 HTTP 요청이 쌓이지 않습니다.
+    """
+    def __init__(self, store: JobStore, workers: int = 4, max_queue: int = 1000):
+        self.store = store
+        self.workers = workers
+        self.max_queue = max_queue
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        print(f"챗봇 작업 워커 {self.workers}개 시작 (큐 크기: {self.max_queue})")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, message: str, callback_url: Optional[str] = None) -> ChatbotJob:
+        """
+        새 작업을 등록합니다. 큐가 가득 차 있으면 asyncio.QueueFull을 발생시킵니다.
+        callback_url은 validate_callback_url을 통과한 값이어야 합니다.
+        """
+        if not self.running:
+            self.start()
+        if self._queue.full():
+            raise asyncio.QueueFull
+
+        # 워커가 꺼내기 전에 PENDING 상태가 먼저 저장되도록 저장 후 큐에 넣음
+        job = ChatbotJob(id=uuid.uuid4().hex, message=message, callback_url=callback_url)
+        await self.store.save(job)
+        try:
+            self._queue.put_nowait(job.id)
+        except asyncio.QueueFull:
+            # 저장하는 사이 큐가 가득 찬 경우
+            job.status = JOB_FAILED
+            job.error = "요청이 많아 작업을 등록하지 못했습니다."
+            job.finished_at = time.time()
+            await self.store.save(job)
+            raise
+        return job
+
+    async def _worker(self, worker_no: int) -> None:
+        # 한 작업에서 난 오류(저장소 DB 장애 등)로 워커가 끝나면 풀이 줄고 남은 작업이 대기 상태로 남으므로,
+        # 작업마다 오류를 잡아 기록하고 항상 task_done을 호출한 뒤 다음 작업을 받습니다.
+        while True:
+            job_id = await self._queue.get()
+            job: Optional[ChatbotJob] = None
+            try:
+                job = await self.store.get(job_id)
+                if job is None:
+                    continue
+                await self._process(job, worker_no)
+            except Exception as e:
+                print(f"🔥 챗봇 작업 워커 오류 (worker={worker_no}, job={job_id}): {e}")
+                traceback.print_exc()
+                if job is not None:
+                    await self._mark_failed(job)
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, job: ChatbotJob, worker_no: int) -> None:
+        # 서비스 모듈은 OpenAI 클라이언트를 초기화하므로 처음 사용할 때 임포트합니다.
+        from app.services.recommend_service import get_chatbot_search_keywords_and_recommendations
+
+        job.status = JOB_RUNNING
+        await self.store.save(job)
+
+        # 요청 스코프의 세션은 이미 닫혔으므로 워커가 별도 세션을 사용합니다.
+        db = SessionLocal()
+        try:
+            result = await get_chatbot_search_keywords_and_recommendations(job.message, db)
+            job.result = _serialize_result(result)
+            job.status = JOB_DONE
+        except Exception as e:
+            print(f"🔥 챗봇 작업 처리 오류 (worker={worker_no}, job={job.id}): {e}")
+            traceback.print_exc()
+            job.error = getattr(e, "detail", None) or "챗봇 서비스 처리 중 오류가 발생했습니다."
+            job.status = JOB_FAILED
+        finally:
+            db.close()
+
+        job.finished_at = time.time()
+        await self.store.save(job)
+
+        if job.callback_url:
+            await _notify_webhook(job)
+
+    async def _mark_failed(self, job: ChatbotJob) -> None:
+        """처리 도중 저장소 오류 등으로 끝난 작업을 실패로 기록합니다 (저장도 실패하면 로그만 남김)."""
+        job.status = JOB_FAILED
+        job.error = job.error or "챗봇 작업 처리 중 오류가 발생했습니다."
+        job.finished_at = time.time()
+        try:
+            await self.store.save(job)
+        except Exception as e:
+            print(f"🔥 챗봇 작업 실패 상태 저장 오류 (job={job.id}): {e}")
+
+
+# =========================================================
+# 3. 완료 웹훅 (허용된 호스트로만 전송)
+# =========================================================
+def _allowed_webhook_hosts() -> List[str]:
+    return [h.strip().lower() for h in settings.CHATBOT_JOB_WEBHOOK_ALLOWED_HOSTS.split(",") if h.strip()]
+
+
+def _is_public_address(address: str) -> bool:
+    """사설망, 루프백, 링크 로컬(169.254.x.x 메타데이터 등), 예약 대역이 아닌 공인 주소인지"""
+    try:
+        return ipaddress.ip_address(address.split("%", 1)[0]).is_global
+    except ValueError:
+        return False
+
+
+def validate_callback_url(url: str) -> str:
+    """
+    비동기 챗봇 요청의 callback_url을 검사합니다. 서버가 임의 주소로 요청을 보내지 않도록
+    https 이면서 CHATBOT_JOB_WEBHOOK_ALLOWED_HOSTS에 등록된 호스트만 허용합니다 (목록이 비어 있으면 웹훅 사용 불가).
+    허용되지 않으면 ValueError를 발생시킵니다.
+    """
+    allowed = _allowed_webhook_hosts()
+    if not allowed:
+        raise ValueError("이 서버에서는 callback_url을 사용할 수 없습니다.")
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        raise ValueError("callback_url 형식이 올바르지 않습니다.")
+    host = (parts.hostname or "").lower()
+    if parts.scheme != "https" or not host or parts.username or parts.password:
+        raise ValueError("callback_url은 https 주소여야 합니다.")
+    if host not in allowed:
+        raise ValueError("허용되지 않은 callback_url 호스트입니다.")
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        pass
+    else:
+        if not _is_public_address(host):
+            raise ValueError("사설/내부 주소로는 callback_url을 보낼 수 없습니다.")
+    if port not in (None, 443):
+        raise ValueError("callback_url은 기본 https 포트(443)만 사용할 수 있습니다.")
+    return url
+
+
+async def _resolves_to_public(host: str) -> bool:
+    """전송 직전에 호스트를 다시 조회해, 허용된 이름이 내부 주소를 가리키게 바뀐 경우를 막습니다."""
+    loop = asyncio.get_running_loop()
+    infos = await loop.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+    return bool(infos) and all(_is_public_address(info[4][0]) for info in infos)
+
+
+async def _notify_webhook(job: ChatbotJob) -> None:
+    """작업 완료 시 callback_url로 결과를 POST 합니다. 실패해도 작업 결과에는 영향을 주지 않습니다."""
+    try:
+        validate_callback_url(job.callback_url)
+        if not await _resolves_to_public(urlsplit(job.callback_url).hostname):
+            print(f"⚠️ 웹훅 전송 거부: 내부 주소로 해석되는 호스트 (job={job.id}, url={job.callback_url})")
+            return
+        async with httpx.AsyncClient(timeout=settings.CHATBOT_JOB_WEBHOOK_TIMEOUT, follow_redirects=False) as client:
+            await client.post(job.callback_url, json=job.to_dict())
+    except Exception as e:
+        print(f"⚠️ 웹훅 전송 실패 (job={job.id}, url={job.callback_url}): {e}")
+
+
+chatbot_job_queue = ChatbotJobQueue(
+    job_store,
+    workers=settings.CHATBOT_JOB_WORKERS,
+    max_queue=settings.CHATBOT_JOB_MAX_QUEUE,
+)
@@ -0,0 +1,182 @@
+# app/services/map_cluster_service.py
+
+from __future__ import annotations
+import datetime
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.services.catalog_snapshot import (
+    catalog_snapshot, CatalogSnapshot, KIND_SPOT, KIND_FESTIVAL, KIND_NAMES, is_older_key
+)
+
+# 지도 레벨 범위 (TourAPI mlevel과 같은 척도: 1이 가장 확대, 14가 전국 단위)
+MIN_LEVEL = 1
+MAX_LEVEL = 14
+# 레벨 1의 격자 크기(도). 레벨이 1 오를 때마다 2배씩 커집니다. (레벨 14 ≈ 16도)
+BASE_CELL_DEG = 0.002
+# 클러스터마다 함께 내려줄 대표 항목 수 (인기순)
+REPRESENTATIVES_PER_CELL = 3
+
+CLUSTER_TYPES = ("ALL", "SPOT", "FESTIVAL")
+
+
+def cell_size(level: int) -> float:
+    return BASE_CELL_DEG * (2 ** (level - 1))
+
+
+@dataclass
+class ClusterLevel:
+    """한 지도 레벨의 격자 집계 결과 (셀 단위 열 배열)"""
+    cell_deg: float
+    ix: np.ndarray              # int32, floor(lon / cell_deg)
+    iy: np.ndarray              # int32, floor(lat / cell_deg)
+    count: np.ndarray           # int32
+    spot_count: np.ndarray      # int32
+    festival_count: np.ndarray  # int32
+    lat: np.ndarray             # float64, 셀에 속한 항목들의 무게중심
+    lon: np.ndarray
+    representatives: np.ndarray # int32 (cells, REPRESENTATIVES_PER_CELL), 스냅샷 행 번호 (-1: 없음)
+
+
+def _build_level(snapshot: CatalogSnapshot, rows: np.ndarray, level: int) -> ClusterLevel:
+    deg = cell_size(level)
+    ix = np.floor(snapshot.lon[rows] / deg).astype(np.int64)
+    iy = np.floor(snapshot.lat[rows] / deg).astype(np.int64)
+
+    # (ix, iy)를 하나의 정수 키로 합쳐 그룹화
+    keys = (ix << 32) | (iy & 0xFFFFFFFF)
+    unique_keys, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    n_cells = unique_keys.size
+
+    kinds = snapshot.kind[rows]
+    spot_count = np.bincount(inverse, weights=(kinds == KIND_SPOT), minlength=n_cells).astype(np.int32)
+    festival_count = np.bincount(inverse, weights=(kinds == KIND_FESTIVAL), minlength=n_cells).astype(np.int32)
+    lat = np.bincount(inverse, weights=snapshot.lat[rows], minlength=n_cells) / counts
+    lon = np.bincount(inverse, weights=snapshot.lon[rows], minlength=n_cells) / counts
+
+    # 셀 → 인기순으로 정렬한 뒤 각 셀의 앞쪽 N개를 대표 항목으로 사용
+    order = np.lexsort((-snapshot.popularity[rows], inverse))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    representatives = np.full((n_cells, REPRESENTATIVES_PER_CELL), -1, dtype=np.int32)
+    for j in range(REPRESENTATIVES_PER_CELL):
+        has = counts > j
+        representatives[has, j] = rows[order[starts[has] + j]]
+
+    return ClusterLevel(
+        cell_deg=deg,
+        ix=(unique_keys >> 32).astype(np.int32),
+        iy=(unique_keys & 0xFFFFFFFF).astype(np.uint32).astype(np.int32),
+        count=counts.astype(np.int32),
+        spot_count=spot_count,
+        festival_count=festival_count,
+        lat=lat,
+        lon=lon,
+        representatives=representatives,
+    )
+
+
+def build_cluster_pyramid(snapshot: CatalogSnapshot, today: datetime.date) -> Dict[str, List[ClusterLevel]]:
+    """
+    타입(ALL/SPOT/FESTIVAL)별로 레벨 1~14의 격자 집계를 미리 만들어 둡니다.
+    종료된 축제는 지도에 표시하지 않으므로 제외합니다.
+    """
+    today_int = today.year * 10000 + today.month * 100 + today.day
+    visible = (snapshot.kind == KIND_SPOT) | (snapshot.end_date >= today_int)
+    masks = {
+        "ALL": visible,
+        "SPOT": visible & (snapshot.kind == KIND_SPOT),
+        "FESTIVAL": visible & (snapshot.kind == KIND_FESTIVAL),
+    }
+
+    pyramid = {}
+    for cluster_type, mask in masks.items():
+        rows = np.flatnonzero(mask)
+        if rows.size == 0:
+            pyramid[cluster_type] = []
+            continue
+        pyramid[cluster_type] = [_build_level(snapshot, rows, level) for level in range(MIN_LEVEL, MAX_LEVEL + 1)]
+    return pyramid
+
+
+class ClusterIndex:
+    """
+    카탈로그 스냅샷에서 만든 레벨별 클러스터 피라미드를 보관합니다.
+    스냅샷 버전(동기화 후 변경)이나 날짜가 바뀌면 다음 요청 때 다시 만듭니다.
+    피라미드는 만든 스냅샷과 한 튜플로 묶어 한 번에 교체하므로, 호출자는 항상 짝이 맞는 두 값을 받습니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (키, 스냅샷, 피라미드)
+        self._entry: Optional[Tuple[Tuple[Any, datetime.date], CatalogSnapshot, Dict[str, List[ClusterLevel]]]] = None
+
+    def get(self, db: Session) -> Tuple[CatalogSnapshot, Dict[str, List[ClusterLevel]]]:
+        snapshot = catalog_snapshot.get(db)
+        key = (snapshot.version, datetime.date.today())
+        entry = self._entry
+        if entry is None or entry[0] != key:
+            with self._lock:
+                entry = self._entry
+                # 더 새 버전으로 이미 만들어져 있으면(늦게 도착한 요청) 그것을 그대로 사용
+                if entry is None or (entry[0] != key and not is_older_key(key, entry[0])):
+                    entry = (key, snapshot, build_cluster_pyramid(snapshot, key[1]))
+                    self._entry = entry
+                    print(f"지도 클러스터 피라미드 갱신 완료 (version={snapshot.version})")
+        return entry[1], entry[2]
+
+
+cluster_index = ClusterIndex()
+
+
+def _item_payload(snapshot: CatalogSnapshot, row: int) -> Dict[str, Any]:
+    return {
+        "type": KIND_NAMES[int(snapshot.kind[row])],
+        "contentid": snapshot.contentid[row],
+        "title": snapshot.title[row],
+        "image_url": snapshot.image_url[row],
+        "lat": float(snapshot.lat[row]),
+        "lng": float(snapshot.lon[row]),
+    }
+
+
+def get_map_clusters(
+    db: Session,
+    sw_lat: float,
+    sw_lng: float,
+    ne_lat: float,
+    ne_lng: float,
+    level: int,
+    cluster_type: str = "ALL",
+) -> Dict[str, Any]:
+    """
+    화면 영역(bbox)에 걸치는 격자 셀들의 클러스터를 반환합니다.
+    요청 시에는 미리 만든 레벨 배열에서 셀 범위만 필터링하므로 항목 수와 무관하게 빠릅니다.
+    """
+    snapshot, pyramid = cluster_index.get(db)
+    levels = pyramid.get(cluster_type) or []
+    if not levels:
+        return {"level": level, "cell_deg": cell_size(level), "clusters": []}
+
+    grid = levels[level - MIN_LEVEL]
+    ix_min, ix_max = int(np.floor(sw_lng / grid.cell_deg)), int(np.floor(ne_lng / grid.cell_deg))
+    iy_min, iy_max = int(np.floor(sw_lat / grid.cell_deg)), int(np.floor(ne_lat / grid.cell_deg))
+    in_view = np.flatnonzero(
+        (grid.ix >= ix_min) & (grid.ix <= ix_max) & (grid.iy >= iy_min) & (grid.iy <= iy_max)
+    )
+
+    clusters = []
+    for c in in_view:
+        reps = [int(r) for r in grid.representatives[c] if r >= 0]
+        clusters.append({
+            "lat": round(float(grid.lat[c]), 6),
+            "lng": round(float(grid.lon[c]), 6),
+            "count": int(grid.count[c]),
+            "spot_count": int(grid.spot_count[c]),
+            "festival_count": int(grid.festival_count[c]),
+            "items": [_item_payload(snapshot, r) for r in reps],
+        })
+
+    return {"level": level, "cell_deg": grid.cell_deg, "clusters": clusters}
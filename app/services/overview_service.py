@@ -0,0 +1,120 @@
+# app/services/overview_service.py
+
+from __future__ import annotations
+import datetime
+import html
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from app.db.bulk import bulk_upsert
+from app.models.recommend_models import RecommendTourInfo, RecommendTourOverview
+from app.services.sync_diff import content_hash, INSERTED, UPDATED, UNCHANGED
+
+_BR = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_TAG = re.compile(r"<[^>]+>")
+_SPACES = re.compile(r"[ \t\r\f\v\xa0]+")
+
+
+def clean_overview(raw: Optional[str]) -> Optional[str]:
+    """TourAPI 개요의 HTML(<br>, 태그, 엔티티)을 걷어 내고 공백을 정리합니다."""
+    if not raw:
+        return None
+    text = html.unescape(_TAG.sub("", _BR.sub("\n", raw)))
+    lines = [_SPACES.sub(" ", line).strip() for line in text.split("\n")]
+    text = "\n".join(line for line in lines if line)
+    return text or None
+
+
+def stale_overview_targets(
+    db: Session, max_age_days: int = 0, limit: Optional[int] = None
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    개요를 (다시) 받아야 하는 여행지의 (contentid, modifiedtime) 목록.
+    - 개요가 아직 없는 여행지 (먼저 반환)
+    - 개요를 받은 뒤 여행지가 수정된 경우 (source_modified < modifiedtime)
+    - max_age_days > 0이면 그보다 오래전에 받은 개요
+    """
+    conditions = [
+        RecommendTourOverview.contentid.is_(None),
+        and_(RecommendTourOverview.source_modified.is_(None), RecommendTourInfo.modifiedtime.isnot(None)),
+        RecommendTourOverview.source_modified < RecommendTourInfo.modifiedtime,
+    ]
+    if max_age_days > 0:
+        cutoff = datetime.datetime.now() - datetime.timedelta(days=max_age_days)
+        conditions.append(RecommendTourOverview.fetched_at < cutoff)
+
+    query = (
+        select(RecommendTourInfo.contentid, RecommendTourInfo.modifiedtime)
+        .outerjoin(RecommendTourOverview, RecommendTourOverview.contentid == RecommendTourInfo.contentid)
+        .where(or_(*conditions))
+        .order_by(RecommendTourOverview.contentid.isnot(None), RecommendTourInfo.contentid)
+    )
+    if limit:
+        query = query.limit(limit)
+    return [(str(cid), mtime) for cid, mtime in db.execute(query).all()]
+
+
+class OverviewState:
+    """저장된 개요의 contentid → content_hash 맵. 본문이 그대로인 개요는 다시 쓰지 않도록 비교합니다."""
+    def __init__(self, db: Session):
+        rows = db.execute(select(RecommendTourOverview.contentid, RecommendTourOverview.content_hash)).all()
+        self._hashes: Dict[str, Optional[str]] = {str(cid): digest for cid, digest in rows}
+        self.counts = {INSERTED: 0, UPDATED: 0, UNCHANGED: 0}
+
+    def classify(self, row: Dict[str, Any]) -> str:
+        contentid = row["contentid"]
+        digest = content_hash({"overview": row["overview"]})
+        row["content_hash"] = digest
+        if contentid not in self._hashes:
+            status = INSERTED
+        elif self._hashes[contentid] == digest:
+            status = UNCHANGED
+        else:
+            status = UPDATED
+        self._hashes[contentid] = digest
+        self.counts[status] += 1
+        return status
+
+    def summary(self) -> str:
+        return f"신규 {self.counts[INSERTED]}건, 변경 {self.counts[UPDATED]}건, 변경 없음 {self.counts[UNCHANGED]}건"
+
+
+def overview_row(contentid: str, detail: Dict[str, Any], source_modified: Optional[str]) -> Dict[str, Any]:
+    return {
+        "contentid": str(contentid),
+        "overview": clean_overview(detail.get("overview")),
+        "source_modified": source_modified,
+        "fetched_at": datetime.datetime.now(),
+    }
+
+
+def save_overviews(db: Session, state: OverviewState, rows: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    개요 행들을 bulk upsert로 저장합니다. 커밋은 호출하는 쪽에서 합니다.
+    본문이 바뀐 행은 전체 컬럼을, 그대로인 행은 다시 확인했다는 기록(source_modified, fetched_at)만 갱신합니다.
+    """
+    changed, unchanged = [], []
+    for row in rows:
+        (unchanged if state.classify(row) == UNCHANGED else changed).append(row)
+    if changed:
+        bulk_upsert(db, RecommendTourOverview, changed, key="contentid")
+    if unchanged:
+        bulk_upsert(
+            db, RecommendTourOverview, unchanged, key="contentid", update_columns=["source_modified", "fetched_at"]
+        )
+    return {"changed": len(changed), "unchanged": len(unchanged)}
+
+
+def spot_overviews(db: Session, contentids: Iterable[str]) -> Dict[str, str]:
+    """여러 여행지의 개요를 한 번에 조회합니다 (개요가 없는 여행지는 빠짐)."""
+    ids = [str(cid) for cid in contentids]
+    if not ids:
+        return {}
+    rows = db.execute(
+        select(RecommendTourOverview.contentid, RecommendTourOverview.overview)
+        .where(RecommendTourOverview.contentid.in_(ids))
+    ).all()
+    return {str(cid): overview for cid, overview in rows if overview}
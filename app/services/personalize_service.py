@@ -0,0 +1,242 @@
+# app/services/personalize_service.py
+
+from __future__ import annotations
+import json
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.favorite_models import UserFavorite
+from app.models.personalize_models import UserTasteVector, UserRecommendation
+from app.services.catalog_snapshot import (
+    catalog_snapshot, CatalogSnapshot, KIND_SPOT, KIND_FESTIVAL, FESTIVAL_CAT1, FESTIVAL_CAT2
+)
+
+settings = get_settings()
+
+# 특징 그룹별 가중치 (세밀한 분류일수록 크게)
+FEATURE_WEIGHTS = {"cat1": 1.0, "cat2": 1.5, "cat3": 2.0, "geo": 1.0}
+# 지역 특징으로 사용할 위경도 격자 크기(도). 0.5도 ≈ 50km
+GEO_CELL_DEG = 0.5
+# 개인화 점수에 더하는 인기도 가중치 (같은 취향 점수일 때 순서를 정하는 정도)
+W_POPULARITY = 0.1
+
+
+# ====================================================================
+# 1. 항목 특징 추출 / 취향 벡터 증분 갱신 (찜 토글 시)
+# ====================================================================
+
+def _geo_cell(lat: Optional[float], lng: Optional[float]) -> Optional[str]:
+    if lat is None or lng is None:
+        return None
+    return f"{math.floor(lat / GEO_CELL_DEG)},{math.floor(lng / GEO_CELL_DEG)}"
+
+
+def item_features(
+    cat1: Optional[str],
+    cat2: Optional[str],
+    cat3: Optional[str],
+    lat: Optional[float],
+    lng: Optional[float],
+) -> Dict[str, float]:
+    """항목 하나의 특징 → 가중치 dict. 키는 "그룹:값" 형태입니다."""
+    features = {}
+    for group, value in (("cat1", cat1), ("cat2", cat2), ("cat3", cat3), ("geo", _geo_cell(lat, lng))):
+        if value:
+            features[f"{group}:{value}"] = FEATURE_WEIGHTS[group]
+    return features
+
+
+def features_of_item(item_type: str, item: Any) -> Dict[str, float]:
+    """찜 대상 모델 객체(RecommendTourInfo / Festival)에서 특징을 추출합니다. 상품은 반영하지 않습니다."""
+    if item_type == "SPOT":
+        return item_features(item.cat1, item.cat2, item.cat3, item.mapy, item.mapx)
+    if item_type == "FESTIVAL":
+        return item_features(FESTIVAL_CAT1, FESTIVAL_CAT2, None, item.mapy, item.mapx)
+    return {}
+
+
+def apply_favorite_to_taste(db: Session, user_id: int, item_type: str, item: Any, delta: int) -> None:
+    """
+    찜 추가(delta=+1) / 해제(delta=-1)를 사용자 취향 벡터에 반영합니다.
+    commit은 호출한 쪽(FavoriteService)이 찜 기록과 같은 트랜잭션으로 처리합니다.
+    """
+    features = features_of_item(item_type, item)
+    if not features:
+        return
+
+    taste = db.execute(
+        select(UserTasteVector).where(UserTasteVector.user_id == user_id).with_for_update()
+    ).scalar_one_or_none()
+    if taste is None:
+        if delta < 0:
+            return # 취향 벡터 도입 전의 찜을 해제하는 경우
+        taste = UserTasteVector(user_id=user_id, weights="{}", favorite_count=0)
+        db.add(taste)
+
+    weights = json.loads(taste.weights or "{}")
+    for key, value in features.items():
+        new_value = weights.get(key, 0.0) + delta * value
+        if new_value > 1e-9:
+            weights[key] = round(new_value, 4)
+        else:
+            weights.pop(key, None)
+
+    taste.weights = json.dumps(weights, separators=(",", ":"))
+    taste.favorite_count = max(0, (taste.favorite_count or 0) + delta)
+
+
+def rebuild_taste_vector(db: Session, snapshot: CatalogSnapshot, user_id: int) -> Optional[UserTasteVector]:
+    """찜 목록 전체로부터 취향 벡터를 다시 계산합니다. (기존 찜 데이터 백필용)"""
+    favorites = db.execute(
+        select(UserFavorite.item_type, UserFavorite.item_id)
+        .where(UserFavorite.user_id == user_id, UserFavorite.item_type.in_(["SPOT", "FESTIVAL"]))
+    ).all()
+
+    vocab = {idx: code for code, idx in snapshot.cat_vocab.items()}
+    weights: Dict[str, float] = {}
+    count = 0
+    for item_type, item_id in favorites:
+        row = snapshot.row_of(KIND_SPOT if item_type == "SPOT" else KIND_FESTIVAL, str(item_id))
+        if row is None:
+            continue
+        features = item_features(
+            vocab.get(int(snapshot.cat1[row])), vocab.get(int(snapshot.cat2[row])), vocab.get(int(snapshot.cat3[row])),
+            float(snapshot.lat[row]), float(snapshot.lon[row]),
+        )
+        for key, value in features.items():
+            weights[key] = round(weights.get(key, 0.0) + value, 4)
+        count += 1
+
+    if count == 0:
+        return None
+    taste = db.get(UserTasteVector, user_id) or UserTasteVector(user_id=user_id)
+    taste.weights = json.dumps(weights, separators=(",", ":"))
+    taste.favorite_count = count
+    return db.merge(taste)
+
+
+# ====================================================================
+# 2. 배치 점수 계산 (scripts/build_user_recommendations.py)
+# ====================================================================
+
+class TasteScorer:
+    """
+    스냅샷의 여행지(SPOT) 행들에 대해 취향 벡터 점수를 벡터 연산으로 계산합니다.
+    그룹별로 "값 id → 가중치" 조회 테이블을 만들고 배열 인덱싱으로 더하므로, 사용자당 O(여행지 수)입니다.
+    """
+    def __init__(self, snapshot: CatalogSnapshot):
+        self.snapshot = snapshot
+        self.rows = np.flatnonzero(snapshot.kind == KIND_SPOT)
+        self.local_by_id = {snapshot.contentid[r]: i for i, r in enumerate(self.rows)}
+
+        cells = [_geo_cell(float(snapshot.lat[r]), float(snapshot.lon[r])) for r in self.rows]
+        self.geo_vocab: Dict[str, int] = {}
+        self.geo = np.array([self.geo_vocab.setdefault(c, len(self.geo_vocab)) for c in cells], dtype=np.int32)
+        self.columns = {
+            "cat1": (snapshot.cat1[self.rows], snapshot.cat_vocab),
+            "cat2": (snapshot.cat2[self.rows], snapshot.cat_vocab),
+            "cat3": (snapshot.cat3[self.rows], snapshot.cat_vocab),
+            "geo": (self.geo, self.geo_vocab),
+        }
+
+        popularity = snapshot.popularity[self.rows].astype(np.float64)
+        max_pop = float(popularity.max()) if popularity.size else 0.0
+        self.popularity_score = np.log1p(popularity) / np.log1p(max_pop) if max_pop > 0 else np.zeros(self.rows.size)
+
+    def score(self, weights: Dict[str, float], favorite_count: int) -> np.ndarray:
+        tables = {
+            # 마지막 칸은 "값 없음(-1)" 용으로 0을 유지합니다.
+            group: np.zeros(len(vocab) + 1, dtype=np.float64)
+            for group, (_, vocab) in self.columns.items()
+        }
+        for key, value in weights.items():
+            group, _, code = key.partition(":")
+            if group not in self.columns:
+                continue
+            idx = self.columns[group][1].get(code)
+            if idx is not None:
+                tables[group][idx] = value
+
+        score = np.zeros(self.rows.size, dtype=np.float64)
+        for group, (ids, _) in self.columns.items():
+            score += tables[group][ids]
+
+        # 찜 개수 × 특징 가중치 합으로 나누어 0~1 범위로 맞춤
+        score /= max(favorite_count, 1) * sum(FEATURE_WEIGHTS.values())
+        return score + W_POPULARITY * self.popularity_score
+
+    def top_n(self, weights: Dict[str, float], favorite_count: int, exclude: set, n: int) -> List[Dict[str, Any]]:
+        score = self.score(weights, favorite_count)
+        if exclude:
+            excluded = [self.local_by_id[cid] for cid in exclude if cid in self.local_by_id]
+            score[excluded] = -np.inf
+
+        k = min(n, self.rows.size)
+        if k == 0:
+            return []
+        top = np.argpartition(-score, k - 1)[:k]
+        top = top[np.argsort(-score[top])]
+        return [
+            {"contentid": self.snapshot.contentid[self.rows[i]], "score": round(float(score[i]), 4)}
+            for i in top if np.isfinite(score[i])
+        ]
+
+
+def save_user_recommendations(db: Session, user_id: int, items: List[Dict[str, Any]]) -> None:
+    db.merge(UserRecommendation(user_id=user_id, items=json.dumps(items, separators=(",", ":"))))
+
+
+# ====================================================================
+# 3. 조회 (GET /recommend/for-me)
+# ====================================================================
+
+def _spot_payload(snapshot: CatalogSnapshot, row: int, score: Optional[float]) -> Dict[str, Any]:
+    return {
+        "contentid": snapshot.contentid[row],
+        "title": snapshot.title[row],
+        "image_url": snapshot.image_url[row],
+        "address": snapshot.address[row],
+        "lat": float(snapshot.lat[row]),
+        "lng": float(snapshot.lon[row]),
+        "score": score,
+    }
+
+
+def _popular_spots(snapshot: CatalogSnapshot, limit: int) -> List[Dict[str, Any]]:
+    """콜드 스타트용: 찜 개수가 많은 여행지 (동점이면 스냅샷 순서)"""
+    rows = np.flatnonzero(snapshot.kind == KIND_SPOT)
+    k = min(limit, rows.size)
+    if k == 0:
+        return []
+    popularity = snapshot.popularity[rows]
+    top = np.argpartition(-popularity, k - 1)[:k]
+    top = top[np.lexsort((top, -popularity[top]))]
+    return [_spot_payload(snapshot, int(rows[i]), None) for i in top]
+
+
+def get_recommendations_for_user(db: Session, user_id: int, limit: int = 20) -> Dict[str, Any]:
+    """
+    배치가 미리 계산한 결과를 PK 조회 한 번으로 읽어 반환합니다.
+    아직 계산된 결과가 없으면(찜이 없거나 배치 실행 전) 인기 여행지로 대체합니다.
+    """
+    snapshot = catalog_snapshot.get(db)
+    record = db.get(UserRecommendation, user_id)
+
+    items = []
+    if record is not None:
+        for entry in json.loads(record.items or "[]"):
+            row = snapshot.row_of(KIND_SPOT, entry["contentid"])
+            if row is None:
+                continue # 배치 이후 삭제된 여행지
+            items.append(_spot_payload(snapshot, row, entry.get("score")))
+            if len(items) >= limit:
+                break
+
+    if items:
+        return {"source": "personalized", "computed_at": record.computed_at, "items": items}
+    return {"source": "popular", "computed_at": None, "items": _popular_spots(snapshot, limit)}
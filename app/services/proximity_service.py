@@ -0,0 +1,182 @@
+# app/services/proximity_service.py
+
+from __future__ import annotations
+import datetime
+import math
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.services.catalog_snapshot import (
+    catalog_snapshot, CatalogSnapshot, KIND_SPOT, KIND_FESTIVAL, KIND_NAMES, is_older_key
+)
+from app.services.scoring_service import EARTH_RADIUS
+
+settings = get_settings()
+
+# 한반도 최북단(약 39°N)에서도 경도 셀이 반경보다 작아지지 않도록 경도 셀 크기를 보정합니다.
+MAX_ABS_LAT = 39.0
+KM_PER_DEG_LAT = math.pi * EARTH_RADIUS / 180.0
+
+
+def _pair_distance_km(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+@dataclass
+class ProximityJoin:
+    """
+    여행지 ↔ 진행 중인 축제의 반경 조인 결과 (CSR 형식).
+    스냅샷 행 r의 이웃은 neighbors[indptr[r]:indptr[r + 1]] 이며 거리순으로 정렬되어 있습니다.
+    여행지 행의 이웃은 축제, 축제 행의 이웃은 여행지입니다.
+    """
+    radius_km: float
+    indptr: np.ndarray      # int64 (len(snapshot) + 1,)
+    neighbors: np.ndarray   # int32, 스냅샷 행 번호
+    distance: np.ndarray    # float32, km
+
+    def of(self, row: int) -> Tuple[np.ndarray, np.ndarray]:
+        start, end = self.indptr[row], self.indptr[row + 1]
+        return self.neighbors[start:end], self.distance[start:end]
+
+
+def build_proximity_join(snapshot: CatalogSnapshot, today: datetime.date, radius_km: float) -> ProximityJoin:
+    """
+    축제를 반경 크기의 격자에 넣고(셀 키로 정렬), 각 여행지에서 주변 3×3 셀의 축제만 거리 계산합니다.
+    셀 범위 탐색은 searchsorted로, 후보 쌍 확장과 거리 계산은 모두 벡터 연산으로 처리합니다.
+    """
+    n = len(snapshot)
+    today_int = today.year * 10000 + today.month * 100 + today.day
+    spots = np.flatnonzero(snapshot.kind == KIND_SPOT)
+    festivals = np.flatnonzero((snapshot.kind == KIND_FESTIVAL) & (snapshot.end_date >= today_int))
+
+    empty = ProximityJoin(radius_km, np.zeros(n + 1, dtype=np.int64), np.empty(0, np.int32), np.empty(0, np.float32))
+    if spots.size == 0 or festivals.size == 0:
+        return empty
+
+    lat_cell = radius_km / KM_PER_DEG_LAT
+    lon_cell = radius_km / (KM_PER_DEG_LAT * math.cos(math.radians(MAX_ABS_LAT)))
+
+    def cell_key(ix: np.ndarray, iy: np.ndarray) -> np.ndarray:
+        return (ix.astype(np.int64) << 32) | (iy.astype(np.int64) & 0xFFFFFFFF)
+
+    f_ix = np.floor(snapshot.lon[festivals] / lon_cell).astype(np.int64)
+    f_iy = np.floor(snapshot.lat[festivals] / lat_cell).astype(np.int64)
+    f_keys = cell_key(f_ix, f_iy)
+    order = np.argsort(f_keys, kind="stable")
+    festivals, f_keys = festivals[order], f_keys[order]
+
+    s_ix = np.floor(snapshot.lon[spots] / lon_cell).astype(np.int64)
+    s_iy = np.floor(snapshot.lat[spots] / lat_cell).astype(np.int64)
+
+    pair_spot, pair_fest = [], []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            keys = cell_key(s_ix + dx, s_iy + dy)
+            lo = np.searchsorted(f_keys, keys, side="left")
+            hi = np.searchsorted(f_keys, keys, side="right")
+            counts = hi - lo
+            if not counts.any():
+                continue
+            # 여행지 i에 대해 festivals[lo[i]:hi[i]]를 한 번에 펼칩니다.
+            spot_idx = np.repeat(np.arange(spots.size), counts)
+            offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            pair_spot.append(spots[spot_idx])
+            pair_fest.append(festivals[np.repeat(lo, counts) + offsets])
+
+    if not pair_spot:
+        return empty
+
+    a = np.concatenate(pair_spot)
+    b = np.concatenate(pair_fest)
+    dist = _pair_distance_km(snapshot.lat[a], snapshot.lon[a], snapshot.lat[b], snapshot.lon[b])
+    within = dist <= radius_km
+    a, b, dist = a[within], b[within], dist[within]
+
+    # 양방향(여행지→축제, 축제→여행지)을 하나의 CSR로 합칩니다.
+    src = np.concatenate([a, b])
+    dst = np.concatenate([b, a])
+    dist = np.concatenate([dist, dist])
+    order = np.lexsort((dist, src))
+    src, dst, dist = src[order], dst[order], dist[order]
+
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    return ProximityJoin(radius_km, indptr, dst.astype(np.int32), dist.astype(np.float32))
+
+
+class ProximityIndex:
+    """
+    스냅샷 버전(동기화 후 변경)이나 날짜(축제 종료 반영)가 바뀌면 조인을 다시 만듭니다.
+    조인은 만든 스냅샷과 한 튜플로 묶어 한 번에 교체하므로, 호출자는 항상 행 번호가 맞는 두 값을 받습니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (키, 스냅샷, 조인)
+        self._entry: Optional[Tuple[Tuple[Any, datetime.date, float], CatalogSnapshot, ProximityJoin]] = None
+
+    def get(self, db: Session) -> Tuple[CatalogSnapshot, ProximityJoin]:
+        snapshot = catalog_snapshot.get(db)
+        key = (snapshot.version, datetime.date.today(), settings.SPOT_FESTIVAL_RADIUS_KM)
+        entry = self._entry
+        if entry is None or entry[0] != key:
+            with self._lock:
+                entry = self._entry
+                # 같은 반경으로 더 새 버전이 이미 만들어져 있으면(늦게 도착한 요청) 그것을 그대로 사용
+                if entry is None or (
+                    entry[0] != key and not (entry[0][2] == key[2] and is_older_key(key[:2], entry[0][:2]))
+                ):
+                    join = build_proximity_join(snapshot, key[1], key[2])
+                    entry = (key, snapshot, join)
+                    self._entry = entry
+                    print(f"여행지-축제 근접 조인 갱신 완료 (version={snapshot.version}, 쌍 {join.neighbors.size // 2}개)")
+        return entry[1], entry[2]
+
+
+proximity_index = ProximityIndex()
+
+
+def _neighbors_payload(snapshot: CatalogSnapshot, join: ProximityJoin, row: int, limit: int) -> List[Dict[str, Any]]:
+    rows, dists = join.of(row)
+    items = []
+    for r, d in zip(rows[:limit], dists[:limit]):
+        r = int(r)
+        item = {
+            "type": KIND_NAMES[int(snapshot.kind[r])],
+            "contentid": snapshot.contentid[r],
+            "title": snapshot.title[r],
+            "image_url": snapshot.image_url[r],
+            "address": snapshot.address[r],
+            "lat": float(snapshot.lat[r]),
+            "lng": float(snapshot.lon[r]),
+            "distanceKm": round(float(d), 2),
+        }
+        if snapshot.kind[r] == KIND_FESTIVAL:
+            item["event_start_date"] = str(int(snapshot.start_date[r]))
+            item["event_end_date"] = str(int(snapshot.end_date[r]))
+        items.append(item)
+    return items
+
+
+def get_festivals_near_spot(db: Session, contentid: str, limit: int = 20) -> Optional[List[Dict[str, Any]]]:
+    """여행지 주변의 진행 중·예정 축제 (여행지가 없으면 None)"""
+    snapshot, join = proximity_index.get(db)
+    row = snapshot.row_of(KIND_SPOT, contentid)
+    if row is None:
+        return None
+    return _neighbors_payload(snapshot, join, row, limit)
+
+
+def get_spots_near_festival(db: Session, contentid: str, limit: int = 20) -> Optional[List[Dict[str, Any]]]:
+    """축제 주변의 여행지 (축제가 없으면 None, 종료된 축제는 빈 목록)"""
+    snapshot, join = proximity_index.get(db)
+    row = snapshot.row_of(KIND_FESTIVAL, contentid)
+    if row is None:
+        return None
+    return _neighbors_payload(snapshot, join, row, limit)
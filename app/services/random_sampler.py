@@ -0,0 +1,89 @@
+# app/services/random_sampler.py
+
+from __future__ import annotations
+import random
+import threading
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.recommend_models import RecommendTourInfo
+from app.services.catalog_version_service import catalog_version_watcher, ENTITY_SPOT
+
+
+class SpotSampler:
+    """
+    ORDER BY RAND() 없이 여행지를 무작위로 뽑기 위한 메모리 인덱스.
+
+    - 전체 contentid 배열과, 분류 코드(cat1/cat2/cat3)별 행 번호 배열을 미리 만들어 둡니다.
+    - 여러 코드가 주어지면 각 배열을 이어붙인 "가상 배열"에서 k개의 위치를 중복 없이 뽑으므로
+      테이블 크기와 무관하게 k에 비례하는 시간만 듭니다.
+    - 카탈로그 버전(동기화 스크립트가 올림)이 바뀌면 다음 호출 시 인덱스를 다시 만듭니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        # (contentid 리스트, 분류 코드별 행 번호 배열) - 재빌드 시 한 번에 교체합니다.
+        self._index: Tuple[List[str], Dict[str, np.ndarray]] = ([], {})
+
+    def _build(self, db: Session, version: int) -> None:
+        rows = db.execute(
+            select(
+                RecommendTourInfo.contentid,
+                RecommendTourInfo.cat1,
+                RecommendTourInfo.cat2,
+                RecommendTourInfo.cat3,
+            ).order_by(RecommendTourInfo.contentid) # seed 재현성을 위해 순서 고정
+        ).all()
+
+        ids: List[str] = []
+        buckets: Dict[str, List[int]] = {}
+        for idx, (contentid, cat1, cat2, cat3) in enumerate(rows):
+            ids.append(str(contentid))
+            for code in (cat1, cat2, cat3):
+                if code:
+                    buckets.setdefault(code, []).append(idx)
+
+        self._index = (ids, {code: np.asarray(idxs, dtype=np.int32) for code, idxs in buckets.items()})
+        self._version = version
+        print(f"랜덤 추천 인덱스 갱신 완료 (version={version}, 여행지 {len(ids)}건, 분류 {len(buckets)}개)")
+
+    def refresh(self, db: Session, force: bool = False) -> None:
+        version = catalog_version_watcher.current(ENTITY_SPOT)
+        with self._lock:
+            if force or self._version != version:
+                self._build(db, version)
+
+    def sample(self, db: Session, codes: List[str], k: int, seed: Optional[int] = None) -> List[str]:
+        """
+        분류 코드 목록(codes)에 속한 여행지 중 k개의 contentid를 중복 없이 뽑습니다.
+        codes가 비어 있으면 전체 여행지에서 뽑습니다. seed를 주면 결과가 재현됩니다.
+        """
+        self.refresh(db)
+        ids, buckets = self._index
+        rng = random.Random(seed) if seed is not None else random
+
+        # 코드들은 resolve_theme_codes()에서 서로 겹치지 않도록 정리되어 들어옵니다.
+        if not codes:
+            total = len(ids)
+            k = min(k, total)
+            return [ids[i] for i in rng.sample(range(total), k)]
+
+        arrays = [buckets[c] for c in codes if c in buckets]
+        offsets = [0]
+        for arr in arrays:
+            offsets.append(offsets[-1] + len(arr))
+        total = offsets[-1]
+        k = min(k, total)
+
+        picked = []
+        for pos in rng.sample(range(total), k):
+            bucket = bisect_right(offsets, pos) - 1
+            picked.append(ids[arrays[bucket][pos - offsets[bucket]]])
+        return picked
+
+
+spot_sampler = SpotSampler()
@@ -5,6 +5,7 @@ import os
 import json
 import traceback
 from typing import List, Optional, Dict, Any
+import numpy as np
 from dotenv import load_dotenv
 from openai import AsyncOpenAI
 from fastapi import HTTPException
@@ -12,9 +13,19 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 from app.models.recommend_models import RecommendTourInfo, TourInfoOut
+from app.core.cache import ReadThroughCache
+from app.core.config import get_settings
+from app.services.catalog_version_service import ENTITY_SPOT
+from app.services.catalog_change_service import catalog_change_subscriber
+from app.services.category_codes import resolve_theme_codes, match_themes
+from app.services.random_sampler import spot_sampler
+from app.services.overview_service import spot_overviews
+from app.services.scoring_service import haversine_np
 
 from math import radians, cos, sin, asin, sqrt
 
+settings = get_settings()
+
 # --- OpenAI 클라이언트 초기화 ---
 openai_client = None 
 try:
@@ -214,9 +225,15 @@ def search_spots_in_db(db: Session, keywords: List[str]) -> List[TourInfoOut]:
     # 3. 결과 제한 (너무 많으면 AI 토큰 초과)
     # 랜덤 정렬을 원하면 func.random() 사용 가능 (DB 종류에 따라 다름)
     results = query.limit(3).all()
-    
+
+    # 개요(recommend_tour_overview)를 붙여 AI가 제목/주소만 보고 내용을 지어내지 않도록 함
+    overviews = spot_overviews(db, [item.contentid for item in results])
+
     # Pydantic 모델로 변환
-    return [TourInfoOut.model_validate(item) for item in results]
+    return [
+        TourInfoOut.model_validate(item).model_copy(update={"overview": overviews.get(str(item.contentid))})
+        for item in results
+    ]
 
 
 # =========================================================
@@ -224,8 +241,12 @@ def search_spots_in_db(db: Session, keywords: List[str]) -> List[TourInfoOut]:
 # =========================================================
 async def generate_final_recommendation(spots: List[TourInfoOut], profile: Dict):
     
-    # DB 객체를 JSON으로 직렬화 (AI에게 Context로 주기 위함)
-    spots_context = json.dumps([s.model_dump() for s in spots], ensure_ascii=False)
+    # DB 객체를 JSON으로 직렬화 (AI에게 Context로 주기 위함). 개요는 토큰 절약을 위해 앞부분만 넣음
+    max_chars = settings.CHATBOT_OVERVIEW_MAX_CHARS
+    spots_context = json.dumps(
+        [{**s.model_dump(), "overview": (s.overview or "")[:max_chars] or None} for s in spots],
+        ensure_ascii=False,
+    )
     
     system_prompt_final = f"""
     [Role]
@@ -236,6 +257,7 @@ async def generate_final_recommendation(spots: List[TourInfoOut], profile: Dict)
 
     [Mission]
     위 [Context Data]의 3개 여행지에 대해 각각 맞춤형 추천 이유를 작성하고, 전체적인 소개말을 작성하십시오.
+    여행지의 특징은 overview에 있는 내용만 근거로 쓰고, overview가 없으면 이름·주소·분류에서 알 수 있는 것 이상은 지어내지 마십시오.
 
     [Output Format (JSON Only)]
     반드시 아래 JSON 형식을 준수하십시오.
@@ -278,7 +300,7 @@ async def generate_final_recommendation(spots: List[TourInfoOut], profile: Dict)
             if matching_detail and matching_detail.get("ai_summary"):
                 spot_dict["ai_summary"] = matching_detail.get("ai_summary")
             else:
-                spot_dict["ai_summary"] = spot.addr1 # 실패 시 주소 사용
+                spot_dict["ai_summary"] = (spot.overview or "")[:120] or spot.addr1 # 실패 시 개요 앞부분, 없으면 주소 사용
 
             final_recommendations.append(TourInfoOut(**spot_dict))
 
@@ -316,9 +338,81 @@ def haversine(lon1, lat1, lon2, lat2):
     r = 6371 # 지구 반지름 (km)
     return c * r
 
+# recommend_tourInfo는 sync_recommends.py 실행 시에만 바뀌므로 contentid 단위로 결과를 캐시하고,
+# 동기화가 남긴 변경 로그(catalog_changes)를 구독하여 바뀐 여행지와 관련된 항목만 비웁니다.
+# 변경 로그를 놓치는 경우에 대비해 SPOT_CACHE_TTL이 지난 항목은 다시 읽습니다.
+spot_detail_cache = ReadThroughCache("spot_detail", max_size=settings.SPOT_CACHE_MAX_SIZE, ttl=settings.SPOT_CACHE_TTL)
+nearby_spots_cache = ReadThroughCache("nearby_spots", max_size=settings.SPOT_CACHE_MAX_SIZE, ttl=settings.SPOT_CACHE_TTL)
+
+# 주변 여행지 캐시 무효화 시 한 번에 거리 행렬을 계산할 캐시 항목 수 (메모리 사용량 제한)
+_NEARBY_INVALIDATE_CHUNK = 256
+
+
+def _on_spot_changes(db: Session, changes: List[Any]) -> None:
+    """
+    변경된 여행지에 대해
+    - 상세 캐시: 해당 contentid 항목만 비움
+    - 주변 여행지 캐시: 기준 여행지가 바뀌었거나, 바뀐 여행지가 목록에 있었거나(이전 위치),
+      새 위치가 반경 안에 들어오는 항목만 비움 (캐시 항목 × 변경 위치 거리는 numpy로 한 번에 계산)
+    """
+    changed = {c.contentid for c in changes if c.entity == ENTITY_SPOT}
+    if not changed:
+        return
+    if len(changed) > settings.CATALOG_CHANGE_FLUSH_THRESHOLD:
+        spot_detail_cache.clear()
+        nearby_spots_cache.clear()
+        print(f"여행지 캐시 전체 비움 (변경 {len(changed)}건)")
+        return
+
+    positions = np.array([
+        (float(y), float(x))
+        for x, y in db.query(RecommendTourInfo.mapx, RecommendTourInfo.mapy)
+        .filter(RecommendTourInfo.contentid.in_(list(changed)))
+        .all()
+        if x is not None and y is not None
+    ], dtype=np.float64).reshape(-1, 2)
+
+    def select_affected(items: List[Any]) -> List[Any]:
+        evict, located = [], []
+        for key, value in items:
+            target_id, limit_km = key
+            if target_id in changed or any(spot.get("contentid") in changed for spot in value["nearby_spots"]):
+                evict.append(key)
+                continue
+            target = value["target"]
+            if target is not None and target.mapx is not None and target.mapy is not None:
+                located.append((key, float(target.mapy), float(target.mapx), float(limit_km)))
+
+        if located and len(positions):
+            for start in range(0, len(located), _NEARBY_INVALIDATE_CHUNK):
+                chunk = located[start:start + _NEARBY_INVALIDATE_CHUNK]
+                lat = np.array([c[1] for c in chunk])[:, None]
+                lon = np.array([c[2] for c in chunk])[:, None]
+                radius = np.array([c[3] for c in chunk])
+                dist = haversine_np(lat, lon, positions[None, :, 0], positions[None, :, 1])
+                hit = (dist <= radius[:, None]).any(axis=1)
+                evict.extend(chunk[i][0] for i in np.flatnonzero(hit))
+        return evict
+
+    detail_count = sum(spot_detail_cache.invalidate(cid) for cid in changed)
+    nearby_count = nearby_spots_cache.invalidate_selected(select_affected)
+    print(f"여행지 캐시 무효화: 변경 {len(changed)}건 → 상세 {detail_count}건, 주변 목록 {nearby_count}건")
+
+
+catalog_change_subscriber.add_listener(_on_spot_changes)
+
 def get_nearby_spots(contentid: str, db: Session, limit_km: float = 20.0) -> Dict[str, Any]:
     """
-    특정 contentid의 좌표를 기준으로 반경 20km 이내의 여행지를 찾습니다.
+    특정 contentid의 좌표를 기준으로 반경 20km 이내의 여행지를 찾습니다. (캐시 경유)
+    """
+    return nearby_spots_cache.get_or_load(
+        (contentid, limit_km),
+        lambda: _load_nearby_spots(contentid, db, limit_km),
+    )
+
+def _load_nearby_spots(contentid: str, db: Session, limit_km: float = 20.0) -> Dict[str, Any]:
+    """
+    특정 contentid의 좌표를 기준으로 반경 20km 이내의 여행지를 DB에서 찾습니다.
     """
     # 1. 기준이 되는 여행지 정보 조회 (이게 실패하면 404가 뜹니다)
     target_spot = db.query(RecommendTourInfo).filter(RecommendTourInfo.contentid == contentid).first()
@@ -364,7 +458,45 @@ def get_nearby_spots(contentid: str, db: Session, limit_km: float = 20.0) -> Dic
 
 # 최종 상세 정보 조회 (페이지 2용)
 def get_spot_detail(contentid: str, db: Session):
+    return spot_detail_cache.get_or_load(contentid, lambda: _load_spot_detail(contentid, db))
+
+def _load_spot_detail(contentid: str, db: Session):
     spot = db.query(RecommendTourInfo).filter(RecommendTourInfo.contentid == contentid).first()
     if not spot:
         return None
-    return TourInfoOut.model_validate(spot)
\ No newline at end of file
+    return TourInfoOut.model_validate(spot)
+
+# =========================================================
+# 랜덤 여행지 추천
+# =========================================================
+def get_random_recommendations_from_db(
+    db: Session,
+    themes: List[str],
+    count: int = 5,
+    seed: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    선택한 테마(분류 코드)에 속한 여행지 중 count개를 무작위로 추천합니다.
+    샘플링은 메모리 인덱스(spot_sampler)에서 하고, DB에서는 뽑힌 contentid만 조회합니다.
+    """
+    codes = resolve_theme_codes(themes)
+    picked_ids = spot_sampler.sample(db, codes, count, seed=seed)
+    if not picked_ids:
+        return []
+
+    spots = db.query(RecommendTourInfo).filter(RecommendTourInfo.contentid.in_(picked_ids)).all()
+    spots_by_id = {str(spot.contentid): spot for spot in spots}
+
+    recommendations = []
+    for contentid in picked_ids: # 샘플링 순서 유지
+        spot = spots_by_id.get(contentid)
+        if not spot or not contentid.isdigit():
+            continue
+        recommendations.append({
+            "id": int(contentid),
+            "title": spot.title,
+            "description": spot.addr1,
+            "image_url": spot.firstimage,
+            "tags": match_themes(themes, spot.cat1, spot.cat2, spot.cat3),
+        })
+    return recommendations
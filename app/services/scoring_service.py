@@ -0,0 +1,186 @@
+# app/services/scoring_service.py
+
+from __future__ import annotations
+import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.services.catalog_snapshot import (
+    catalog_snapshot, CatalogSnapshot, KIND_FESTIVAL, KIND_NAMES
+)
+from app.services.category_codes import resolve_theme_codes
+
+EARTH_RADIUS = 6371.0
+
+# 점수 가중치 (합계 1.0)
+W_DISTANCE = 0.45
+W_THEME = 0.30
+W_DATE = 0.10
+W_POPULARITY = 0.15
+
+# 날짜를 지정하지 않은 경우 오늘부터 며칠 이내의 축제를 대상으로 할지
+DEFAULT_DATE_WINDOW_DAYS = 30
+
+
+def haversine_np(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """한 지점에서 여러 지점까지의 거리(km)를 벡터 연산으로 계산"""
+    lat1, lon1 = np.radians(lat), np.radians(lon)
+    lat2, lon2 = np.radians(lats), np.radians(lons)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime.date]:
+    if not value:
+        return None
+    return datetime.date.fromisoformat(value)
+
+
+def _to_int_date(d: datetime.date) -> int:
+    return d.year * 10000 + d.month * 100 + d.day
+
+
+def _int_dates_to_ordinal(values: np.ndarray) -> np.ndarray:
+    """YYYYMMDD 정수 배열을 일(day) 단위 정수로 변환 (겹치는 일수 계산용)"""
+    values = values.astype(np.int64)
+    years = (values // 10000 - 1970).astype("datetime64[Y]")
+    months = years.astype("datetime64[M]") + (values // 100 % 100 - 1)
+    days = months.astype("datetime64[D]") + (values % 100 - 1)
+    return days.astype(np.int64)
+
+
+def score_candidates(
+    snapshot: CatalogSnapshot,
+    lat: float,
+    lng: float,
+    themes: List[str],
+    date_from: Optional[datetime.date],
+    date_to: Optional[datetime.date],
+    radius_km: float,
+    limit: int,
+    min_popularity: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    거리 감쇠 + 테마 일치 + 축제 기간 겹침 + 인기도(찜 개수)를 합산해 상위 limit개를 반환합니다.
+    모든 계산은 스냅샷 배열 위의 벡터 연산이며, 상위 k개 선택은 argpartition으로 O(n)에 처리합니다.
+    """
+    if len(snapshot) == 0:
+        return []
+
+    # 1. 거리 필터 (반경 밖은 후보에서 제외)
+    distance = haversine_np(lat, lng, snapshot.lat, snapshot.lon)
+    candidate = distance <= radius_km
+
+    # 2. 기간 필터: 축제는 조회 기간과 하루라도 겹쳐야 함 (여행지는 항상 통과)
+    today = datetime.date.today()
+    date_from = date_from or today
+    date_to = date_to or (date_from + datetime.timedelta(days=DEFAULT_DATE_WINDOW_DAYS))
+    q_start, q_end = _to_int_date(date_from), _to_int_date(date_to)
+    candidate &= (snapshot.start_date <= q_end) & (snapshot.end_date >= q_start)
+
+    # 3. 인기도 필터 (찜 개수 기준)
+    if min_popularity is not None:
+        candidate &= snapshot.popularity >= min_popularity
+
+    idx = np.flatnonzero(candidate)
+    if idx.size == 0:
+        return []
+
+    d = distance[idx]
+    kind = snapshot.kind[idx]
+
+    # 거리 감쇠: 반경의 1/3 지점에서 약 0.37
+    distance_score = np.exp(-d / max(radius_km / 3.0, 1e-6))
+
+    # 테마 일치 (테마 미지정 시 가중치를 다른 항목에 분배)
+    codes = resolve_theme_codes(themes)
+    if codes:
+        theme_score = snapshot.category_mask(codes)[idx].astype(np.float64)
+        w_theme = W_THEME
+    else:
+        theme_score = np.zeros(idx.size)
+        w_theme = 0.0
+
+    # 축제 기간 겹침 비율 (여행지는 중립값 0.5)
+    date_score = np.full(idx.size, 0.5)
+    fest = kind == KIND_FESTIVAL
+    if fest.any():
+        f_start = np.maximum(snapshot.start_date[idx][fest], q_start)
+        f_end = np.minimum(snapshot.end_date[idx][fest], q_end)
+        overlap = _int_dates_to_ordinal(f_end) - _int_dates_to_ordinal(f_start) + 1
+        span = (date_to - date_from).days + 1
+        date_score[fest] = np.clip(overlap / span, 0.0, 1.0)
+
+    # 인기도: log 스케일로 0~1 정규화
+    popularity = snapshot.popularity[idx].astype(np.float64)
+    max_pop = float(snapshot.popularity.max()) if len(snapshot) else 0.0
+    popularity_score = np.log1p(popularity) / np.log1p(max_pop) if max_pop > 0 else np.zeros(idx.size)
+
+    total_weight = W_DISTANCE + w_theme + W_DATE + W_POPULARITY
+    score = (
+        W_DISTANCE * distance_score
+        + w_theme * theme_score
+        + W_DATE * date_score
+        + W_POPULARITY * popularity_score
+    ) / total_weight
+
+    # 4. 상위 k개 선택 (전체 정렬 대신 argpartition)
+    k = min(limit, idx.size)
+    top = np.argpartition(-score, k - 1)[:k]
+    top = top[np.argsort(-score[top])]
+
+    items = []
+    for pos in top:
+        row = int(idx[pos])
+        reason = []
+        if distance_score[pos] >= 0.5:
+            reason.append("가까운 거리")
+        if theme_score[pos] > 0:
+            reason.append("선택한 테마와 일치")
+        if kind[pos] == KIND_FESTIVAL and date_score[pos] > 0:
+            reason.append("여행 기간에 열리는 축제")
+        if popularity_score[pos] >= 0.5:
+            reason.append("많은 사용자가 찜한 곳")
+        items.append({
+            "type": KIND_NAMES[int(kind[pos])],
+            "contentid": snapshot.contentid[row],
+            "title": snapshot.title[row],
+            "image_url": snapshot.image_url[row],
+            "lat": float(snapshot.lat[row]),
+            "lng": float(snapshot.lon[row]),
+            "score": round(float(score[pos]), 4),
+            "distanceKm": round(float(d[pos]), 2),
+            "reason": reason,
+        })
+    return items
+
+
+def get_scored_recommendations(
+    db: Session,
+    lat: float,
+    lng: float,
+    themes: List[str],
+    date_from: Optional[str],
+    date_to: Optional[str],
+    radius_km: float,
+    limit: int,
+    min_popularity: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    content_router의 GET /recommend 진입점. 날짜 문자열(YYYY-MM-DD)을 파싱하고 스냅샷을 가져와 점수를 계산합니다.
+    날짜 형식이 잘못된 경우 ValueError를 발생시킵니다.
+    """
+    snapshot = catalog_snapshot.get(db)
+    return score_candidates(
+        snapshot,
+        lat=lat,
+        lng=lng,
+        themes=themes,
+        date_from=_parse_date(date_from),
+        date_to=_parse_date(date_to),
+        radius_km=radius_km,
+        limit=limit,
+        min_popularity=min_popularity,
+    )
@@ -0,0 +1,123 @@
+# app/services/similar_service.py
+
+from __future__ import annotations
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.recommend_models import RecommendTourInfo, TourInfoOut
+
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class SimilarGraph:
+    """한 번 읽은 kNN 그래프. 재로드 시 통째로 교체되므로 조회 중에 배열이 섞이지 않습니다."""
+    mtime: Optional[float]
+    contentids: np.ndarray
+    neighbors: np.ndarray
+    scores: np.ndarray
+    row_by_id: Dict[str, int]
+
+
+_EMPTY_GRAPH = SimilarGraph(
+    mtime=None,
+    contentids=np.empty(0, dtype=object),
+    neighbors=np.empty((0, 0), dtype=np.int32),
+    scores=np.empty((0, 0), dtype=np.float16),
+    row_by_id={},
+)
+
+
+class SimilarSpotIndex:
+    """
+    scripts/build_similar_spots.py가 만든 kNN 그래프(.npz)를 메모리에 올려두고 조회합니다.
+    - contentids: (n,) 여행지 ID
+    - neighbors:  (n, k) int32, 유사한 여행지의 행 번호 (유사도 내림차순, -1: 없음)
+    - scores:     (n, k) float16, 코사인 유사도
+    파일이 새로 만들어지면(mtime 변경) 다음 조회 때 다시 읽습니다.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._graph: SimilarGraph = _EMPTY_GRAPH
+
+    def _load_if_changed(self) -> SimilarGraph:
+        graph = self._graph
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return graph # 아직 배치가 실행되지 않음
+
+        if mtime == graph.mtime:
+            return graph
+
+        with self._lock:
+            graph = self._graph
+            if mtime == graph.mtime:
+                return graph
+            with np.load(self.path, allow_pickle=False) as data:
+                contentids = data["contentids"].astype(str)
+                neighbors = data["neighbors"]
+                scores = data["scores"]
+            graph = SimilarGraph(
+                mtime=mtime,
+                contentids=contentids,
+                neighbors=neighbors,
+                scores=scores,
+                row_by_id={cid: i for i, cid in enumerate(contentids)},
+            )
+            self._graph = graph
+            print(f"유사 여행지 그래프 로드 완료 ({len(contentids)}건, k={neighbors.shape[1] if neighbors.ndim == 2 else 0})")
+        return graph
+
+    def neighbors_of(self, contentid: str, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """contentid의 이웃 목록을 반환합니다. 그래프에 없는 여행지이면 None."""
+        graph = self._load_if_changed()
+        row = graph.row_by_id.get(str(contentid))
+        if row is None:
+            return None
+
+        result = []
+        for col in range(min(limit, graph.neighbors.shape[1])):
+            neighbor = int(graph.neighbors[row, col])
+            if neighbor < 0:
+                break
+            result.append({
+                "contentid": str(graph.contentids[neighbor]),
+                "similarity": round(float(graph.scores[row, col]), 3),
+            })
+        return result
+
+
+similar_spot_index = SimilarSpotIndex(settings.SIMILAR_SPOTS_PATH)
+
+
+def get_similar_spots(contentid: str, db: Session, limit: int = 10) -> Optional[List[Dict[str, Any]]]:
+    """
+    미리 계산된 kNN 그래프에서 이웃을 찾고, 이웃 여행지의 정보를 PK 조회 한 번으로 채웁니다.
+    """
+    neighbors = similar_spot_index.neighbors_of(contentid, limit)
+    if neighbors is None:
+        return None
+    if not neighbors:
+        return []
+
+    ids = [n["contentid"] for n in neighbors]
+    spots = db.query(RecommendTourInfo).filter(RecommendTourInfo.contentid.in_(ids)).all()
+    spots_by_id = {str(s.contentid): s for s in spots}
+
+    result = []
+    for n in neighbors:
+        spot = spots_by_id.get(n["contentid"])
+        if not spot:
+            continue # 그래프 생성 이후 삭제된 여행지
+        data = TourInfoOut.model_validate(spot).model_dump()
+        data["similarity"] = n["similarity"]
+        result.append(data)
+    return result
@@ -0,0 +1,99 @@
+# app/services/spot_page_service.py
+
+from __future__ import annotations
+import asyncio
+import time
+import traceback
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.db.database import SessionLocal
+from app.models.favorite_models import UserFavorite
+from app.services.recommend_service import get_spot_detail, get_nearby_spots
+from app.services.proximity_service import get_festivals_near_spot
+from app.services.similar_service import get_similar_spots
+
+# 섹션별 기본 개수
+PAGE_FESTIVAL_LIMIT = 10
+PAGE_SIMILAR_LIMIT = 10
+# 섹션 실패 시 errors에 내려주는 코드 (예외 메시지는 로그에만 남김)
+SECTION_ERROR = "SECTION_UNAVAILABLE"
+
+
+def _is_favorite(db: Session, user_id: int, contentid: str) -> bool:
+    return db.query(UserFavorite.id).filter(
+        and_(
+            UserFavorite.user_id == user_id,
+            UserFavorite.item_type == "SPOT",
+            UserFavorite.item_id == str(contentid),
+        )
+    ).first() is not None
+
+
+async def build_spot_page(db: Session, contentid: str, user_id: Optional[int] = None) -> Dict[str, Any]:
+    """
+    여행지 상세 화면에 필요한 섹션(상세, 주변 여행지, 주변 축제, 비슷한 여행지, 찜 여부)을
+    스레드풀에서 동시에 실행하고 하나의 응답으로 합칩니다.
+
+    - 캐시/스냅샷에서 응답하는 섹션(상세, 주변 여행지, 주변 축제)은 각자 동시에 실행합니다.
+      Session은 스레드 안전하지 않으므로 섹션마다 SessionLocal()을 두지만, 세션은 첫 쿼리 때 연결을 가져오므로
+      캐시 미스나 스냅샷 재생성 때만 연결을 씁니다.
+    - 매번 DB를 조회하는 섹션(비슷한 여행지 PK 조회, 찜 여부)은 한 스레드에서 차례로 요청 세션을 씁니다.
+      요청 하나가 커넥션 풀에서 가져가는 연결 수를 줄이기 위함입니다.
+    - 한 섹션이 실패해도 나머지 섹션은 그대로 반환합니다. errors에는 섹션별 고정 코드(SECTION_ERROR)만 담고
+      자세한 오류는 서버 로그에 남깁니다.
+    - 섹션별 소요 시간(ms)과 전체 시간을 timings_ms로 함께 내려줍니다.
+    """
+    cached_sections: Dict[str, Callable[[Session], Any]] = {
+        "detail": lambda s: get_spot_detail(contentid, s),
+        "nearby_spots": lambda s: get_nearby_spots(contentid, s)["nearby_spots"],
+        "festivals": lambda s: get_festivals_near_spot(s, contentid, limit=PAGE_FESTIVAL_LIMIT) or [],
+    }
+    db_sections: Dict[str, Callable[[Session], Any]] = {
+        "similar_spots": lambda s: get_similar_spots(contentid, s, limit=PAGE_SIMILAR_LIMIT) or [],
+    }
+    if user_id is not None:
+        db_sections["is_favorite"] = lambda s: _is_favorite(s, user_id, contentid)
+
+    def run(name: str, fn: Callable[[Session], Any], session: Session) -> Tuple[str, Any, Optional[str], float]:
+        started = time.perf_counter()
+        try:
+            data, error = fn(session), None
+        except Exception as e:
+            print(f"⚠️ 여행지 페이지 섹션 오류 ({name}, {contentid}): {e}")
+            traceback.print_exc()
+            data, error = None, SECTION_ERROR
+        return name, data, error, (time.perf_counter() - started) * 1000
+
+    def run_cached(name: str, fn: Callable[[Session], Any]) -> List[Tuple[str, Any, Optional[str], float]]:
+        session = SessionLocal()
+        try:
+            return [run(name, fn, session)]
+        finally:
+            session.close()
+
+    def run_db() -> List[Tuple[str, Any, Optional[str], float]]:
+        return [run(name, fn, db) for name, fn in db_sections.items()]
+
+    started = time.perf_counter()
+    groups = await asyncio.gather(
+        *(run_in_threadpool(run_cached, name, fn) for name, fn in cached_sections.items()),
+        run_in_threadpool(run_db),
+    )
+    results = [result for group in groups for result in group]
+
+    page: Dict[str, Any] = {"contentid": contentid, "is_favorite": None}
+    timings, errors = {}, {}
+    for name, data, error, elapsed_ms in results:
+        page[name] = data
+        timings[name] = round(elapsed_ms, 2)
+        if error:
+            errors[name] = error
+
+    timings["total"] = round((time.perf_counter() - started) * 1000, 2)
+    page["timings_ms"] = timings
+    page["errors"] = errors
+    return page
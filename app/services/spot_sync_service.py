@@ -0,0 +1,69 @@
+# app/services/spot_sync_service.py
+
+from __future__ import annotations
+from typing import Any, Dict, Iterable
+
+from sqlalchemy.orm import Session
+
+from app.db.bulk import bulk_upsert
+from app.models.recommend_models import RecommendTourInfo
+from app.services.sync_diff import SyncState, INSERTED, UPDATED, UNCHANGED
+from app.services.catalog_version_service import bump_catalog_version, ENTITY_SPOT
+from app.services.catalog_change_service import record_catalog_changes
+
+
+def spot_row(item: Dict[str, Any]) -> Dict[str, Any]:
+    """areaBasedList2 항목 하나를 recommend_tour_info 행(dict)으로 변환합니다."""
+    return {
+        'contentid': str(item.get('contentid')),
+        'contenttypeid': item.get('contenttypeid'),
+        'title': item.get('title'),
+        'addr1': item.get('addr1'),
+        'addr2': item.get('addr2'),
+        'zipcode': item.get('zipcode'),
+        'areacode': item.get('areacode'),
+        'sigungucode': item.get('sigungucode'),
+        'cat1': item.get('cat1'),
+        'cat2': item.get('cat2'),
+        'cat3': item.get('cat3'),
+        'tel': item.get('tel'),
+        'firstimage': item.get('firstimage', None),
+        'firstimage2': item.get('firstimage2', None),
+        # DECIMAL 타입에 맞춰 float으로 변환
+        'mapx': float(item.get('mapx')) if item.get('mapx') else None,
+        'mapy': float(item.get('mapy')) if item.get('mapy') else None,
+        'mlevel': item.get('mlevel'),
+        'createdtime': item.get('createdtime'),
+        'modifiedtime': item.get('modifiedtime'),
+    }
+
+
+def save_spot_items(db: Session, sync_state: SyncState, items: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    TourAPI 여행지 항목들을 변환·비교해 바뀐 행만 한 번의 bulk upsert로 저장하고,
+    같은 트랜잭션에 변경 로그와 카탈로그 버전 증가를 남깁니다. 커밋은 호출하는 쪽에서 합니다.
+    sync_recommends.py와 harvest_tour_data.py가 모두 이 경로로 저장합니다.
+    """
+    counts = {INSERTED: 0, UPDATED: 0, UNCHANGED: 0, "saved": 0}
+    rows = []
+    for item in items:
+        try:
+            data_to_save = spot_row(item)
+        except Exception as e:
+            print(f"데이터 변환 오류: {e}, ContentID: {item.get('contentid')}")
+            continue
+
+        status = sync_state.classify(data_to_save)
+        counts[status] += 1
+        if status != UNCHANGED:
+            # 내용이 같으면 쓰지 않음 (binlog/버퍼 풀/캐시 무효화 방지)
+            rows.append(data_to_save)
+
+    if rows:
+        # 바뀐 행만 한 번의 INSERT ... ON DUPLICATE KEY UPDATE로 저장 (행 단위 UPDATE/INSERT 대신)
+        bulk_upsert(db, RecommendTourInfo, rows, key="contentid")
+        # 변경 로그를 남기고 카탈로그 버전을 올려 API 서버의 캐시가 무효화되도록 함
+        record_catalog_changes(db, ENTITY_SPOT, [row['contentid'] for row in rows])
+        bump_catalog_version(db, ENTITY_SPOT)
+    counts["saved"] = len(rows)
+    return counts
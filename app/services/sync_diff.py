@@ -0,0 +1,66 @@
+# app/services/sync_diff.py
+
+from __future__ import annotations
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+INSERTED = "inserted"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+
+_MISSING = object()
+
+
+def content_hash(data: Dict[str, Any]) -> str:
+    """저장할 값(dict)의 해시. 키 순서와 무관하며 content_hash 자신은 제외합니다."""
+    payload = {k: v for k, v in data.items() if k != "content_hash"}
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class SyncState:
+    """
+    동기화 시작 시 DB의 contentid → content_hash 맵을 한 번만 읽어 두고,
+    들어오는 항목을 메모리에서 비교해 실제로 바뀐 행만 쓰도록 분류합니다.
+
+    - 해시가 없는 기존 행(도입 이전 데이터)은 한 번은 바뀐 것으로 보고 다시 써서 해시를 채웁니다.
+    - 해시는 API 응답을 변환한 값으로 계산하므로, DB 컬럼 정밀도(FLOAT 등)와 무관하게 비교됩니다.
+    - 수정 시간(modifiedtime)은 판단에 쓰지 않습니다. 변환 로직이 바뀌면 수정 시간이 같아도
+      저장할 값이 달라지므로, 해시만으로 비교하고 수정 시간은 읽지도 않습니다.
+    """
+    def __init__(self, db: Session, model):
+        self.model = model
+        rows = db.execute(select(model.contentid, model.content_hash)).all()
+        self._state: Dict[str, Optional[str]] = {str(cid): digest for cid, digest in rows}
+        self.counts = {INSERTED: 0, UPDATED: 0, UNCHANGED: 0}
+
+    def __contains__(self, contentid: str) -> bool:
+        return str(contentid) in self._state
+
+    def classify(self, data: Dict[str, Any]) -> str:
+        """
+        data에 content_hash를 채우고 INSERTED / UPDATED / UNCHANGED 중 하나를 반환합니다.
+        반환 즉시 내부 맵을 갱신하므로 같은 실행에서 중복 항목이 다시 오면 UNCHANGED가 됩니다.
+        """
+        contentid = str(data["contentid"])
+        digest = content_hash(data)
+        data["content_hash"] = digest
+
+        previous = self._state.get(contentid, _MISSING)
+        if previous is _MISSING:
+            status = INSERTED
+        elif previous == digest:
+            status = UNCHANGED
+        else:
+            status = UPDATED
+
+        self._state[contentid] = digest
+        self.counts[status] += 1
+        return status
+
+    def summary(self) -> str:
+        return f"삽입 {self.counts[INSERTED]}건, 업데이트 {self.counts[UPDATED]}건, 변경 없음 {self.counts[UNCHANGED]}건"
@@ -0,0 +1,172 @@
+# app/services/sync_harvester.py
+
+from __future__ import annotations
+import asyncio
+import math
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+
+from app.services.sync_pipeline import PagePipeline, StageStats
+
+
+@dataclass
+class Shard:
+    """
+    수집 단위 하나 (지역 코드 × 콘텐츠 타입).
+    next_page 앞의 페이지는 모두 저장이 끝났고, written에는 next_page 뒤에서 먼저 끝난 페이지가 들어 있습니다.
+    """
+    key: str
+    area_code: str
+    content_type_id: str
+    next_page: int = 1
+    total_count: Optional[int] = None
+    total_pages: Optional[int] = None
+    done: bool = False
+    written: Set[int] = field(default_factory=set)
+    failed_pages: List[int] = field(default_factory=list)
+
+    def checkpoint_after(self, pages: Iterable[int]) -> Tuple[int, bool]:
+        """pages까지 저장됐을 때의 (next_page, done). 연속으로 끝난 페이지까지만 앞으로 옮깁니다."""
+        written = self.written | set(pages)
+        next_page = self.next_page
+        while next_page in written:
+            next_page += 1
+        done = self.total_pages is not None and next_page > self.total_pages
+        return next_page, done
+
+
+# 페이지 하나: (샤드, 페이지 번호, TourAPI 원본 항목 목록)
+ShardPage = Tuple[Shard, int, List[Dict[str, Any]]]
+# 체크포인트 갱신: (샤드, next_page, done)
+Checkpoint = Tuple[Shard, int, bool]
+
+
+@dataclass
+class HarvestResult:
+    shards: int = 0
+    completed_shards: int = 0
+    planned_pages: int = 0
+    concurrency: int = 0
+    failed_pages: List[Tuple[str, int]] = field(default_factory=list)
+    error: Optional[BaseException] = None  # 저장 단계에서 난 오류 (이후 저장 중단)
+    aborted: bool = False                  # abort_on 오류 등으로 남은 페이지를 요청하지 않고 끝남
+    elapsed: float = 0.0
+    fetch: StageStats = field(default_factory=lambda: StageStats("수집"))
+    write: StageStats = field(default_factory=lambda: StageStats("저장"))
+    saved_rows: int = 0
+    backpressure_wait: float = 0.0
+    max_queue: int = 0
+
+    @property
+    def completed(self) -> bool:
+        return self.error is None and not self.failed_pages and self.completed_shards == self.shards
+
+    def summary(self) -> str:
+        return (
+            f"샤드 {self.completed_shards}/{self.shards} 완료 | 동시 수집 {self.concurrency}개 | "
+            f"{self.fetch.summary(self.elapsed)} | {self.write.summary(self.elapsed)} | "
+            f"저장 {self.saved_rows}건 | 대기열 최대 {self.max_queue}, 대기 {self.backpressure_wait:.1f}초 | "
+            f"총 {self.elapsed:.1f}초"
+        )
+
+
+class ShardHarvester(PagePipeline):
+    """
+    여러 샤드를 하나의 호출 한도(같은 TourAPIClient) 아래에서 동시에 수집하고, 저장은 한 곳에서 모아 하는 수집기.
+    수집/저장 루프는 PagePipeline을 그대로 쓰고, 작업 키가 샤드입니다.
+
+    1. 각 샤드의 재개 페이지(체크포인트의 next_page)를 먼저 받아 totalCount로 샤드별 페이지 수를 정합니다.
+    2. 나머지 페이지를 샤드 순서대로 늘어놓고 concurrency개의 수집 작업이 나눠 받습니다.
+       큰 샤드 하나가 끝까지 혼자 남지 않도록 샤드가 아니라 페이지 단위로 나눕니다.
+    3. 저장 작업 하나가 크기가 제한된 대기열에서 최대 batch_pages개를 꺼내 write_pages(pages, checkpoints)를 호출합니다.
+       checkpoints는 이 배치가 저장되면 옮겨도 되는 샤드별 next_page로, 같은 트랜잭션에서 기록해야 합니다.
+
+    페이지는 순서 없이 끝나므로 체크포인트는 연속으로 저장된 페이지까지만 옮깁니다.
+    중간 페이지가 실패하면 그 샤드는 실패한 페이지부터 다시 받게 되고, 이미 저장된 뒤쪽 페이지는
+    다시 받더라도 SyncState가 '변경 없음'으로 걸러냅니다.
+    """
+    def __init__(
+        self,
+        shards: List[Shard],
+        fetch_page: Callable[[Shard, int], Awaitable[Tuple[List[Dict[str, Any]], int]]],
+        write_pages: Callable[[List[ShardPage], List[Checkpoint]], int],
+        per_page: int = 100,
+        concurrency: Union[int, Callable[[], int]] = 4,
+        queue_size: int = 8,
+        batch_pages: int = 5,
+        abort_on: Tuple[Type[BaseException], ...] = (),
+    ):
+        super().__init__(HarvestResult(shards=len(shards)), concurrency, queue_size, batch_pages, abort_on)
+        self.shards = shards
+        self.fetch_page = fetch_page
+        self.write_pages = write_pages
+        self.per_page = per_page
+
+    async def run(self) -> HarvestResult:
+        # 1단계: 샤드별 재개 페이지 (totalCount 확인 겸)
+        # 저장 단계가 그사이 next_page를 옮기므로 시작 페이지는 따로 기억해 둠
+        resume_pages = {shard.key: shard.next_page for shard in self.shards}
+        # 2단계: 페이지 수를 알게 된 샤드의 나머지 페이지
+        await self._run(
+            lambda: iter([(shard, shard.next_page) for shard in self.shards]),
+            lambda: (
+                (shard, page_no)
+                for shard in self.shards if shard.total_pages is not None
+                for page_no in range(resume_pages[shard.key] + 1, shard.total_pages + 1)
+            ),
+        )
+        return self._result
+
+    async def _fetch(self, shard: Shard, page_no: int) -> Tuple[List[Dict[str, Any]], int]:
+        return await self.fetch_page(shard, page_no)
+
+    def _accept(self, shard: Shard, page_no: int, items: List[Dict[str, Any]], total_count: int) -> bool:
+        if shard.total_pages is None:
+            shard.total_count = total_count or 0
+            shard.total_pages = math.ceil(shard.total_count / self.per_page)
+            self._result.planned_pages += max(shard.total_pages, page_no) - page_no + 1
+        # 빈 페이지도 저장 단계로 넘겨야 체크포인트가 앞으로 나갑니다 (항목이 없는 샤드 포함).
+        return True
+
+    def _record_failure(self, shard: Shard, page_no: int, error: BaseException) -> None:
+        # 체크포인트는 이 페이지 앞에서 멈추므로 다음 실행에서 여기부터 다시 받게 됩니다.
+        print(f"⚠️ 샤드 {shard.key} Page {page_no} 수집 실패: {error}")
+        shard.failed_pages.append(page_no)
+        self._result.failed_pages.append((shard.key, page_no))
+
+    def _checkpoints(self, batch: List[ShardPage]) -> List[Checkpoint]:
+        pages_by_shard: Dict[str, Tuple[Shard, List[int]]] = {}
+        for shard, page_no, _ in batch:
+            pages_by_shard.setdefault(shard.key, (shard, []))[1].append(page_no)
+        checkpoints = []
+        for shard, pages in pages_by_shard.values():
+            next_page, done = shard.checkpoint_after(pages)
+            checkpoints.append((shard, next_page, done))
+        return checkpoints
+
+    async def _save(self, batch: List[ShardPage]) -> int:
+        result = self._result
+        checkpoints = self._checkpoints(batch)
+        saved = await asyncio.to_thread(self.write_pages, batch, checkpoints)
+
+        # 커밋된 뒤에만 메모리의 진행 상황을 옮김
+        for shard, page_no, _ in batch:
+            shard.written.add(page_no)
+        for shard, next_page, shard_done in checkpoints:
+            shard.written = {p for p in shard.written if p >= next_page}
+            shard.next_page = next_page
+            if shard_done and not shard.done:
+                shard.done = True
+                result.completed_shards += 1
+                print(f"✅ 샤드 {shard.key} 완료 ({shard.total_count}건)")
+        return saved
+
+    def _announce(self) -> None:
+        print(f"샤드 {len(self.shards)}개, 동시 수집 {self._result.concurrency}개")
+
+    def _progress(self) -> str:
+        result = self._result
+        return f"진행 {result.write.pages}/{result.planned_pages}페이지 | 샤드 {result.completed_shards}/{result.shards}"
+
+    def _describe(self, batch: List[ShardPage]) -> str:
+        return ", ".join(f"{shard.key}#{page_no}" for shard, page_no, _ in batch)
@@ -0,0 +1,367 @@
+# app/services/sync_pipeline.py
+
+from __future__ import annotations
+import abc
+import asyncio
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+
+from app.clients.resilience import CircuitOpenError
+
+T = TypeVar("T")
+
+# 페이지 하나: (페이지 번호, TourAPI 원본 항목 목록)
+Page = Tuple[int, List[Dict[str, Any]]]
+# 수집할 작업 하나: (키, 페이지 번호). 키는 목록을 구분하는 값 (샤드 등, 목록이 하나면 None)
+WorkItem = Tuple[Any, int]
+# 대기열에 들어가는 페이지: (키, 페이지 번호, TourAPI 원본 항목 목록)
+KeyedPage = Tuple[Any, int, List[Dict[str, Any]]]
+
+# 대기열 종료 표시
+_DONE = object()
+
+# 회로가 열려 거절된 페이지 하나를 다시 요청하기까지 기다릴 수 있는 최대 시간 합 (초)
+CIRCUIT_WAIT_LIMIT = 600.0
+
+
+async def wait_out_circuit(
+    fetch: Callable[[], Awaitable[T]], aborted: Callable[[], bool], limit: float = CIRCUIT_WAIT_LIMIT
+) -> T:
+    """
+    fetch()가 회로 열림(CircuitOpenError)으로 거절되면 회로가 시험 요청을 받을 때까지(retry_after) 기다렸다가 다시 요청합니다.
+    회로는 잠시 뒤 닫힐 수 있으므로 수집을 중단하지 않고 기다리며, 수집이 중단됐거나 기다린 시간이 limit를 넘으면 그대로 던집니다.
+    """
+    waited = 0.0
+    while True:
+        try:
+            return await fetch()
+        except CircuitOpenError as e:
+            if aborted() or waited + e.retry_after > limit:
+                raise
+            waited += e.retry_after
+            await asyncio.sleep(e.retry_after)
+
+
+@dataclass
+class StageStats:
+    """파이프라인 단계(수집/저장)별 처리량. busy는 해당 단계가 실제로 일한 시간의 합입니다."""
+    name: str
+    pages: int = 0
+    items: int = 0
+    busy: float = 0.0
+
+    def add(self, items: int, seconds: float) -> None:
+        self.pages += 1
+        self.items += items
+        self.busy += seconds
+
+    def summary(self, elapsed: float) -> str:
+        return (
+            f"{self.name} {self.pages}페이지/{self.items}건 "
+            f"({self.items / max(elapsed, 1e-9):.0f}건/초, 작업 시간 {self.busy:.1f}초)"
+        )
+
+
+@dataclass
+class PipelineResult:
+    total_count: int = 0
+    planned_pages: int = 0
+    start_page: int = 1
+    concurrency: int = 0
+    failed_pages: List[int] = field(default_factory=list)
+    stopped_at: Optional[int] = None     # should_stop으로 일찍 멈춘 페이지
+    aborted: bool = False                # abort_on 오류 등으로 남은 페이지를 요청하지 않고 끝남
+    error: Optional[BaseException] = None  # 저장 단계에서 난 오류 (이후 저장 중단)
+    elapsed: float = 0.0
+    fetch: StageStats = field(default_factory=lambda: StageStats("수집"))
+    write: StageStats = field(default_factory=lambda: StageStats("저장"))
+    saved_rows: int = 0
+    backpressure_wait: float = 0.0       # 대기열이 가득 차 수집 작업이 기다린 시간의 합
+    max_queue: int = 0
+
+    @property
+    def completed(self) -> bool:
+        """실패한 페이지 없이 끝까지(또는 기준점까지) 반영했는지 여부"""
+        return self.error is None and not self.failed_pages and not self.aborted
+
+    def summary(self) -> str:
+        return (
+            f"동시 수집 {self.concurrency}개 | {self.fetch.summary(self.elapsed)} | {self.write.summary(self.elapsed)} | "
+            f"저장 {self.saved_rows}건 | 대기열 최대 {self.max_queue}, 대기 {self.backpressure_wait:.1f}초 | "
+            f"총 {self.elapsed:.1f}초"
+        )
+
+
+class PagePipeline(abc.ABC):
+    """
+    (키, 페이지 번호) 작업 목록을 수집하고 DB에 저장하는 생산자/소비자 파이프라인의 공통 부분.
+
+    1. 작업 목록(phase)을 차례로 받아, 첫 작업은 혼자 요청하고 그 응답 시간을 보고 동시 수집 수를 정합니다.
+       (concurrency에 함수를 넘기면 이때 호출합니다)
+    2. 나머지 작업은 concurrency개의 수집 작업이 나눠 받아 크기가 제한된 asyncio.Queue에 넣습니다.
+       대기열이 가득 차면 수집이 멈추므로(backpressure) 저장이 느려도 메모리가 늘지 않습니다.
+    3. 저장 작업 하나가 대기열에서 최대 batch_pages개를 꺼내 _save로 한 번에 저장합니다.
+
+    abort_on에 든 예외(호출 한도 초과 등)로 수집이 실패하면 나머지 작업은 요청하지 않습니다.
+    회로 열림(CircuitOpenError)은 중단 사유가 아니며, 해당 페이지는 회로가 다시 요청을 받을 때까지 기다렸다가 받습니다.
+
+    하위 클래스는 _fetch(요청), _accept(받은 페이지 반영), _record_failure, _save(저장),
+    _announce/_progress/_describe(출력)를 정합니다. 작업 목록은 수집 중에 줄어들 수 있도록 지연 생성기여도 됩니다.
+    """
+    def __init__(
+        self,
+        result,
+        concurrency: Union[int, Callable[[], int]] = 4,
+        queue_size: int = 8,
+        batch_pages: int = 5,
+        abort_on: Tuple[Type[BaseException], ...] = (),
+    ):
+        self.concurrency = concurrency
+        self.queue_size = max(1, queue_size)
+        self.batch_pages = max(1, batch_pages)
+        self.abort_on = abort_on
+
+        self._result = result
+        self._workers: Optional[int] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._abort = False
+        self._started = 0.0
+
+    @property
+    def aborted(self) -> bool:
+        """abort_on 오류나 저장 실패로 수집을 중단했는지 (fetch_page 안에서 기다리던 요청을 그만둘 때 사용)"""
+        return self._abort
+
+    def abort(self) -> None:
+        """
+        더 요청해도 실패할 오류로 수집을 중단합니다. 이미 받은 페이지는 저장하고, 남은 작업은 요청하지 않습니다.
+        fetch_page가 일부만 받은 페이지를 반환하면서 중단해야 할 때 직접 호출합니다.
+        """
+        if not self._abort:
+            print("❌ 더 요청해도 실패할 오류라 수집을 중단합니다.")
+            self._abort = True
+            self._result.aborted = True
+
+    async def _run(self, *phases: Callable[[], Iterator[WorkItem]]) -> None:
+        """phases를 순서대로 수집합니다. 각 phase는 앞 phase가 끝난 뒤 호출되어 작업 목록을 만듭니다."""
+        self._started = time.perf_counter()
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        writer = asyncio.create_task(self._writer())
+        for phase in phases:
+            await self._crawl(phase())
+        await self._queue.put(_DONE)
+        await writer
+        self._result.elapsed = time.perf_counter() - self._started
+
+    async def _crawl(self, work: Iterator[WorkItem]) -> None:
+        if self._workers is None:
+            # 첫 요청은 혼자 보내고, 그 응답 시간을 보고 동시 수집 수를 정함
+            first = next(work, None)
+            if first is not None:
+                await self._fetch_item(*first)
+            self._workers = max(1, self.concurrency() if callable(self.concurrency) else self.concurrency)
+            self._result.concurrency = self._workers
+            self._announce()
+
+        async def worker() -> None:
+            for key, page_no in work:
+                if self._abort:
+                    break
+                await self._fetch_item(key, page_no)
+
+        await asyncio.gather(*[asyncio.create_task(worker()) for _ in range(self._workers)])
+
+    async def _fetch_item(self, key: Any, page_no: int) -> None:
+        result = self._result
+        started = time.perf_counter()
+        try:
+            items, total_count = await wait_out_circuit(lambda: self._fetch(key, page_no), lambda: self._abort)
+        except Exception as e:
+            self._record_failure(key, page_no, e)
+            if isinstance(e, self.abort_on):
+                self.abort()
+            return
+        result.fetch.add(len(items), time.perf_counter() - started)
+        if not self._accept(key, page_no, items, total_count):
+            return
+
+        waited = time.perf_counter()
+        await self._queue.put((key, page_no, items))
+        result.backpressure_wait += time.perf_counter() - waited
+        result.max_queue = max(result.max_queue, self._queue.qsize())
+
+    async def _writer(self) -> None:
+        result = self._result
+        queue = self._queue
+        done = False
+        while not done:
+            first = await queue.get()
+            if first is _DONE:
+                break
+            batch = [first]
+            while len(batch) < self.batch_pages:
+                try:
+                    page = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if page is _DONE:
+                    done = True
+                    break
+                batch.append(page)
+
+            # 오류 이후에는 대기열만 비워 수집 작업이 put에서 멈추지 않게 합니다.
+            batch = self._select(batch)
+            if result.error is not None or not batch:
+                continue
+
+            started = time.perf_counter()
+            try:
+                saved = await self._save(batch)
+            except Exception as e:
+                print(f"❌ 저장 실패 ({self._describe(batch)}): {e}")
+                result.error = e
+                self._abort = True
+                continue
+            seconds = time.perf_counter() - started
+            for _, _, items in batch:
+                result.write.add(len(items), seconds / len(batch))
+            result.saved_rows += saved
+
+            elapsed = time.perf_counter() - self._started
+            print(
+                f"{self._progress()} | 이번 배치 {len(batch)}페이지 저장 {saved}건 "
+                f"({seconds:.2f}초) | 대기열 {queue.qsize()}/{self.queue_size} | "
+                f"수집 {result.fetch.items / max(elapsed, 1e-9):.0f}건/초, 저장 {result.write.items / max(elapsed, 1e-9):.0f}건/초"
+            )
+
+    # --- 하위 클래스에서 정하는 부분 ---
+
+    @abc.abstractmethod
+    async def _fetch(self, key: Any, page_no: int) -> Tuple[List[Dict[str, Any]], int]:
+        """작업 하나를 요청해 (항목 목록, totalCount)를 반환합니다."""
+        ...
+
+    def _accept(self, key: Any, page_no: int, items: List[Dict[str, Any]], total_count: int) -> bool:
+        """받은 페이지를 반영하고, 저장 단계로 넘길지 반환합니다."""
+        return True
+
+    @abc.abstractmethod
+    def _record_failure(self, key: Any, page_no: int, error: BaseException) -> None:
+        """수집에 실패한 작업을 기록합니다."""
+        ...
+
+    def _select(self, batch: List[KeyedPage]) -> List[KeyedPage]:
+        """배치 중 실제로 저장할 페이지"""
+        return batch
+
+    @abc.abstractmethod
+    async def _save(self, batch: List[KeyedPage]) -> int:
+        """배치를 저장하고 저장한 행 수를 반환합니다. 동기 DB 코드는 스레드에서 실행해야 합니다."""
+        ...
+
+    def _announce(self) -> None:
+        pass
+
+    def _progress(self) -> str:
+        return f"진행 {self._result.write.pages}페이지"
+
+    def _describe(self, batch: List[KeyedPage]) -> str:
+        return ", ".join(f"{key}#{page_no}" for key, page_no, _ in batch)
+
+
+class SyncPipeline(PagePipeline):
+    """
+    TourAPI 목록 하나(페이지 번호 1..N)의 수집과 DB 저장을 겹쳐서 실행하는 파이프라인.
+
+    1. start_page(기본 1, 이어받기 시 마지막 커밋 페이지 다음)를 먼저 받아 totalCount로 전체 페이지 수를 정합니다.
+    2. 나머지 페이지는 concurrency개의 수집 작업이 나눠 받습니다 (PagePipeline).
+    3. 저장 작업 하나가 최대 batch_pages개를 write_pages([(page_no, items), ...])로 한 번에 저장합니다.
+       write_pages는 동기 DB 코드이므로 스레드에서 실행하며, 한 번에 하나만 실행됩니다.
+
+    should_stop(page_no, items)이 True를 반환하면 그 페이지 이후는 더 받지 않습니다 (증분 동기화의 기준점 도달).
+    concurrency에 함수를 넘기면 첫 페이지를 받은 뒤 호출해 동시 수집 수를 정합니다 (응답 시간을 보고 자동 조정).
+    빈 페이지는 TourAPI 목록이 totalCount보다 일찍 끝난 것으로 보고 그 뒤를 받지 않습니다.
+    페이지 수가 미리 정해진 작업(개요 보강 등)은 empty_page_ends=False로 빈 페이지를 건너뛰기만 합니다.
+    """
+    def __init__(
+        self,
+        fetch_page: Callable[[int], Awaitable[Tuple[List[Dict[str, Any]], int]]],
+        write_pages: Callable[[List[Page]], int],
+        per_page: int = 100,
+        concurrency: Union[int, Callable[[], int]] = 4,
+        queue_size: int = 8,
+        batch_pages: int = 5,
+        should_stop: Optional[Callable[[int, List[Dict[str, Any]]], bool]] = None,
+        abort_on: Tuple[Type[BaseException], ...] = (),
+        start_page: int = 1,
+        empty_page_ends: bool = True,
+    ):
+        self.start_page = max(1, start_page)
+        super().__init__(PipelineResult(start_page=self.start_page), concurrency, queue_size, batch_pages, abort_on)
+        self.fetch_page = fetch_page
+        self.write_pages = write_pages
+        self.per_page = per_page
+        self.should_stop = should_stop
+        self.empty_page_ends = empty_page_ends
+
+        self._next_page = self.start_page + 1
+        self._last_page = self.start_page
+
+    async def run(self) -> PipelineResult:
+        await self._run(lambda: iter([(None, self.start_page)]), self._remaining_pages)
+        self._result.failed_pages.sort()
+        return self._result
+
+    def _remaining_pages(self) -> Iterator[WorkItem]:
+        # 기준점 도달이나 빈 페이지로 _last_page가 줄면 그 뒤 페이지는 만들지 않음
+        while self._next_page <= self._last_page:
+            page_no = self._next_page
+            self._next_page += 1
+            yield None, page_no
+
+    def _check_stop(self, page_no: int, items: List[Dict[str, Any]]) -> None:
+        if self.should_stop is not None and self.should_stop(page_no, items) and page_no < self._last_page:
+            self._last_page = page_no
+            self._result.stopped_at = page_no
+
+    async def _fetch(self, key: Any, page_no: int) -> Tuple[List[Dict[str, Any]], int]:
+        return await self.fetch_page(page_no)
+
+    def _accept(self, key: Any, page_no: int, items: List[Dict[str, Any]], total_count: int) -> bool:
+        result = self._result
+        if page_no == self.start_page:
+            result.total_count = total_count or 0
+            result.planned_pages = math.ceil(result.total_count / self.per_page) if result.total_count else 0
+            self._last_page = max(result.planned_pages, page_no if items or not self.empty_page_ends else page_no - 1)
+        elif not items and self.empty_page_ends:
+            # totalCount보다 일찍 목록이 끝난 경우
+            self._last_page = min(self._last_page, page_no - 1)
+        if not items:
+            return False
+        self._check_stop(page_no, items)
+        return True
+
+    def _record_failure(self, key: Any, page_no: int, error: BaseException) -> None:
+        # 실패한 페이지가 있으면 기준점을 옮기지 않으므로 다음 실행에서 다시 받게 됩니다.
+        print(f"⚠️ Page {page_no} 수집 실패: {error}")
+        self._result.failed_pages.append(page_no)
+
+    def _select(self, batch: List[KeyedPage]) -> List[KeyedPage]:
+        # 기준점보다 뒤의 페이지(동시에 미리 받아 둔 것)는 저장하지 않습니다.
+        return [page for page in batch if page[1] <= self._last_page]
+
+    async def _save(self, batch: List[KeyedPage]) -> int:
+        return await asyncio.to_thread(self.write_pages, [(page_no, items) for _, page_no, items in batch])
+
+    def _announce(self) -> None:
+        result = self._result
+        resume_note = f", {self.start_page}페이지부터 이어받기" if self.start_page > 1 else ""
+        print(f"총 {result.total_count}건 ({result.planned_pages}페이지{resume_note}), 동시 수집 {result.concurrency}개")
+
+    def _progress(self) -> str:
+        return f"진행 {self._result.write.pages}/{self._last_page - self.start_page + 1}페이지"
+
+    def _describe(self, batch: List[KeyedPage]) -> str:
+        return f"Page {', '.join(str(page_no) for _, page_no, _ in batch)}"
@@ -0,0 +1,140 @@
+# app/services/sync_run_service.py
+
+from __future__ import annotations
+import datetime
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.sync_models import SyncRun
+
+# 실행 상태
+RUN_RUNNING = "running"      # 진행 중 (프로세스가 강제 종료되면 이 상태로 남음)
+RUN_COMPLETED = "completed"
+RUN_FAILED = "failed"
+
+MODE_FULL = "full"
+MODE_INCREMENTAL = "incremental"
+
+
+class CommittedPages:
+    """
+    동시 수집으로 페이지가 순서 없이 저장될 때, start_page부터 빈틈없이 저장된 마지막 페이지를 추적합니다.
+    preview로 이번 배치가 커밋되면 옮겨 갈 값을 구해 같은 트랜잭션에 기록하고, 커밋 후 commit으로 반영합니다.
+    """
+    def __init__(self, start_page: int):
+        self.last = start_page - 1
+        self._ahead: set = set()
+
+    def preview(self, pages: Iterable[int]) -> int:
+        ahead = self._ahead | set(pages)
+        last = self.last
+        while last + 1 in ahead:
+            last += 1
+        return last
+
+    def commit(self, pages: Iterable[int]) -> None:
+        self._ahead |= set(pages)
+        self.last = self.preview(())
+        self._ahead = {p for p in self._ahead if p > self.last}
+
+
+def start_sync_run(
+    db: Session,
+    entity: str,
+    mode: str,
+    params: Dict[str, Any],
+    previous: Optional[SyncRun] = None,
+) -> SyncRun:
+    """실행 원장에 새 실행을 기록합니다. previous를 넘기면 그 실행의 마지막 커밋 페이지 다음부터 시작합니다."""
+    run = SyncRun(
+        entity=entity,
+        mode=mode,
+        status=RUN_RUNNING,
+        params=json.dumps(params, ensure_ascii=False),
+        resumed_from=previous.id if previous else None,
+        start_page=previous.last_page + 1 if previous else 1,
+        last_page=previous.last_page if previous else 0,
+        newest_modified=previous.newest_modified if previous else None,
+        started_at=datetime.datetime.now(), # finished_at과 같은 시계로 소요 시간을 계산하기 위해 앱에서 기록
+    )
+    db.add(run)
+    db.commit()
+    return run
+
+
+def find_resumable_run(db: Session, entity: str) -> Optional[SyncRun]:
+    """엔티티의 가장 최근 실행이 끝나지 못했으면(실패 또는 강제 종료) 그 실행을 반환합니다."""
+    latest = (
+        db.query(SyncRun)
+        .filter(SyncRun.entity == entity)
+        .order_by(SyncRun.id.desc())
+        .first()
+    )
+    if latest is None or latest.status == RUN_COMPLETED:
+        return None
+    return latest
+
+
+def run_params(run: SyncRun) -> Dict[str, Any]:
+    return json.loads(run.params) if run.params else {}
+
+
+def record_sync_progress(
+    db: Session,
+    run: SyncRun,
+    last_page: int,
+    counts: Dict[str, int],
+    saved_rows: int,
+    newest_modified: Optional[str],
+) -> None:
+    """
+    배치 저장 결과를 실행 원장에 반영합니다. 커밋하지 않으므로 데이터를 저장한 트랜잭션과 함께 커밋해야
+    '저장됐는데 원장에는 없음' 같은 어긋남이 생기지 않습니다.
+    """
+    run.last_page = max(run.last_page, last_page)
+    run.inserted = counts.get("inserted", 0)
+    run.updated = counts.get("updated", 0)
+    run.unchanged = counts.get("unchanged", 0)
+    run.saved_rows += saved_rows
+    if newest_modified and (run.newest_modified is None or newest_modified > run.newest_modified):
+        run.newest_modified = newest_modified
+
+
+def finish_sync_run(db: Session, run: SyncRun, result=None, error: Optional[BaseException] = None) -> None:
+    """
+    실행을 마감합니다. result(PipelineResult)가 끝까지 반영됐으면 completed, 아니면 failed로 남겨 --resume 대상이 됩니다.
+    저장 중 오류로 세션이 깨졌을 수 있으므로 먼저 롤백합니다.
+    """
+    try:
+        db.rollback()
+        _finish(run, result, error)
+        db.commit()
+    except Exception as e:
+        # DB 연결 자체가 끊긴 경우 등. 실행은 running으로 남고 다음 --resume 때 이어받기 대상이 됩니다.
+        db.rollback()
+        print(f"⚠️ 실행 원장 기록 실패: {e}")
+
+
+def _finish(run: SyncRun, result, error: Optional[BaseException]) -> None:
+    run.finished_at = datetime.datetime.now()
+    run.elapsed = (run.finished_at - run.started_at).total_seconds()
+    if result is not None:
+        run.total_count = result.total_count
+        run.planned_pages = result.planned_pages
+        run.fetched_items = result.fetch.items
+        run.failed_pages = len(result.failed_pages)
+        error = error or result.error
+    run.status = RUN_COMPLETED if result is not None and result.completed and error is None else RUN_FAILED
+    if error is not None:
+        run.error = f"{type(error).__name__}: {error}"[:2000]
+    elif result is not None and result.failed_pages:
+        run.error = f"수집 실패 페이지: {result.failed_pages[:50]}"
+
+
+def recent_sync_runs(db: Session, entity: Optional[str] = None, limit: int = 20) -> List[SyncRun]:
+    query = db.query(SyncRun)
+    if entity:
+        query = query.filter(SyncRun.entity == entity)
+    return query.order_by(SyncRun.id.desc()).limit(limit).all()
@@ -0,0 +1,73 @@
+# app/services/sync_watermark_service.py
+
+from __future__ import annotations
+import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.sync_models import SyncWatermark
+
+# TourAPI modifiedtime 형식
+MODIFIED_TIME_FORMAT = "%Y%m%d%H%M%S"
+
+
+def get_sync_watermark(db: Session, entity: str, scope: Optional[str] = None) -> Optional[str]:
+    """
+    기준점을 반환합니다. 저장된 scope(조회 조건)가 이번 조건과 다르면 None을 반환해 전체 동기화로 진행하게 합니다.
+    다른 기간으로 만든 기준점으로 멈추면, 이번 기간에만 있는 오래된 항목을 받지 못하기 때문입니다.
+    """
+    row = db.get(SyncWatermark, entity)
+    if row is None or row.scope != scope:
+        return None
+    return row.modified_time
+
+
+def save_sync_watermark(db: Session, entity: str, modified_time: str, scope: Optional[str] = None) -> None:
+    """
+    기준점을 저장합니다. 같은 scope에서는 기존 값보다 과거로 되돌리지 않고, scope가 바뀌면 새 조건의 값으로 교체합니다.
+    동기화가 끝까지 성공했을 때만 호출해야 중간에 실패한 구간을 건너뛰지 않습니다.
+    """
+    row = db.get(SyncWatermark, entity)
+    if row is None:
+        db.add(SyncWatermark(entity=entity, modified_time=modified_time, scope=scope))
+    elif row.scope != scope:
+        row.modified_time, row.scope = modified_time, scope
+    elif modified_time > row.modified_time:
+        row.modified_time = modified_time
+    db.commit()
+
+
+def watermark_cutoff(watermark: Optional[str], overlap_minutes: int) -> Optional[str]:
+    """
+    기준점에서 overlap_minutes만큼 앞당긴 값을 반환합니다.
+    같은 초에 수정된 항목이나 TourAPI 반영 지연으로 늦게 나타난 항목을 놓치지 않기 위한 여유 구간이며,
+    겹쳐서 다시 받은 항목은 SyncState가 '변경 없음'으로 걸러냅니다.
+    """
+    if not watermark:
+        return None
+    try:
+        moment = datetime.datetime.strptime(watermark[:14], MODIFIED_TIME_FORMAT)
+    except ValueError:
+        return None
+    return (moment - datetime.timedelta(minutes=overlap_minutes)).strftime(MODIFIED_TIME_FORMAT)
+
+
+def latest_modified_time(items: Iterable[Dict[str, Any]], current: Optional[str] = None) -> Optional[str]:
+    """항목들의 modifiedtime 중 가장 최근 값 (current와 비교해 더 큰 값)"""
+    for item in items:
+        value = item.get("modifiedtime")
+        if value and (current is None or value > current):
+            current = value
+    return current
+
+
+def split_at_cutoff(items: List[Dict[str, Any]], cutoff: Optional[str]) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    수정일 내림차순 페이지에서 cutoff 이후 항목만 남기고, cutoff에 도달했는지 함께 반환합니다.
+    cutoff가 없으면(첫 실행/전체 동기화) 모든 항목을 그대로 반환합니다.
+    """
+    if cutoff is None:
+        return items, False
+    fresh = [item for item in items if (item.get("modifiedtime") or "") >= cutoff]
+    return fresh, len(fresh) < len(items)
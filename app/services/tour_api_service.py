@@ -4,17 +4,10 @@ from typing import List, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
-from app.clients.tour_api_client import TourAPIClient 
+from app.clients.tour_api_client import tour_api_client # 앱 전체가 공유하는 커넥션 풀 클라이언트
+from app.clients.resilience import TourAPIError
 from app.models.tour_models import TourInfo # ORM 모델
 
-# 1. API 클라이언트 초기화 (서비스 파일 상단에 정의)
-try:
-    tour_api_client = TourAPIClient()
-except ValueError as e:
-    # API 키가 설정되지 않은 경우 처리
-    print(f"TourAPIClient 초기화 오류: {e}")
-    tour_api_client = None
-
 
 async def save_attraction_data(db: AsyncSession, data_list: List[Dict[str, Any]]):
     """
@@ -91,7 +84,11 @@ async def load_initial_attraction_data(db: AsyncSession):
     current_page = 1
     
     # 1. 전체 데이터 개수 파악
-    total_count = tour_api_client.get_total_count(area_code='', content_type_id=content_type_tour)
+    try:
+        total_count = await tour_api_client.get_total_count(area_code='', content_type_id=content_type_tour)
+    except TourAPIError as e:
+        print(f"Tour API 전체 개수 조회 실패: {e}")
+        return
     if total_count == 0:
         print("Tour API에서 가져올 데이터가 0건입니다. (API 키나 설정 확인 필요)")
         return
@@ -102,7 +99,7 @@ async def load_initial_attraction_data(db: AsyncSession):
     while (current_page - 1) * num_of_rows_per_page < total_count:
         try:
             # API 호출
-            data_items = tour_api_client.get_area_based_list(
+            data_items = await tour_api_client.get_area_based_list(
                 area_code='', # 전국(지역코드 생략)
                 content_type_id=content_type_tour,
                 num_of_rows=num_of_rows_per_page,
@@ -0,0 +1,257 @@
+# app/services/trip_service.py
+
+from __future__ import annotations
+import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.cache import ReadThroughCache
+from app.schemas import TripPlanRequest, TripPlanResponse
+from app.services.catalog_snapshot import (
+    catalog_snapshot, CatalogSnapshot, KIND_SPOT, KIND_FESTIVAL, ALWAYS_OPEN_END
+)
+from app.services.scoring_service import EARTH_RADIUS, haversine_np
+
+# 2-opt 개선 반복 최대 횟수 (50개 장소 기준으로 충분한 값)
+MAX_TWO_OPT_PASSES = 50
+# 날짜 제약이 없는 장소의 마지막 가능 일차
+NO_DEADLINE = 10 ** 6
+
+# 같은 장소 묶음에 대한 거리 행렬은 카탈로그 버전이 같으면 재사용합니다.
+distance_matrix_cache = ReadThroughCache("trip_distance_matrix", max_size=256)
+
+
+def pairwise_haversine(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """n개 지점의 n×n 거리 행렬(km)을 브로드캐스팅으로 한 번에 계산"""
+    lat_r, lon_r = np.radians(lat), np.radians(lon)
+    dlat = lat_r[:, None] - lat_r[None, :]
+    dlon = lon_r[:, None] - lon_r[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat_r)[:, None] * np.cos(lat_r)[None, :] * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _distance_matrix(snapshot: CatalogSnapshot, rows: List[int]) -> np.ndarray:
+    """
+    rows 순서대로의 거리 행렬을 반환합니다.
+    캐시는 정렬된 행 번호 묶음을 키로 사용하므로, 요청마다 순서가 달라도 같은 행렬을 재사용합니다.
+    """
+    sorted_rows = tuple(sorted(rows))
+    matrix = distance_matrix_cache.get_or_load(
+        (snapshot.version, sorted_rows),
+        lambda: pairwise_haversine(snapshot.lat[list(sorted_rows)], snapshot.lon[list(sorted_rows)]),
+    )
+    position = {row: i for i, row in enumerate(sorted_rows)}
+    perm = np.array([position[row] for row in rows], dtype=np.int64)
+    return matrix[np.ix_(perm, perm)]
+
+
+def _date_conflicts(route: np.ndarray, lo: np.ndarray, hi: np.ndarray, stops_per_day: int) -> int:
+    """방문 일차가 열리는 기간(lo~hi)을 벗어난 장소 수 (응답의 date_conflict 개수)"""
+    days = np.arange(route.size) // stops_per_day
+    return int(np.count_nonzero((lo[route] > days) | (days > hi[route])))
+
+
+def _nearest_neighbor(
+    dist: np.ndarray,
+    start_dist: Optional[np.ndarray],
+    lo: np.ndarray,
+    hi: np.ndarray,
+    stops_per_day: int,
+) -> np.ndarray:
+    """
+    가장 가까운 장소를 차례로 고르되, 그날이 마감인 축제는 먼저 방문하고
+    아직 열리지 않은 축제는 뒤로 미룹니다.
+    """
+    n = dist.shape[0]
+    visited = np.zeros(n, dtype=bool)
+    route = []
+    current = None
+
+    for pos in range(n):
+        day = pos // stops_per_day
+        remaining = ~visited
+        reach = start_dist if current is None else dist[current]
+        if reach is None:
+            # 출발지가 없으면 가장 바깥쪽(무게중심에서 먼) 장소에서 시작합니다.
+            reach = -dist.sum(axis=1)
+
+        open_now = remaining & (lo <= day)
+        urgent = open_now & (hi <= day)
+        pool = urgent if urgent.any() else (open_now if open_now.any() else remaining)
+
+        candidates = np.flatnonzero(pool)
+        nxt = int(candidates[np.argmin(reach[candidates])])
+        route.append(nxt)
+        visited[nxt] = True
+        current = nxt
+
+    return np.array(route, dtype=np.int64)
+
+
+def _route_length(route: np.ndarray, dist: np.ndarray, start_dist: Optional[np.ndarray]) -> float:
+    total = float(dist[route[:-1], route[1:]].sum())
+    if start_dist is not None:
+        total += float(start_dist[route[0]])
+    return total
+
+
+def _two_opt(
+    route: np.ndarray,
+    dist: np.ndarray,
+    start_dist: Optional[np.ndarray],
+    lo: np.ndarray,
+    hi: np.ndarray,
+    stops_per_day: int,
+) -> np.ndarray:
+    """
+    열린 경로(돌아오지 않음)에 대한 2-opt.
+    i를 고정하고 모든 j에 대한 개선량을 벡터로 계산한 뒤, 날짜 제약을 지키는 가장 큰 개선부터 적용합니다.
+    최근접 이웃 경로에 이미 기간을 벗어난 장소가 있어도, 그 수를 늘리는 뒤집기는 받아들이지 않습니다.
+    """
+    n = route.size
+    if n < 3:
+        return route
+
+    conflicts = _date_conflicts(route, lo, hi, stops_per_day)
+
+    for _ in range(MAX_TWO_OPT_PASSES):
+        improved = False
+        for i in range(n - 1):
+            js = np.arange(i + 1, n)
+            a, b = route[i], route[js]
+
+            # 구간 [i..j]를 뒤집을 때 바뀌는 간선: (i-1, i) → (i-1, j), (j, j+1) → (i, j+1)
+            if i > 0:
+                prev = route[i - 1]
+                delta = dist[prev, b] - dist[prev, a]
+            elif start_dist is not None:
+                delta = start_dist[b] - start_dist[a]
+            else:
+                delta = np.zeros(js.size)
+
+            has_next = js < n - 1
+            nxt = route[np.minimum(js + 1, n - 1)]
+            delta = delta + np.where(has_next, dist[a, nxt] - dist[b, nxt], 0.0)
+
+            for k in np.argsort(delta):
+                if delta[k] >= -1e-9:
+                    break
+                j = int(js[k])
+                candidate = route.copy()
+                candidate[i:j + 1] = candidate[i:j + 1][::-1]
+                candidate_conflicts = _date_conflicts(candidate, lo, hi, stops_per_day)
+                if candidate_conflicts > conflicts:
+                    continue
+                route, conflicts = candidate, candidate_conflicts
+                improved = True
+                break
+        if not improved:
+            break
+    return route
+
+
+def plan_trip(db: Session, request: TripPlanRequest) -> TripPlanResponse:
+    snapshot = catalog_snapshot.get(db)
+    today = datetime.date.today()
+    today_int = today.year * 10000 + today.month * 100 + today.day
+    spd = request.stops_per_day
+
+    # 1. 요청 항목을 스냅샷 행으로 변환 (중복 제거, 좌표/기간 확인)
+    rows: List[int] = []
+    skipped: List[Dict[str, Any]] = []
+    seen = set()
+    for item in request.items:
+        item_id = str(item.item_id)
+        kind = KIND_SPOT if item.item_type == "SPOT" else KIND_FESTIVAL
+        if (kind, item_id) in seen:
+            continue
+        seen.add((kind, item_id))
+
+        row = snapshot.row_of(kind, item_id)
+        if row is None:
+            skipped.append({"item_type": item.item_type, "item_id": item_id, "reason": "위치 정보를 찾을 수 없습니다."})
+        elif kind == KIND_FESTIVAL and snapshot.end_date[row] < today_int:
+            skipped.append({"item_type": item.item_type, "item_id": item_id, "reason": "이미 종료된 축제입니다."})
+        else:
+            rows.append(row)
+
+    # 2. 축제 기간을 여행 일차(day index) 범위로 변환
+    lo_list, hi_list = [], []
+    kept_rows = []
+    last_day = (len(rows) - 1) // spd if rows else 0
+    for row in rows:
+        lo, hi = 0, NO_DEADLINE
+        if request.start_date and snapshot.kind[row] == KIND_FESTIVAL:
+            start = _int_to_date(int(snapshot.start_date[row]))
+            end = _int_to_date(int(snapshot.end_date[row]))
+            if start:
+                lo = max(0, (start - request.start_date).days)
+            if end:
+                hi = (end - request.start_date).days
+            if hi < 0 or lo > last_day:
+                skipped.append({
+                    "item_type": "FESTIVAL",
+                    "item_id": snapshot.contentid[row],
+                    "reason": "여행 기간 중에 열리지 않는 축제입니다.",
+                })
+                continue
+        kept_rows.append(row)
+        lo_list.append(lo)
+        hi_list.append(hi)
+
+    if not kept_rows:
+        return TripPlanResponse(total_km=0.0, days=0, route=[], skipped=skipped)
+
+    # 3. 거리 행렬 + 최근접 이웃 + 2-opt
+    dist = _distance_matrix(snapshot, kept_rows)
+    lo_arr = np.array(lo_list, dtype=np.int64)
+    hi_arr = np.array(hi_list, dtype=np.int64)
+
+    start_dist = None
+    if request.start_lat is not None and request.start_lng is not None:
+        idx = np.array(kept_rows)
+        start_dist = haversine_np(request.start_lat, request.start_lng, snapshot.lat[idx], snapshot.lon[idx])
+
+    route = _nearest_neighbor(dist, start_dist, lo_arr, hi_arr, spd)
+    route = _two_opt(route, dist, start_dist, lo_arr, hi_arr, spd)
+
+    # 4. 응답 구성
+    stops = []
+    for pos, local in enumerate(route):
+        row = kept_rows[int(local)]
+        day = pos // spd
+        if pos == 0:
+            leg = float(start_dist[local]) if start_dist is not None else 0.0
+        else:
+            leg = float(dist[route[pos - 1], local])
+        stops.append({
+            "order": pos + 1,
+            "item_type": "SPOT" if snapshot.kind[row] == KIND_SPOT else "FESTIVAL",
+            "item_id": snapshot.contentid[row],
+            "title": snapshot.title[row],
+            "lat": float(snapshot.lat[row]),
+            "lng": float(snapshot.lon[row]),
+            "day": day + 1,
+            "date": request.start_date + datetime.timedelta(days=day) if request.start_date else None,
+            "leg_km": round(leg, 2),
+            "date_conflict": not (lo_arr[local] <= day <= hi_arr[local]),
+        })
+
+    return TripPlanResponse(
+        total_km=round(_route_length(route, dist, start_dist), 2),
+        days=(len(route) - 1) // spd + 1,
+        route=stops,
+        skipped=skipped,
+    )
+
+
+def _int_to_date(value: int) -> Optional[datetime.date]:
+    """YYYYMMDD 정수를 date로 변환합니다. 날짜 정보가 없거나 잘못된 값이면 None."""
+    if value <= 0 or value >= ALWAYS_OPEN_END:
+        return None
+    try:
+        return datetime.date(value // 10000, value // 100 % 100, value % 100)
+    except ValueError:
+        return None
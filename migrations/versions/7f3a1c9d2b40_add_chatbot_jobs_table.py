@@ -0,0 +1,37 @@
+"""Add chatbot_jobs table
+
+Revision ID: 7f3a1c9d2b40
+Revises: d464715012dc
+Create Date: 2026-10-19 10:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3a1c9d2b40'
+down_revision: Union[str, Sequence[str], None] = 'd464715012dc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('chatbot_jobs',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_chatbot_jobs'))
+    )
+    op.create_index(op.f('ix_chatbot_jobs_status'), 'chatbot_jobs', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_chatbot_jobs_status'), table_name='chatbot_jobs')
+    op.drop_table('chatbot_jobs')
@@ -0,0 +1,28 @@
+"""Add scope to sync_watermarks
+
+Revision ID: a7c4f19e2b83
+Revises: e8b3c51d7a06
+Create Date: 2026-10-20 00:41:06.527190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c4f19e2b83'
+down_revision: Union[str, Sequence[str], None] = 'e8b3c51d7a06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('sync_watermarks', sa.Column('scope', sa.String(length=40), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('sync_watermarks', 'scope')
@@ -0,0 +1,37 @@
+"""Add harvest_checkpoints table
+
+Revision ID: a8d3e61f0c27
+Revises: f4b07d2c9e58
+Create Date: 2026-10-19 20:12:08.551203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d3e61f0c27'
+down_revision: Union[str, Sequence[str], None] = 'f4b07d2c9e58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('harvest_checkpoints',
+    sa.Column('shard', sa.String(length=20), nullable=False),
+    sa.Column('area_code', sa.String(length=10), nullable=False),
+    sa.Column('content_type_id', sa.String(length=10), nullable=False),
+    sa.Column('next_page', sa.Integer(), nullable=False),
+    sa.Column('total_count', sa.Integer(), nullable=True),
+    sa.Column('done', sa.Boolean(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('shard', name=op.f('pk_harvest_checkpoints'))
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('harvest_checkpoints')
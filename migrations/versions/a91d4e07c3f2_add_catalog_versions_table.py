@@ -0,0 +1,33 @@
+"""Add catalog_versions table
+
+Revision ID: a91d4e07c3f2
+Revises: 7f3a1c9d2b40
+Create Date: 2026-10-19 11:03:47.118362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a91d4e07c3f2'
+down_revision: Union[str, Sequence[str], None] = '7f3a1c9d2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('catalog_versions',
+    sa.Column('entity', sa.String(length=20), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('entity', name=op.f('pk_catalog_versions'))
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('catalog_versions')
@@ -0,0 +1,53 @@
+"""Add sync_runs table
+
+Revision ID: b3f5d9a24e70
+Revises: a8d3e61f0c27
+Create Date: 2026-10-19 21:40:17.093624
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f5d9a24e70'
+down_revision: Union[str, Sequence[str], None] = 'a8d3e61f0c27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sync_runs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('entity', sa.String(length=20), nullable=False),
+    sa.Column('mode', sa.String(length=20), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('params', sa.Text(), nullable=True),
+    sa.Column('resumed_from', sa.Integer(), nullable=True),
+    sa.Column('start_page', sa.Integer(), nullable=False),
+    sa.Column('last_page', sa.Integer(), nullable=False),
+    sa.Column('planned_pages', sa.Integer(), nullable=True),
+    sa.Column('total_count', sa.Integer(), nullable=True),
+    sa.Column('newest_modified', sa.String(length=14), nullable=True),
+    sa.Column('fetched_items', sa.Integer(), nullable=False),
+    sa.Column('inserted', sa.Integer(), nullable=False),
+    sa.Column('updated', sa.Integer(), nullable=False),
+    sa.Column('unchanged', sa.Integer(), nullable=False),
+    sa.Column('saved_rows', sa.Integer(), nullable=False),
+    sa.Column('failed_pages', sa.Integer(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('elapsed', sa.Float(), nullable=True),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_sync_runs'))
+    )
+    op.create_index(op.f('ix_sync_runs_entity'), 'sync_runs', ['entity'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_sync_runs_entity'), table_name='sync_runs')
+    op.drop_table('sync_runs')
@@ -0,0 +1,45 @@
+"""Add user_taste_vectors and user_recommendations tables
+
+Revision ID: b5c2e8f14a67
+Revises: a91d4e07c3f2
+Create Date: 2026-10-19 13:22:05.640917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5c2e8f14a67'
+down_revision: Union[str, Sequence[str], None] = 'a91d4e07c3f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_taste_vectors',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('weights', sa.Text(), nullable=False),
+    sa.Column('favorite_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name=op.f('fk_user_taste_vectors_user_id_users'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', name=op.f('pk_user_taste_vectors'))
+    )
+    op.create_index(op.f('ix_user_taste_vectors_updated_at'), 'user_taste_vectors', ['updated_at'], unique=False)
+    op.create_table('user_recommendations',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('items', sa.Text(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name=op.f('fk_user_recommendations_user_id_users'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', name=op.f('pk_user_recommendations'))
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_recommendations')
+    op.drop_index(op.f('ix_user_taste_vectors_updated_at'), table_name='user_taste_vectors')
+    op.drop_table('user_taste_vectors')
@@ -0,0 +1,35 @@
+"""Add catalog_changes table
+
+Revision ID: c3d9f0a27e15
+Revises: b5c2e8f14a67
+Create Date: 2026-10-19 14:41:12.305518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d9f0a27e15'
+down_revision: Union[str, Sequence[str], None] = 'b5c2e8f14a67'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('catalog_changes',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('entity', sa.String(length=20), nullable=False),
+    sa.Column('contentid', sa.String(length=30), nullable=False),
+    sa.Column('op', sa.String(length=1), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_catalog_changes'))
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('catalog_changes')
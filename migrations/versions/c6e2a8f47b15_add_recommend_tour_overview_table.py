@@ -0,0 +1,35 @@
+"""Add recommend_tour_overview table
+
+Revision ID: c6e2a8f47b15
+Revises: b3f5d9a24e70
+Create Date: 2026-10-19 23:02:44.610385
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e2a8f47b15'
+down_revision: Union[str, Sequence[str], None] = 'b3f5d9a24e70'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('recommend_tour_overview',
+    sa.Column('contentid', sa.String(length=20), nullable=False),
+    sa.Column('overview', sa.Text(), nullable=True),
+    sa.Column('source_modified', sa.String(length=14), nullable=True),
+    sa.Column('content_hash', sa.String(length=16), nullable=True),
+    sa.Column('fetched_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('contentid', name=op.f('pk_recommend_tour_overview'))
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('recommend_tour_overview')
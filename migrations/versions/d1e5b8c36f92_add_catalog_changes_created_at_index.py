@@ -0,0 +1,28 @@
+"""Add index on catalog_changes.created_at
+
+Revision ID: d1e5b8c36f92
+Revises: c6e2a8f47b15
+Create Date: 2026-10-19 23:41:37.418206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1e5b8c36f92'
+down_revision: Union[str, Sequence[str], None] = 'c6e2a8f47b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_catalog_changes_created_at'), 'catalog_changes', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_catalog_changes_created_at'), table_name='catalog_changes')
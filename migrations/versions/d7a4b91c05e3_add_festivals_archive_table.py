@@ -0,0 +1,46 @@
+"""Add festivals_archive table and festivals end date index
+
+Revision ID: d7a4b91c05e3
+Revises: c3d9f0a27e15
+Create Date: 2026-10-19 15:58:40.271904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a4b91c05e3'
+down_revision: Union[str, Sequence[str], None] = 'c3d9f0a27e15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('festivals_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('contentid', sa.String(length=30), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('location', sa.String(length=255), nullable=True),
+    sa.Column('event_start_date', sa.String(length=8), nullable=True),
+    sa.Column('event_end_date', sa.String(length=8), nullable=True),
+    sa.Column('mapx', sa.Float(), nullable=True),
+    sa.Column('mapy', sa.Float(), nullable=True),
+    sa.Column('image_url', sa.Text(), nullable=True),
+    sa.Column('modified_time', sa.String(length=14), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('contentid')
+    )
+    op.create_index('ix_festivals_archive_event_end_date', 'festivals_archive', ['event_end_date'], unique=False)
+    op.create_index('idx_festivals_end_date', 'festivals', ['event_end_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_festivals_end_date', table_name='festivals')
+    op.drop_index('ix_festivals_archive_event_end_date', table_name='festivals_archive')
+    op.drop_table('festivals_archive')
@@ -0,0 +1,30 @@
+"""Add content_hash columns for skip-unchanged sync
+
+Revision ID: e2f86c3d1a94
+Revises: d7a4b91c05e3
+Create Date: 2026-10-19 17:12:09.553061
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2f86c3d1a94'
+down_revision: Union[str, Sequence[str], None] = 'd7a4b91c05e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('recommend_tourInfo', sa.Column('content_hash', sa.String(length=16), nullable=True))
+    op.add_column('festivals', sa.Column('content_hash', sa.String(length=16), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('festivals', 'content_hash')
+    op.drop_column('recommend_tourInfo', 'content_hash')
@@ -0,0 +1,28 @@
+"""Add content_hash to festivals_archive
+
+Revision ID: e8b3c51d7a06
+Revises: d1e5b8c36f92
+Create Date: 2026-10-19 23:52:18.096314
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b3c51d7a06'
+down_revision: Union[str, Sequence[str], None] = 'd1e5b8c36f92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('festivals_archive', sa.Column('content_hash', sa.String(length=16), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('festivals_archive', 'content_hash')
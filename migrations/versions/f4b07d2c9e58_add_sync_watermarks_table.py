@@ -0,0 +1,33 @@
+"""Add sync_watermarks table
+
+Revision ID: f4b07d2c9e58
+Revises: e2f86c3d1a94
+Create Date: 2026-10-19 18:05:41.302917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b07d2c9e58'
+down_revision: Union[str, Sequence[str], None] = 'e2f86c3d1a94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sync_watermarks',
+    sa.Column('entity', sa.String(length=20), nullable=False),
+    sa.Column('modified_time', sa.String(length=14), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('entity', name=op.f('pk_sync_watermarks'))
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('sync_watermarks')
@@ -0,0 +1,89 @@
+"""
+종료된 축제 아카이브 배치
+
+- 종료일(event_end_date)로부터 보관 기간(FESTIVAL_ARCHIVE_RETENTION_DAYS)이 지난 축제를
+  festivals → festivals_archive로 batch 단위 트랜잭션으로 옮깁니다.
+- 옮긴 축제는 카탈로그 변경 로그에 삭제로 기록되어 API 캐시와 앱 로컬 카탈로그에서도 빠집니다.
+- --restore로 특정 축제를 다시 festivals로 되돌릴 수 있습니다.
+
+사용법:
+  python scripts/archive_festivals.py [--retention-days 30] [--batch-size 1000] [--dry-run]
+  python scripts/archive_festivals.py --restore <contentid> [<contentid> ...]
+"""
+import os
+import sys
+import time
+import argparse
+from dotenv import load_dotenv
+
+# ====================================================================
+# .env 경로 강제 지정 및 로드
+# ====================================================================
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+try:
+    os.chdir(project_root)
+except FileNotFoundError:
+    pass
+load_dotenv()
+# ====================================================================
+
+from app.core.config import get_settings
+from app.db.database import SessionLocal
+from app.services.festival_archive_service import (
+    archive_cutoff, count_archivable, archive_batch, restore_festivals
+)
+
+settings = get_settings()
+
+
+def run_archive(retention_days: int, batch_size: int, dry_run: bool) -> None:
+    cutoff = archive_cutoff(retention_days)
+    db = SessionLocal()
+    try:
+        total = count_archivable(db, cutoff)
+        print(f"종료일 {cutoff} 이전 축제: {total}건 (보관 기간 {retention_days}일)")
+        if dry_run or total == 0:
+            return
+
+        started = time.perf_counter()
+        moved = 0
+        while True:
+            count = archive_batch(db, cutoff, batch_size)
+            if count == 0:
+                break
+            moved += count
+            elapsed = time.perf_counter() - started
+            print(f"  {moved}/{total}건 이동 ({moved / max(elapsed, 1e-9):.0f}건/초)")
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"✅ 아카이브 완료: {moved}건, {elapsed:.2f}초 ({moved / max(elapsed, 1e-9):.0f}건/초)")
+
+
+def run_restore(contentids) -> None:
+    db = SessionLocal()
+    try:
+        restored = restore_festivals(db, [str(c) for c in contentids])
+    finally:
+        db.close()
+    print(f"✅ 복원 완료: {restored}/{len(contentids)}건")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="종료된 축제 아카이브 / 복원")
+    parser.add_argument("--retention-days", type=int, default=settings.FESTIVAL_ARCHIVE_RETENTION_DAYS, help="종료 후 보관 기간(일)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="트랜잭션 하나에서 옮길 건수")
+    parser.add_argument("--dry-run", action="store_true", help="대상 건수만 출력")
+    parser.add_argument("--restore", nargs="+", metavar="CONTENTID", help="아카이브에서 되돌릴 축제 contentid")
+    args = parser.parse_args()
+
+    if args.restore:
+        run_restore(args.restore)
+    else:
+        run_archive(args.retention_days, args.batch_size, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
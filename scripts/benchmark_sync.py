@@ -0,0 +1,135 @@
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+import importlib.util
+
+import httpx
+from dotenv import load_dotenv
+from sqlalchemy import create_engine
+
+# ====================================================================
+# .env 경로 강제 지정 및 로드
+# ====================================================================
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+try:
+    os.chdir(project_root)
+except FileNotFoundError:
+    pass
+load_dotenv()
+# ====================================================================
+
+import app.db.database as database
+import app.models
+from app.models import festival_models
+from app.clients.fake_tour_api import FakeTourAPIConfig, create_fake_tour_api
+from app.clients.resilience import TokenBucket
+from app.clients.tour_api_client import TourAPIClient
+from app.clients.response_cache import ResponseCache, CACHE_OFF
+from app.core.config import get_settings
+
+settings = get_settings()
+
+FAKE_BASE_URL = "http://fake-tourapi"
+SYNC_SCRIPTS = {
+    "spots": "sync_recommends.py",
+    "festivals": "sync_festivals.py",
+}
+
+
+def load_sync_module(entity: str):
+    path = os.path.join(project_root, "scripts", SYNC_SCRIPTS[entity])
+    spec = importlib.util.spec_from_file_location(f"bench_{entity}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def reset_database(engine) -> None:
+    # 축제 모델은 별도의 declarative_base를 사용하므로 두 메타데이터를 모두 만듭니다.
+    for metadata in (database.Base.metadata, festival_models.Base.metadata):
+        metadata.drop_all(engine)
+        metadata.create_all(engine)
+
+
+async def run_once(module, entity: str, fake_app, concurrency: int, rate: float):
+    client = TourAPIClient(
+        base_url=FAKE_BASE_URL,
+        transport=httpx.ASGITransport(app=fake_app),
+        cache=ResponseCache(settings.TOUR_API_CACHE_DIR, CACHE_OFF),
+    )
+    if rate is not None:
+        client.rate_limiter = TokenBucket(rate, settings.TOUR_API_BURST)
+
+    started = time.perf_counter()
+    if entity == "spots":
+        result = await module.run_db_sync(concurrency=concurrency, client=client)
+    else:
+        result = await module.run_db_sync("20250101", "20251231", concurrency=concurrency, client=client)
+    return result, client.metrics, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 TourAPI를 상대로 전체 동기화 처리량 측정 (임시 SQLite DB 사용)")
+    parser.add_argument("--entity", choices=sorted(SYNC_SCRIPTS), default="spots")
+    parser.add_argument("--size", type=int, default=20_000, help="합성 카탈로그 크기")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="가짜 서버 응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 503 비율 (0~1)")
+    parser.add_argument("--concurrency", default="1,4,0", help="쉼표로 구분한 동시 수집 수 목록 (0: 자동)")
+    parser.add_argument("--rate", type=float, default=None, help="초당 호출 한도 (기본: TOUR_API_RATE_PER_SEC)")
+    parser.add_argument("--rerun", action="store_true", help="각 측정 뒤 같은 DB로 한 번 더 실행 (변경 없음 경로 측정)")
+    parser.add_argument("--verbose", action="store_true", help="동기화 스크립트 출력 그대로 보기")
+    args = parser.parse_args()
+
+    config = FakeTourAPIConfig(
+        spots=args.size if args.entity == "spots" else 0,
+        festivals=args.size if args.entity == "festivals" else 0,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+    )
+    fake_app = create_fake_tour_api(config)
+
+    # 동기화 스크립트가 쓰는 SessionLocal을 임시 SQLite DB로 바꿔 끼움 (운영 DB에는 쓰지 않음)
+    workdir = tempfile.mkdtemp(prefix="sync_bench_")
+    engine = create_engine(f"sqlite:///{os.path.join(workdir, 'bench.db')}")
+    database.engine = engine
+    database.SessionLocal.configure(bind=engine)
+    module = load_sync_module(args.entity)
+
+    rows = []
+    for concurrency in [int(c) for c in args.concurrency.split(",")]:
+        reset_database(engine)
+        passes = ["full", "rerun"] if args.rerun else ["full"]
+        for label in passes:
+            if args.verbose:
+                result, metrics, elapsed = asyncio.run(run_once(module, args.entity, fake_app, concurrency, args.rate))
+            else:
+                with open(os.devnull, "w") as devnull:
+                    stdout, sys.stdout = sys.stdout, devnull
+                    try:
+                        result, metrics, elapsed = asyncio.run(run_once(module, args.entity, fake_app, concurrency, args.rate))
+                    finally:
+                        sys.stdout = stdout
+            if result is None:
+                print(f"❌ concurrency={concurrency} {label}: 동기화가 중간에 실패했습니다 (--verbose로 확인)")
+                continue
+            rows.append((
+                label, concurrency, result.concurrency, result.fetch.items, result.saved_rows, elapsed,
+                result.fetch.items / max(elapsed, 1e-9), metrics.requests, metrics.retries,
+                metrics.throttle_wait, "OK" if result.completed else "INCOMPLETE",
+            ))
+
+    print("=" * 100)
+    print(f"{args.entity} {args.size}건 | 지연 {args.latency_ms}±{args.jitter_ms}ms | 오류율 {args.error_rate} | "
+          f"호출 한도 {args.rate if args.rate is not None else settings.TOUR_API_RATE_PER_SEC}/초")
+    print(f"{'pass':<6}{'conc':>6}{'실제':>6}{'수집':>9}{'저장':>9}{'초':>8}{'건/초':>9}{'요청':>7}{'재시도':>7}{'제한대기':>9}  결과")
+    for label, requested, actual, fetched, saved, elapsed, rate, requests, retries, throttle, status in rows:
+        print(f"{label:<6}{requested or 'auto':>6}{actual:>6}{fetched:>9}{saved:>9}{elapsed:>8.2f}{rate:>9.0f}"
+              f"{requests:>7}{retries:>7}{throttle:>9.1f}  {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+여행지 "비슷한 곳" kNN 그래프 생성 배치
+
+- 여행지마다 분류 코드(cat1/cat2/cat3), 콘텐츠 타입, 지역(areacode/sigungucode), 제목 글자 bigram으로
+  특징 벡터를 만들고(feature hashing), 코사인 유사도 상위 k개 이웃을 미리 계산해 .npz 파일로 저장합니다.
+- API는 이 파일을 읽어 /recommend/similar/{contentid} 요청을 조회 한 번으로 처리합니다.
+- sync_recommends.py 실행 후 함께 실행하는 것을 권장합니다.
+
+사용법: python scripts/build_similar_spots.py [--k 20] [--dim 1024] [--block 512] [--out data/similar_spots.npz]
+"""
+import os
+import sys
+import time
+import zlib
+import argparse
+from dotenv import load_dotenv
+
+import numpy as np
+from sqlalchemy import select
+
+# ====================================================================
+# .env 경로 강제 지정 및 로드
+# ====================================================================
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+try:
+    os.chdir(project_root)
+except FileNotFoundError:
+    pass
+load_dotenv()
+# ====================================================================
+
+from app.core.config import get_settings
+from app.db.database import SessionLocal
+from app.models.recommend_models import RecommendTourInfo
+
+settings = get_settings()
+
+# 특징 그룹별 가중치. 분류가 세밀할수록, 지역은 약하게 반영합니다.
+W_CAT1 = 1.0
+W_CAT2 = 1.5
+W_CAT3 = 2.0
+W_CONTENT_TYPE = 1.0
+W_AREA = 0.5
+W_SIGUNGU = 0.5
+W_TITLE = 1.5 # 제목 bigram 벡터 전체의 노름
+
+# 이 값 이하의 코사인 유사도는 이웃으로 저장하지 않습니다 (공통 특징이 없거나 해시 부호로 반대 방향인 경우).
+MIN_SIMILARITY = 0.0
+
+
+def _bucket(token: str, dim: int) -> tuple:
+    """문자열 특징을 dim 차원 중 하나의 열과 부호(+1/-1)로 매핑 (프로세스와 무관하게 고정된 해시)"""
+    h = zlib.crc32(token.encode("utf-8"))
+    return h % dim, (1.0 if (h >> 31) & 1 else -1.0)
+
+
+def _title_bigrams(title: str) -> list:
+    text = "".join((title or "").split())
+    return [text[i:i + 2] for i in range(len(text) - 1)] or ([text] if text else [])
+
+
+def build_features(rows, dim: int) -> np.ndarray:
+    """여행지별 특징 벡터(행 단위 L2 정규화)를 만듭니다."""
+    features = np.zeros((len(rows), dim), dtype=np.float32)
+
+    for i, (_, title, content_type, area, sigungu, cat1, cat2, cat3) in enumerate(rows):
+        vec = features[i]
+        for prefix, value, weight in (
+            ("c1", cat1, W_CAT1),
+            ("c2", cat2, W_CAT2),
+            ("c3", cat3, W_CAT3),
+            ("ct", content_type, W_CONTENT_TYPE),
+            ("ar", area, W_AREA),
+            ("sg", f"{area}-{sigungu}" if area and sigungu else None, W_SIGUNGU),
+        ):
+            if value:
+                col, sign = _bucket(f"{prefix}:{value}", dim)
+                vec[col] += sign * weight
+
+        bigrams = _title_bigrams(title)
+        if bigrams:
+            title_vec = np.zeros(dim, dtype=np.float32)
+            for gram in bigrams:
+                col, sign = _bucket(f"t:{gram}", dim)
+                title_vec[col] += sign
+            norm = np.linalg.norm(title_vec)
+            if norm > 0:
+                vec += title_vec * (W_TITLE / norm)
+
+    norms = np.linalg.norm(features, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return features / norms
+
+
+def top_k_neighbors(features: np.ndarray, k: int, block: int):
+    """
+    블록 단위 행렬곱으로 코사인 유사도를 계산하고, 블록마다 argpartition으로 상위 k개만 남깁니다.
+    메모리 사용량은 block × n 으로 제한됩니다.
+    유사도가 MIN_SIMILARITY 이하인 자리는 -1로 남겨, API가 그 앞에서 이웃 목록을 끝내도록 합니다.
+    """
+    n = features.shape[0]
+    k = min(k, max(n - 1, 0))
+    neighbors = np.full((n, k), -1, dtype=np.int32)
+    scores = np.zeros((n, k), dtype=np.float16)
+    if k == 0:
+        return neighbors, scores
+
+    for start in range(0, n, block):
+        end = min(start + block, n)
+        sims = features[start:end] @ features.T
+        sims[np.arange(end - start), np.arange(start, end)] = -np.inf # 자기 자신 제외
+
+        top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(sims, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        weak = top_scores <= MIN_SIMILARITY
+        top[weak] = -1
+        top_scores[weak] = 0.0
+        neighbors[start:end] = top
+        scores[start:end] = top_scores
+
+        if (start // block) % 20 == 0:
+            print(f"  진행: {end}/{n}")
+
+    return neighbors, scores
+
+
+def save_graph(path: str, contentids: np.ndarray, neighbors: np.ndarray, scores: np.ndarray) -> None:
+    """임시 파일에 쓴 뒤 교체하여, API가 쓰는 도중의 파일을 읽지 않도록 합니다."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + ".tmp.npz"
+    np.savez(tmp_path, contentids=contentids, neighbors=neighbors, scores=scores)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="여행지 유사도 kNN 그래프 생성")
+    parser.add_argument("--k", type=int, default=20, help="여행지당 저장할 이웃 수")
+    parser.add_argument("--dim", type=int, default=1024, help="특징 해싱 차원 수")
+    parser.add_argument("--block", type=int, default=512, help="한 번에 계산할 행 수")
+    parser.add_argument("--out", default=settings.SIMILAR_SPOTS_PATH, help="결과 파일 경로")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            select(
+                RecommendTourInfo.contentid, RecommendTourInfo.title, RecommendTourInfo.contenttypeid,
+                RecommendTourInfo.areacode, RecommendTourInfo.sigungucode,
+                RecommendTourInfo.cat1, RecommendTourInfo.cat2, RecommendTourInfo.cat3,
+            ).order_by(RecommendTourInfo.contentid)
+        ).all()
+    finally:
+        db.close()
+
+    if not rows:
+        print("❌ 여행지 데이터가 없습니다. sync_recommends.py를 먼저 실행하세요.")
+        return
+
+    print(f"여행지 {len(rows)}건의 특징 벡터를 생성합니다. (dim={args.dim})")
+    features = build_features(rows, args.dim)
+
+    print(f"상위 {args.k}개 이웃을 계산합니다. (block={args.block})")
+    neighbors, scores = top_k_neighbors(features, args.k, args.block)
+
+    contentids = np.array([str(r[0]) for r in rows])
+    save_graph(args.out, contentids, neighbors, scores)
+
+    elapsed = time.perf_counter() - started
+    size_kb = os.path.getsize(args.out) / 1024
+    print(f"✅ 유사 여행지 그래프 저장 완료: {args.out} ({size_kb:.1f} KB, {elapsed:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
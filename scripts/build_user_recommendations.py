@@ -0,0 +1,107 @@
+"""
+사용자별 개인화 추천 배치
+
+- 최근 PERSONAL_ACTIVE_DAYS일 안에 찜을 변경한 사용자의 취향 벡터(user_taste_vectors)로
+  전체 여행지 점수를 계산하고, 이미 찜한 곳을 제외한 상위 N개를 user_recommendations에 저장합니다.
+- API의 /recommend/for-me는 이 결과를 그대로 읽습니다.
+- 취향 벡터 도입 이전의 찜 데이터가 있다면 --rebuild-taste로 찜 목록 전체에서 취향 벡터를 다시 만듭니다.
+
+사용법: python scripts/build_user_recommendations.py [--days 30] [--top-n 50] [--rebuild-taste]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime, timedelta
+from dotenv import load_dotenv
+
+from sqlalchemy import select
+
+# ====================================================================
+# .env 경로 강제 지정 및 로드
+# ====================================================================
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+try:
+    os.chdir(project_root)
+except FileNotFoundError:
+    pass
+load_dotenv()
+# ====================================================================
+
+from app.core.config import get_settings
+from app.db.database import SessionLocal
+from app.models.favorite_models import UserFavorite
+from app.models.personalize_models import UserTasteVector
+from app.services.catalog_snapshot import catalog_snapshot
+from app.services.personalize_service import (
+    TasteScorer, rebuild_taste_vector, save_user_recommendations
+)
+
+settings = get_settings()
+
+COMMIT_EVERY = 200
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사용자별 개인화 추천 배치")
+    parser.add_argument("--days", type=int, default=settings.PERSONAL_ACTIVE_DAYS, help="최근 N일 안에 찜을 변경한 사용자만 계산 (0: 전체)")
+    parser.add_argument("--top-n", type=int, default=settings.PERSONAL_RECOMMEND_TOP_N, help="사용자별 저장할 추천 수")
+    parser.add_argument("--rebuild-taste", action="store_true", help="찜 목록 전체에서 취향 벡터를 다시 계산")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        snapshot = catalog_snapshot.get(db)
+
+        if args.rebuild_taste:
+            user_ids = db.execute(select(UserFavorite.user_id).distinct()).scalars().all()
+            for i, user_id in enumerate(user_ids, 1):
+                rebuild_taste_vector(db, snapshot, user_id)
+                if i % COMMIT_EVERY == 0:
+                    db.commit()
+            db.commit()
+            print(f"취향 벡터 재계산 완료: {len(user_ids)}명")
+
+        query = select(UserTasteVector).where(UserTasteVector.favorite_count > 0)
+        if args.days > 0:
+            query = query.where(UserTasteVector.updated_at >= datetime.now() - timedelta(days=args.days))
+        tastes = db.execute(query).scalars().all()
+        if not tastes:
+            print("계산할 사용자가 없습니다.")
+            return
+
+        scorer = TasteScorer(snapshot)
+        print(f"사용자 {len(tastes)}명 × 여행지 {scorer.rows.size}건 점수 계산을 시작합니다.")
+
+        # 이미 찜한 여행지는 추천에서 제외
+        favorites = {}
+        for user_id, item_id in db.execute(
+            select(UserFavorite.user_id, UserFavorite.item_id)
+            .where(UserFavorite.item_type == "SPOT", UserFavorite.user_id.in_([t.user_id for t in tastes]))
+        ):
+            favorites.setdefault(user_id, set()).add(str(item_id))
+
+        for i, taste in enumerate(tastes, 1):
+            items = scorer.top_n(
+                json.loads(taste.weights or "{}"),
+                taste.favorite_count,
+                exclude=favorites.get(taste.user_id, set()),
+                n=args.top_n,
+            )
+            save_user_recommendations(db, taste.user_id, items)
+            if i % COMMIT_EVERY == 0:
+                db.commit()
+                print(f"  진행: {i}/{len(tastes)}")
+        db.commit()
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"✅ 개인화 추천 저장 완료: {len(tastes)}명 ({elapsed:.1f}초, {len(tastes) / max(elapsed, 1e-9):.0f}명/초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import os
+import sys
+import asyncio
+import argparse
+from dotenv import load_dotenv
+
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import OperationalError
+
+# ====================================================================
+# .env 경로 강제 지정 및 로드
+# ====================================================================
+# 1. PYTHONPATH에 현재 BE 폴더를 추가하여 app.* 모듈을 인식하도록 함
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+# 2. .env 파일 로드를 위해 현재 위치를 프로젝트 루트로 강제 이동 및 로드
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+try:
+    # 현재 디렉토리를 프로젝트 루트 (BE)로 변경하여 .env 파일을 찾도록 함
+    os.chdir(project_root)
+except FileNotFoundError:
+    pass
+# 3. .env 로드
+load_dotenv()
+# ====================================================================
+
+
+from app.db.database import SessionLocal, test_db_connection
+from app.clients.tour_api_client import TourAPIClient
+from app.clients.resilience import TourAPIError, TourAPIQuotaExceededError
+from app.clients.response_cache import ResponseCache, CACHE_MODES
+from app.services.sync_pipeline import SyncPipeline, wait_out_circuit
+from app.services.overview_service import (
+    OverviewState, stale_overview_targets, overview_row, save_overviews
+)
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# 파이프라인 한 '페이지'에 담을 여행지 수. 페이지 안에서는 순서대로 요청하고, 페이지끼리 동시에 수집합니다.
+CHUNK_SIZE = 20
+# 더 요청해도 실패할 오류 (나머지 여행지는 다음 실행으로 넘김)
+# 회로 열림은 잠시 뒤 풀리므로 중단하지 않고 여행지마다 기다렸다가 다시 요청함
+ABORT_ON = (TourAPIQuotaExceededError,)
+
+
+async def run_enrichment(
+    limit: int = None,
+    max_age_days: int = settings.ENRICH_OVERVIEW_MAX_AGE_DAYS,
+    concurrency: int = settings.SYNC_FETCH_CONCURRENCY,
+    cache_mode: str = settings.TOUR_API_CACHE_MODE,
+    client: TourAPIClient = None,
+):
+    """
+    개요가 없거나 오래된 여행지의 detailCommon2를 받아 recommend_tour_overview에 저장합니다.
+    - 대상: 개요가 없는 여행지 → 개요를 받은 뒤 수정된 여행지 → max_age_days보다 오래된 개요
+    - 여행지 하나당 API 1회이므로, 호출 한도(토큰 버킷) 안에서 동시 concurrency개로 요청합니다.
+    - 받은 개요는 배치 단위 bulk upsert로 저장하고, 본문이 그대로면 확인 시각만 갱신합니다.
+    실패한 여행지는 저장되지 않으므로 다음 실행에서 다시 대상이 됩니다.
+    """
+    if client is None:
+        client = TourAPIClient(cache=ResponseCache(settings.TOUR_API_CACHE_DIR, cache_mode, settings.TOUR_API_CACHE_TTL))
+    db: Session = SessionLocal()
+
+    print("=" * 50)
+    print("TourAPI 여행지 개요(detailCommon2) 보강 시작")
+    print("=" * 50)
+
+    try:
+        targets = stale_overview_targets(db, max_age_days=max_age_days, limit=limit)
+        state = OverviewState(db)
+    except Exception as e:
+        print(f"DB 조회 오류: 테이블이 생성되지 않았거나 권한 문제입니다. 상세: {e}")
+        db.close()
+        return
+    if not targets:
+        print("✅ 보강할 여행지가 없습니다.")
+        db.close()
+        return
+    print(f"대상 여행지 {len(targets)}곳 (기준: 개요 없음 / 여행지 수정 / {max_age_days}일 경과)")
+
+    failed_ids = []
+
+    async def fetch_page(page_no: int):
+        chunk = targets[(page_no - 1) * CHUNK_SIZE: page_no * CHUNK_SIZE]
+        results = []
+        for contentid, modifiedtime in chunk:
+            if pipeline.aborted:
+                # 다른 페이지에서 수집이 중단됨: 이미 받은 개요만 저장하고 나머지는 다음 실행으로 넘김
+                break
+            try:
+                items, _ = await wait_out_circuit(lambda: client.get_detail_common(contentid), lambda: pipeline.aborted)
+            except ABORT_ON as e:
+                # 페이지 전체를 실패로 버리지 않고, 받은 개요는 반환해 저장한 뒤 수집을 중단
+                print(f"⚠️ {contentid} 상세 조회 실패: {e}")
+                pipeline.abort()
+                break
+            except TourAPIError as e:
+                print(f"⚠️ {contentid} 상세 조회 실패: {e}")
+                failed_ids.append(contentid)
+                continue
+            # 항목이 없으면(삭제된 콘텐츠 등) 빈 개요로 기록해, 여행지가 다시 수정될 때까지 요청하지 않음
+            results.append({"contentid": contentid, "modifiedtime": modifiedtime, "detail": items[0] if items else {}})
+        # 모두 실패해 비어 있는 페이지도 목록의 끝은 아님 (empty_page_ends=False)
+        return results, len(targets)
+
+    def write_pages(pages) -> int:
+        """저장 단계 (스레드에서 한 번에 하나씩 실행). 여러 페이지의 개요를 한 트랜잭션으로 저장합니다."""
+        rows = [
+            overview_row(result["contentid"], result["detail"], result["modifiedtime"])
+            for _, results in pages for result in results
+        ]
+        try:
+            counts = save_overviews(db, state, rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        first_page, last_page = pages[0][0], pages[-1][0]
+        print(f"Page {first_page}~{last_page} 처리 완료 | 저장: {counts['changed']}건, 변경 없음: {counts['unchanged']}건")
+        return counts["changed"]
+
+    pipeline = SyncPipeline(
+        fetch_page,
+        write_pages,
+        per_page=CHUNK_SIZE,
+        # 0이면 첫 페이지 응답 시간과 초당 호출 한도로 동시 수집 수를 정함
+        concurrency=concurrency or client.recommended_concurrency,
+        queue_size=settings.SYNC_QUEUE_SIZE,
+        batch_pages=settings.SYNC_WRITE_BATCH_PAGES,
+        abort_on=ABORT_ON,
+        # 페이지 수는 대상 목록으로 정해지므로, 모두 실패한 빈 페이지가 있어도 뒤 페이지를 계속 받음
+        empty_page_ends=False,
+    )
+    try:
+        async with client:
+            result = await pipeline.run()
+    except OperationalError as e:
+        print(f"DB 연결 오류 (재시도 필요): RDS 인스턴스가 실행 중인지, IP가 열려있는지 확인하세요. 상세: {e}")
+        db.close()
+        return
+    except Exception as e:
+        print(f"API 호출 또는 저장 중 알 수 없는 오류: {e}")
+        db.close()
+        return
+
+    # 중단됐거나 페이지째 실패해 요청하지 못한 여행지
+    not_requested = len(targets) - result.fetch.items - len(failed_ids)
+    if failed_ids or not_requested:
+        print(
+            f"⚠️ 실패한 여행지 {len(failed_ids)}곳, 요청하지 못한 여행지 {not_requested}곳, "
+            f"실패한 페이지 {len(result.failed_pages)}개 (다음 실행에서 다시 시도)"
+        )
+
+    db.close()
+    print(f"보강 종료: {state.summary()}")
+    print(f"처리량: {result.summary()}")
+    print(f"TourAPI: {client.metrics.summary()}")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="여행지 개요(detailCommon2 overview) 보강")
+    parser.add_argument("--limit", type=int, default=None, help="이번 실행에서 처리할 최대 여행지 수 (일일 호출 한도 배분용)")
+    parser.add_argument("--max-age-days", type=int, default=settings.ENRICH_OVERVIEW_MAX_AGE_DAYS, help="이보다 오래된 개요는 다시 받기 (0: 여행지가 수정됐을 때만)")
+    parser.add_argument("--concurrency", type=int, default=settings.SYNC_FETCH_CONCURRENCY, help="동시에 요청할 수 (0: 호출 한도에 맞춰 자동)")
+    parser.add_argument("--cache", choices=CACHE_MODES, default=settings.TOUR_API_CACHE_MODE, help="TourAPI 응답 디스크 캐시 (record: 저장/재사용, replay: 저장된 응답만 사용)")
+    args = parser.parse_args()
+
+    if test_db_connection():
+        try:
+            asyncio.run(run_enrichment(
+                limit=args.limit, max_age_days=args.max_age_days, concurrency=args.concurrency, cache_mode=args.cache
+            ))
+        except Exception as e:
+            print(f"스크립트 실행 중 치명적 오류: {e}")
@@ -0,0 +1,72 @@
+"""
+카탈로그 전체 스냅샷 내보내기
+
+- 여행지/축제 전체를 gzip NDJSON 파일(CATALOG_SNAPSHOT_DIR/catalog-<version>.ndjson.gz)로 저장합니다.
+- 앱은 GET /catalog/snapshot으로 이 파일을 한 번 받은 뒤, 이후에는 /catalog/changes?since=<version>으로 변경분만 받습니다.
+- 동기화 스크립트 실행 후 주기적으로 실행하고, 오래된 파일은 --keep 개수만 남깁니다.
+- 보관 기간(--retention-days)이 지난 변경 로그(catalog_changes)도 함께 정리합니다.
+  남아 있는 가장 오래된 스냅샷 이후의 변경은 지우지 않으므로, 어떤 스냅샷에서든 이어받을 수 있습니다.
+
+사용법: python scripts/export_catalog_snapshot.py [--keep 3] [--retention-days 14]
+"""
+import os
+import sys
+import time
+import argparse
+from dotenv import load_dotenv
+
+# ====================================================================
+# .env 경로 강제 지정 및 로드
+# ====================================================================
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+try:
+    os.chdir(project_root)
+except FileNotFoundError:
+    pass
+load_dotenv()
+# ====================================================================
+
+from app.core.config import get_settings
+from app.db.database import SessionLocal
+from app.services.catalog_change_service import write_snapshot_file, list_snapshot_files, prune_catalog_changes
+
+settings = get_settings()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카탈로그 전체 스냅샷 내보내기")
+    parser.add_argument("--dir", default=settings.CATALOG_SNAPSHOT_DIR, help="저장 디렉터리")
+    parser.add_argument("--keep", type=int, default=3, help="남겨둘 스냅샷 파일 수 (1 이상)")
+    parser.add_argument("--retention-days", type=int, default=settings.CATALOG_CHANGE_RETENTION_DAYS, help="변경 로그 보관 기간 (일, 0이면 정리하지 않음)")
+    args = parser.parse_args()
+    if args.keep < 1:
+        parser.error("--keep은 1 이상이어야 합니다 (방금 만든 스냅샷은 남겨야 함).")
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        try:
+            path, version = write_snapshot_file(db, args.dir)
+        except ValueError as e:
+            print(f"⚠️ {e}")
+            return
+        elapsed = time.perf_counter() - started
+        print(f"✅ 카탈로그 스냅샷 저장 완료: {path} (version={version}, {os.path.getsize(path) / 1024:.1f} KB, {elapsed:.1f}초)")
+
+        files = list_snapshot_files(args.dir)
+        for _, old_path in files[:-args.keep]:
+            os.remove(old_path)
+            print(f"오래된 스냅샷 삭제: {old_path}")
+
+        if args.retention_days > 0:
+            # 남은 스냅샷 중 가장 오래된 것의 버전 이후 변경은 남김
+            oldest_kept = files[-args.keep:][0][0]
+            pruned = prune_catalog_changes(db, args.retention_days, keep_after_version=oldest_kept)
+            print(f"변경 로그 정리: {pruned}건 삭제 ({args.retention_days}일 경과, version {oldest_kept} 이하)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
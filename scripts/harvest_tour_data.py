@@ -0,0 +1,223 @@
+import os
+import sys
+import asyncio
+import argparse
+from dotenv import load_dotenv
+
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import OperationalError
+
+# ====================================================================
+# .env 경로 강제 지정 및 로드
+# ====================================================================
+# 1. PYTHONPATH에 현재 BE 폴더를 추가하여 app.* 모듈을 인식하도록 함
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+# 2. .env 파일 로드를 위해 현재 위치를 프로젝트 루트로 강제 이동 및 로드
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+try:
+    # 현재 디렉토리를 프로젝트 루트 (BE)로 변경하여 .env 파일을 찾도록 함
+    os.chdir(project_root)
+except FileNotFoundError:
+    pass
+# 3. .env 로드
+load_dotenv()
+# ====================================================================
+
+
+from app.db.database import SessionLocal, test_db_connection
+from app.models.recommend_models import RecommendTourInfo
+from app.clients.tour_api_client import TourAPIClient
+from app.clients.resilience import TourAPIQuotaExceededError
+from app.clients.response_cache import ResponseCache, CACHE_MODES
+from app.services.sync_diff import SyncState
+from app.services.sync_harvester import Shard, ShardHarvester
+from app.services.spot_sync_service import save_spot_items
+from app.services.harvest_checkpoint_service import (
+    shard_key, load_harvest_checkpoints, reset_harvest_checkpoints, save_harvest_checkpoint
+)
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# TourAPI 한 페이지당 요청 건수
+PAGE_SIZE = 100
+
+# 지역 코드 (1 서울, 2 인천, 3 대전, 4 대구, 5 광주, 6 부산, 7 울산, 8 세종,
+#           31 경기, 32 강원, 33 충북, 34 충남, 35 경북, 36 경남, 37 전북, 38 전남, 39 제주)
+AREA_CODES = ["1", "2", "3", "4", "5", "6", "7", "8", "31", "32", "33", "34", "35", "36", "37", "38", "39"]
+
+# 수집할 콘텐츠 타입 ID 목록 (관광공사 기준)
+# 12: 관광지, 14: 문화시설, 15: 축제/공연/행사, 28: 레포츠, 32: 숙박, 38: 쇼핑, 39: 음식점
+CONTENT_TYPE_IDS = ["12", "14", "28", "38", "39"] # 주요 여행지, 문화, 레포츠, 쇼핑, 음식점
+
+
+async def run_harvest(
+    area_codes=AREA_CODES,
+    content_type_ids=CONTENT_TYPE_IDS,
+    restart: bool = False,
+    concurrency: int = settings.SYNC_FETCH_CONCURRENCY,
+    cache_mode: str = settings.TOUR_API_CACHE_MODE,
+    client: TourAPIClient = None,
+):
+    """
+    (지역 코드 × 콘텐츠 타입) 샤드로 나눠 여행지 목록을 동시에 수집하고 recommend_tour_info에 저장합니다.
+    모든 샤드가 하나의 TourAPIClient(같은 토큰 버킷)를 공유하므로 전체 호출 속도는 TOUR_API_RATE_PER_SEC를 넘지 않습니다.
+    샤드별 진행 상황은 harvest_checkpoints에 저장되어, 중단된 뒤 다시 실행하면 끝난 샤드는 건너뛰고
+    나머지는 저장된 페이지 다음부터 이어서 받습니다. restart=True이면 처음부터 다시 수집합니다.
+    """
+    if client is None:
+        client = TourAPIClient(cache=ResponseCache(settings.TOUR_API_CACHE_DIR, cache_mode, settings.TOUR_API_CACHE_TTL))
+    db: Session = SessionLocal()
+
+    print("=" * 50)
+    print("TourAPI 여행지 샤드 수집 시작")
+    print(f"지역 {len(area_codes)}개 × 콘텐츠 타입 {len(content_type_ids)}개")
+    print("=" * 50)
+
+    try:
+        sync_state = SyncState(db, RecommendTourInfo)
+        keys = [shard_key(a, t) for a in area_codes for t in content_type_ids]
+        if restart:
+            print(f"체크포인트 {reset_harvest_checkpoints(db, keys)}개를 지우고 처음부터 수집합니다.")
+        checkpoints = load_harvest_checkpoints(db)
+    except Exception as e:
+        print(f"DB 조회 오류: 테이블이 생성되지 않았거나 권한 문제입니다. 상세: {e}")
+        db.close()
+        return
+
+    shards = []
+    finished = 0
+    for area_code in area_codes:
+        for content_type_id in content_type_ids:
+            key = shard_key(area_code, content_type_id)
+            checkpoint = checkpoints.get(key)
+            if checkpoint is not None and checkpoint.done:
+                finished += 1
+                continue
+            shards.append(Shard(
+                key=key,
+                area_code=area_code,
+                content_type_id=content_type_id,
+                next_page=checkpoint.next_page if checkpoint else 1,
+            ))
+    resumed = [s.key for s in shards if s.next_page > 1]
+    print(f"수집할 샤드 {len(shards)}개 (이미 끝난 샤드 {finished}개 건너뜀, 이어받기 {len(resumed)}개)")
+
+    async def fetch_page(shard: Shard, page_no: int):
+        # 생성일순(D)은 수집 중에 새 항목이 생기면 뒤 페이지로 밀릴 뿐(중복은 SyncState가 거름)이지만,
+        # 항목이 삭제되면 뒤쪽 항목이 이미 받은 페이지로 당겨져 빠질 수 있습니다 → 끝난 뒤 recount_shards로 확인.
+        # 수정일순(C)은 수정된 항목이 앞 페이지로 옮겨 가 이미 지난 페이지에서 누락될 수 있어 쓰지 않습니다.
+        return await client.get_recommends(
+            area_code=shard.area_code,
+            content_type_id=shard.content_type_id,
+            page_no=page_no,
+            num_of_rows=PAGE_SIZE,
+            arrange='D',
+        )
+
+    def write_pages(pages, shard_checkpoints) -> int:
+        """저장 단계 (스레드에서 한 번에 하나씩 실행). 여러 샤드의 페이지와 체크포인트를 한 트랜잭션으로 저장합니다."""
+        try:
+            counts = save_spot_items(db, sync_state, [item for _, _, items in pages for item in items])
+            for shard, next_page, done in shard_checkpoints:
+                save_harvest_checkpoint(
+                    db, shard.key, shard.area_code, shard.content_type_id, next_page, shard.total_count, done
+                )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return counts["saved"]
+
+    harvester = ShardHarvester(
+        shards,
+        fetch_page,
+        write_pages,
+        per_page=PAGE_SIZE,
+        # 0이면 첫 응답 시간과 초당 호출 한도로 동시 수집 수를 정함
+        concurrency=concurrency or client.recommended_concurrency,
+        queue_size=settings.SYNC_QUEUE_SIZE,
+        batch_pages=settings.SYNC_WRITE_BATCH_PAGES,
+        abort_on=(TourAPIQuotaExceededError,),
+    )
+    try:
+        async with client:
+            result = await harvester.run()
+            # 녹화/재생 캐시를 쓰면 totalCount도 저장된 값이라 다시 세도 의미가 없고, 중단된 수집(호출 한도 초과 등)은 확인하지 않음
+            changed = [] if client.cache.enabled or harvester.aborted else await recount_shards(client, [s for s in shards if s.done])
+        if changed:
+            # 수집 중에 목록이 바뀐 샤드는 체크포인트를 지워 다음 실행에서 처음부터 다시 받음
+            reset_harvest_checkpoints(db, [s.key for s in changed])
+            for shard in changed:
+                shard.done = False
+                result.completed_shards -= 1
+            print(f"⚠️ 수집 중 항목 수가 바뀐 샤드 {len(changed)}개는 다음 실행에서 다시 수집합니다: {[s.key for s in changed]}")
+    except OperationalError as e:
+        print(f"DB 연결 오류 (재시도 필요): RDS 인스턴스가 실행 중인지, IP가 열려있는지 확인하세요. 상세: {e}")
+        db.close()
+        return
+    except Exception as e:
+        print(f"수집 중 알 수 없는 오류: {e}")
+        db.close()
+        return
+
+    if result.failed_pages:
+        print(f"⚠️ 수집 실패 페이지 {len(result.failed_pages)}개 (다시 실행하면 이어서 받습니다): {result.failed_pages[:20]}")
+    if result.completed:
+        print("✅ 모든 샤드 수집 완료")
+
+    db.close()
+    print(f"수집 종료: {sync_state.summary()}")
+    print(f"처리량: {result.summary()}")
+    print(f"TourAPI: {client.metrics.summary()}")
+    return result
+
+
+async def recount_shards(client: TourAPIClient, shards):
+    """
+    끝난 샤드의 totalCount를 다시 받아, 수집을 시작할 때와 달라진 샤드를 반환합니다.
+    생성일순 목록은 수집 중 삭제가 있으면 항목이 빠질 수 있으므로, 개수가 바뀐 샤드는 완료로 보지 않습니다.
+    확인 요청이 실패한 샤드는 그대로 완료로 둡니다.
+    """
+    async def recount(shard: Shard):
+        _, total_count = await client.get_recommends(
+            area_code=shard.area_code, content_type_id=shard.content_type_id, page_no=1, num_of_rows=1, arrange='D'
+        )
+        return total_count
+
+    counts = await asyncio.gather(*[recount(shard) for shard in shards], return_exceptions=True)
+    changed = []
+    for shard, total_count in zip(shards, counts):
+        if isinstance(total_count, Exception):
+            print(f"⚠️ 샤드 {shard.key} 항목 수 확인 실패: {total_count}")
+        elif total_count != shard.total_count:
+            print(f"⚠️ 샤드 {shard.key} 항목 수 변경: {shard.total_count} → {total_count}")
+            changed.append(shard)
+    return changed
+
+
+def split_codes(value: str):
+    return [code.strip() for code in value.split(",") if code.strip()]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TourAPI 여행지 샤드(지역 × 콘텐츠 타입) 동시 수집 (중단 시 이어받기)")
+    parser.add_argument("--areas", default=",".join(AREA_CODES), help="쉼표로 구분한 지역 코드 (기본: 전체)")
+    parser.add_argument("--content-types", default=",".join(CONTENT_TYPE_IDS), help="쉼표로 구분한 콘텐츠 타입 ID")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 지우고 처음부터 수집")
+    parser.add_argument("--concurrency", type=int, default=settings.SYNC_FETCH_CONCURRENCY, help="동시에 요청할 페이지 수 (0: 호출 한도에 맞춰 자동)")
+    parser.add_argument("--cache", choices=CACHE_MODES, default=settings.TOUR_API_CACHE_MODE, help="TourAPI 응답 디스크 캐시 (record: 저장/재사용, replay: 저장된 응답만 사용)")
+    args = parser.parse_args()
+
+    if test_db_connection():
+        try:
+            asyncio.run(run_harvest(
+                area_codes=split_codes(args.areas),
+                content_type_ids=split_codes(args.content_types),
+                restart=args.restart,
+                concurrency=args.concurrency,
+                cache_mode=args.cache,
+            ))
+        except Exception as e:
+            print(f"스크립트 실행 중 치명적 오류: {e}")
@@ -0,0 +1,45 @@
+import os
+import sys
+import argparse
+
+import uvicorn
+
+# ====================================================================
+# 프로젝트 루트를 경로에 추가 (app.* 모듈 인식)
+# ====================================================================
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+try:
+    os.chdir(project_root)
+except FileNotFoundError:
+    pass
+# ====================================================================
+
+from app.clients.fake_tour_api import FakeTourAPIConfig, create_fake_tour_api
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="로컬 가짜 TourAPI 서버. 실행 후 TOUR_API_SERVICE_URL=http://HOST:PORT 로 동기화 스크립트를 가리키면 됩니다."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--spots", type=int, default=50_000, help="합성 여행지 수")
+    parser.add_argument("--festivals", type=int, default=3_000, help="합성 축제 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="지연 편차 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 503 비율 (0~1)")
+    parser.add_argument("--quota", type=int, default=0, help="이 횟수 이후 호출 한도 초과 응답 (0: 무제한)")
+    args = parser.parse_args()
+
+    config = FakeTourAPIConfig(
+        spots=args.spots, festivals=args.festivals, seed=args.seed,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, quota=args.quota,
+    )
+    uvicorn.run(create_fake_tour_api(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
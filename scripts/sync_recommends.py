@@ -1,12 +1,12 @@
 import os
 import sys
 import asyncio
+import argparse
 from dotenv import load_dotenv
 from datetime import datetime, date
 
 import httpx
 from sqlalchemy.orm import Session
-from sqlalchemy import select, update
 from sqlalchemy.exc import OperationalError
 
 # ====================================================================
@@ -28,8 +28,27 @@ load_dotenv()
 
 
 from app.db.database import SessionLocal, engine, test_db_connection 
+from app.services.sync_diff import SyncState, INSERTED, UPDATED, UNCHANGED
+from app.services.spot_sync_service import save_spot_items
+from app.services.sync_pipeline import SyncPipeline
 from app.models.recommend_models import RecommendTourInfo
 from app.clients.tour_api_client import TourAPIClient
+from app.clients.resilience import TourAPIQuotaExceededError
+from app.clients.response_cache import ResponseCache, CACHE_MODES
+from app.services.catalog_version_service import ENTITY_SPOT
+from app.services.sync_watermark_service import (
+    get_sync_watermark, save_sync_watermark, watermark_cutoff, latest_modified_time, split_at_cutoff
+)
+from app.services.sync_run_service import (
+    CommittedPages, start_sync_run, find_resumable_run, run_params, record_sync_progress, finish_sync_run,
+    MODE_FULL, MODE_INCREMENTAL,
+)
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# TourAPI 한 페이지당 요청 건수
+PAGE_SIZE = 100
 
 
 # --- 1. 데이터베이스 모델 설정 (테이블 확인용) ---
@@ -39,12 +58,19 @@ def create_db_tables():
 
 
 # --- 2. TourAPI 데이터 동기화 함수 ---
-async def run_db_sync():
+async def run_db_sync(incremental: bool = False, resume: bool = False, concurrency: int = settings.SYNC_FETCH_CONCURRENCY, cache_mode: str = settings.TOUR_API_CACHE_MODE, client: TourAPIClient = None):
     """
     TourAPI에서 모든 축제 데이터를 가져와 RDS에 저장(Upsert)합니다.
+    incremental=True이면 마지막 성공 시점 이후에 수정된 여행지만 받습니다.
+    resume=True이면 끝나지 못한 마지막 실행(sync_runs)을 같은 조건으로 마지막 커밋 페이지 다음부터 이어 받습니다.
+    페이지 수집(동시 concurrency개)과 DB 저장은 SyncPipeline에서 겹쳐서 실행됩니다.
+    끝까지 실행되면 PipelineResult를 반환합니다 (scripts/benchmark_sync.py에서 사용).
     """
     # NOTE: TourAPIClient의 get_festivals 함수는 이제 end_date 인자를 받도록 수정되어야 합니다.
-    client = TourAPIClient()
+    # cache_mode: record(응답을 디스크에 저장·재사용) / replay(저장된 응답만으로 네트워크 없이 재현)
+    # client를 넘기면(벤치마크의 가짜 서버 등) 그대로 사용
+    if client is None:
+        client = TourAPIClient(cache=ResponseCache(settings.TOUR_API_CACHE_DIR, cache_mode, settings.TOUR_API_CACHE_TTL))
     db: Session = SessionLocal()
     
     # 1년치 데이터 전체를 가져오기 위한 시작/종료일 설정
@@ -56,127 +82,148 @@ async def run_db_sync():
     #print(f"기간: {start_date_range} ~ {end_date_range}")
     print("="*50)
     
-    current_page = 1
-    total_count = 0
-    total_processed_count = 0
-    
-    # DB에 이미 존재하는 contentid를 한 번에 가져와 메모리에 저장 (N+1 문제 방지)
+    # DB에 이미 존재하는 항목의 상태를 한 번에 가져와 메모리에 저장 (N+1 문제 방지)
     try:
-        existing_content_ids = {str(id_) for id_ in db.execute(select(RecommendTourInfo.contentid)).scalars().all()}
+        # contentid → content_hash 맵. 들어온 항목과 비교해 바뀐 행만 저장합니다.
+        sync_state = SyncState(db, RecommendTourInfo)
+        watermark = get_sync_watermark(db, ENTITY_SPOT)
+        previous = find_resumable_run(db, ENTITY_SPOT) if resume else None
     except Exception as e:
         print(f"DB 조회 오류: 테이블이 생성되지 않았거나 권한 문제입니다. 상세: {e}")
         db.close()
         return
 
-    while True:
-        # DB 연결이 끊겼을 경우를 대비하여 세션 재활용
-        if not db.is_active:
-            db = SessionLocal()
-            
+    if previous is not None:
+        # 이어받기: 페이지 번호가 같은 항목을 가리키도록 이전 실행의 정렬/기준점을 그대로 사용
+        params = run_params(previous)
+        cutoff, arrange = params.get("cutoff"), params.get("arrange", 'D')
+        print(f"실행 #{previous.id}({previous.status})을 {previous.last_page + 1}페이지부터 이어받습니다.")
+    else:
+        if resume:
+            print("이어받을 실행이 없어 처음부터 동기화합니다.")
+        # 증분 모드: 수정일순(C)으로 받다가 기준점(여유 구간 포함)보다 오래된 항목을 만나면 멈춤
+        cutoff = watermark_cutoff(watermark, settings.SYNC_WATERMARK_OVERLAP_MINUTES) if incremental else None
+        if incremental and cutoff is None:
+            print("저장된 기준점이 없어 전체 동기화로 진행합니다.")
+        elif cutoff:
+            print(f"증분 동기화: 기준점 {watermark} (확인 시작 {cutoff})")
+        arrange = 'C' if incremental else 'D'
+
+    # 실행 원장에 기록 (run id, 시작 페이지, 조건)
+    try:
+        run = start_sync_run(
+            db, ENTITY_SPOT, MODE_INCREMENTAL if cutoff else MODE_FULL, {"arrange": arrange, "cutoff": cutoff}, previous
+        )
+    except Exception as e:
+        print(f"실행 원장 기록 오류: sync_runs 테이블이 있는지 확인하세요 (alembic upgrade head). 상세: {e}")
+        db.close()
+        return
+    run_id = run.id
+    print(f"실행 기록 #{run_id} ({run.mode}, {run.start_page}페이지부터)")
+    committed = CommittedPages(run.start_page)
+    newest_modified = run.newest_modified # 지금까지 본 가장 최근 modifiedtime → 성공 시 새 기준점
+
+    async def fetch_page(page_no: int):
+        # API 클라이언트를 통해 1페이지 분량의 여행지 데이터를 비동기로 가져옴
+        return await client.get_recommends(
+            area_code=None,
+            content_type_id=None,
+            page_no=page_no,
+            num_of_rows=PAGE_SIZE,
+            arrange=arrange,
+        )
+
+    def reached_watermark(page_no: int, raw_items) -> bool:
+        return split_at_cutoff(raw_items, cutoff)[1]
+
+    def write_pages(pages) -> int:
+        """저장 단계 (스레드에서 한 번에 하나씩 실행). 여러 페이지를 한 트랜잭션으로 저장합니다."""
+        nonlocal newest_modified
+        batch_items = []
+        for page_no, raw_items in pages:
+            newest_modified = latest_modified_time(raw_items, newest_modified)
+            raw_items, _ = split_at_cutoff(raw_items, cutoff)
+            batch_items.extend(raw_items)
+
+        # --- 3. 데이터 처리 및 저장 로직 (Upsert) ---
+        page_numbers = [page_no for page_no, _ in pages]
         try:
-            # API 클라이언트를 통해 1페이지 분량의 축제 데이터를 비동기로 가져옴
-            raw_items, api_total_count = await client.get_recommends(
-                #start_date=start_date_range,
-                #end_date=end_date_range,
-                area_code=None,
-                content_type_id=None,
-                page_no=current_page,
-                num_of_rows=100
-            )
-            if api_total_count == 0 and current_page == 1:
-                print("API 응답에 totalCount가 0입니다. 동기화를 종료합니다.")
-                break
-            
-            if current_page == 1:
-                total_count = api_total_count
-                print(f"총 {total_count}건의 데이터를 처리할 예정입니다.")
-
-            if not raw_items:
-                print(f"Page {current_page} - 더 이상 아이템이 없습니다. 동기화 완료.")
-                break
-            
-            new_items_count = 0
-            updated_items_count = 0
-            
-            # --- 3. 데이터 처리 및 저장 로직 (Upsert) ---
-            for item in raw_items:
-                content_id = item.get('contentid')
-                
-                # 데이터 유효성 검사 및 변환
-                try:
-                    data_to_save = {
-                        'contentid': str(content_id),
-                        'contenttypeid': item.get('contenttypeid'),
-                        'title': item.get('title'),
-                        'addr1': item.get('addr1'), 
-                        'addr2': item.get('addr2'),
-                        'zipcode': item.get('zipcode'),
-                        'areacode': item.get('areacode'),
-                        'sigungucode': item.get('sigungucode'),
-                        'cat1': item.get('cat1'),
-                        'cat2': item.get('cat2'),
-                        'cat3': item.get('cat3'),
-                        'tel': item.get('tel'),
-                        'firstimage': item.get('firstimage', None),
-                        'firstimage2': item.get('firstimage2', None),
-                        # DECIMAL 타입에 맞춰 float으로 변환
-                        'mapx': float(item.get('mapx')) if item.get('mapx') else None,
-                        'mapy': float(item.get('mapy')) if item.get('mapy') else None,
-                        'mlevel': item.get('mlevel'),
-                        'createdtime': item.get('createdtime'),
-                        'modifiedtime': item.get('modifiedtime'),
-                    }
-                except Exception as e:
-                    print(f"데이터 변환 오류: {e}, ContentID: {content_id}")
-                    continue
-
-
-                if content_id in existing_content_ids:
-                    # UPDATE 로직 (이미 존재하는 데이터)
-                    db.execute(
-                        update(RecommendTourInfo)
-                        .where(RecommendTourInfo.contentid == content_id)
-                        .values(data_to_save)
-                    )
-                    updated_items_count += 1
-                else:
-                    # INSERT 로직 (새로운 데이터)
-                    new_festival = RecommendTourInfo(**data_to_save)
-                    db.add(new_festival)
-                    existing_content_ids.add(content_id) 
-                    new_items_count += 1
-            
-            db.commit() # 페이지 단위로 커밋
-            total_processed_count += len(raw_items)
-            
-            print(f"Page {current_page} 처리 완료 | 삽입: {new_items_count}건, 업데이트: {updated_items_count}건")
-
-            # 전체 아이템 수를 다 가져왔다면 루프 종료
-            if total_processed_count >= total_count and total_count > 0:
-                print(f"모든 데이터 ({total_processed_count}건) 수집 및 저장 완료.")
-                break
-            
-            current_page += 1 # 다음 페이지로 이동
-
-        except OperationalError as e:
-            print(f"DB 연결 오류 (재시도 필요): RDS 인스턴스가 실행 중인지, IP가 열려있는지 확인하세요. 상세: {e}")
-            break
-        except Exception as e:
-            # API 호출 오류 (JSON 파싱, 500 오류 등) 처리
-            print(f"API 호출 또는 저장 중 알 수 없는 오류: {e}")
-            break
+            counts = save_spot_items(db, sync_state, batch_items)
+            # 빈틈없이 저장된 마지막 페이지를 데이터와 같은 트랜잭션에서 원장에 기록
+            record_sync_progress(db, run, committed.preview(page_numbers), sync_state.counts, counts["saved"], newest_modified)
+            db.commit() # 배치(여러 페이지) 단위로 커밋
+        except Exception:
+            db.rollback()
+            raise
+        committed.commit(page_numbers)
+
+        first_page, last_page = pages[0][0], pages[-1][0]
+        print(f"Page {first_page}~{last_page} 처리 완료 | 삽입: {counts[INSERTED]}건, 업데이트: {counts[UPDATED]}건, 변경 없음: {counts[UNCHANGED]}건")
+        return counts["saved"]
+
+    pipeline = SyncPipeline(
+        fetch_page,
+        write_pages,
+        per_page=PAGE_SIZE,
+        # 0이면 1페이지 응답 시간과 초당 호출 한도로 동시 수집 수를 정함
+        concurrency=concurrency or client.recommended_concurrency,
+        queue_size=settings.SYNC_QUEUE_SIZE,
+        batch_pages=settings.SYNC_WRITE_BATCH_PAGES,
+        should_stop=reached_watermark if cutoff else None,
+        abort_on=(TourAPIQuotaExceededError,),
+        start_page=run.start_page,
+    )
+    try:
+        # 동기화 동안 하나의 커넥션 풀을 공유하고, 끝나면 닫음
+        async with client:
+            result = await pipeline.run()
+    except OperationalError as e:
+        print(f"DB 연결 오류 (재시도 필요): RDS 인스턴스가 실행 중인지, IP가 열려있는지 확인하세요. 상세: {e}")
+        finish_sync_run(db, run, error=e)
+        db.close()
+        return
+    except Exception as e:
+        # 첫 페이지 API 호출 오류 (JSON 파싱, 500 오류 등) 처리
+        print(f"API 호출 또는 저장 중 알 수 없는 오류: {e}")
+        finish_sync_run(db, run, error=e)
+        db.close()
+        return
+
+    if result.stopped_at:
+        print(f"기준점에 도달했습니다. {result.stopped_at}페이지에서 증분 동기화 완료.")
+    if result.failed_pages:
+        print(f"⚠️ 수집 실패 페이지: {result.failed_pages}")
+    finish_sync_run(db, run, result)
+    if not result.completed:
+        print(f"⚠️ 실행 #{run_id}이 {committed.last}페이지까지 커밋된 채 끝났습니다. --resume으로 이어받을 수 있습니다.")
+
+    # 끝까지 성공한 경우에만 기준점을 옮겨, 실패한 구간은 다음 실행에서 다시 받도록 함
+    if result.completed and newest_modified:
+        save_sync_watermark(db, ENTITY_SPOT, newest_modified)
+        print(f"기준점 갱신: {newest_modified}")
 
     db.close()
+    print(f"동기화 종료: {sync_state.summary()}")
+    print(f"처리량: {result.summary()}")
+    print(f"TourAPI: {client.metrics.summary()}")
+    return result
 
 
 if __name__ == "__main__":
     # 데이터베이스가 시작 상태인지 확인하고, 비동기 함수 실행
     
+    parser = argparse.ArgumentParser(description="TourAPI 추천 관광 정보 동기화")
+    parser.add_argument("--incremental", action="store_true", help="마지막 동기화 이후 수정된 항목만 가져오기")
+    parser.add_argument("--resume", action="store_true", help="끝나지 못한 마지막 실행을 마지막 커밋 페이지 다음부터 이어받기")
+    parser.add_argument("--concurrency", type=int, default=settings.SYNC_FETCH_CONCURRENCY, help="동시에 요청할 페이지 수 (0: 호출 한도에 맞춰 자동)")
+    parser.add_argument("--cache", choices=CACHE_MODES, default=settings.TOUR_API_CACHE_MODE, help="TourAPI 응답 디스크 캐시 (record: 저장/재사용, replay: 저장된 응답만 사용)")
+    args = parser.parse_args()
+
     # 1. DB 연결 테스트
     if test_db_connection():
         # 2. 비동기 함수 실행
         try:
-            asyncio.run(run_db_sync())
+            asyncio.run(run_db_sync(incremental=args.incremental, resume=args.resume, concurrency=args.concurrency, cache_mode=args.cache))
         except Exception as e:
             print(f"스크립트 실행 중 치명적 오류: {e}")
     else:
@@ -0,0 +1,85 @@
+import os
+import sys
+import argparse
+import statistics
+from dotenv import load_dotenv
+
+# ====================================================================
+# .env 경로 강제 지정 및 로드
+# ====================================================================
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+try:
+    os.chdir(project_root)
+except FileNotFoundError:
+    pass
+load_dotenv()
+# ====================================================================
+
+from app.db.database import SessionLocal, test_db_connection
+from app.services.catalog_version_service import ENTITY_SPOT, ENTITY_FESTIVAL
+from app.services.sync_run_service import recent_sync_runs, find_resumable_run, RUN_COMPLETED
+
+
+def throughput(run) -> float:
+    """수집한 항목 수 / 실행 시간 (건/초)"""
+    return run.fetched_items / run.elapsed if run.elapsed else 0.0
+
+
+def print_runs(runs) -> None:
+    print(f"{'#':>5} {'엔티티':<9}{'모드':<12}{'상태':<10}{'시작 시각':<20}{'페이지':>13}{'수집':>8}{'저장':>8}"
+          f"{'삽입/변경/동일':>18}{'초':>8}{'건/초':>8}  비고")
+    for run in runs:
+        pages = f"{run.start_page}~{run.last_page}/{run.planned_pages or '?'}"
+        counts = f"{run.inserted}/{run.updated}/{run.unchanged}"
+        elapsed = f"{run.elapsed:.1f}" if run.elapsed is not None else "-"
+        note = []
+        if run.resumed_from:
+            note.append(f"#{run.resumed_from} 이어받음")
+        if run.failed_pages:
+            note.append(f"실패 {run.failed_pages}페이지")
+        if run.error and not run.failed_pages:
+            note.append(run.error[:60])
+        print(f"{run.id:>5} {run.entity:<9}{run.mode:<12}{run.status:<10}{run.started_at:%Y-%m-%d %H:%M:%S} {pages:>13}"
+              f"{run.fetched_items:>8}{run.saved_rows:>8}{counts:>18}{elapsed:>8}{throughput(run):>8.0f}  {', '.join(note)}")
+
+
+def print_summary(db, runs, entities) -> None:
+    print("-" * 110)
+    for entity in entities:
+        mine = [run for run in runs if run.entity == entity]
+        completed = [run for run in mine if run.status == RUN_COMPLETED and run.elapsed]
+        if not mine:
+            print(f"{entity}: 기록 없음")
+            continue
+        line = f"{entity}: 실행 {len(mine)}회 (완료 {len(completed)}회)"
+        if completed:
+            rates = [throughput(run) for run in completed]
+            line += (
+                f" | 처리량 중앙값 {statistics.median(rates):.0f}건/초, 최고 {max(rates):.0f}건/초"
+                f" | 평균 소요 {statistics.mean(run.elapsed for run in completed):.1f}초"
+                f" | 마지막 완료 {completed[0].finished_at:%Y-%m-%d %H:%M}"
+            )
+        resumable = find_resumable_run(db, entity)
+        if resumable is not None:
+            line += f" | ⚠️ #{resumable.id} 미완료 ({resumable.last_page}페이지까지 커밋, --resume 가능)"
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TourAPI 동기화 실행 원장(sync_runs) 조회 및 처리량 보고")
+    parser.add_argument("--entity", choices=[ENTITY_SPOT, ENTITY_FESTIVAL], default=None, help="엔티티 (기본: 전체)")
+    parser.add_argument("--limit", type=int, default=20, help="표시할 최근 실행 수")
+    args = parser.parse_args()
+
+    if test_db_connection():
+        db = SessionLocal()
+        try:
+            runs = recent_sync_runs(db, args.entity, args.limit)
+            if not runs:
+                print("기록된 동기화 실행이 없습니다.")
+            else:
+                print_runs(runs)
+                print_summary(db, runs, [args.entity] if args.entity else [ENTITY_SPOT, ENTITY_FESTIVAL])
+        finally:
+            db.close()